@@ -0,0 +1,231 @@
+"""Mediciones reproducibles de generación, pruebas y caminos de la interfaz.
+
+Uso:
+    python benchmarks/bench.py                                  # mide e imprime
+    python benchmarks/bench.py --guardar benchmarks/base.json   # regenera la línea base
+    python benchmarks/bench.py --base benchmarks/base.json      # compara y marca regresiones
+
+Por caso registra segundos (mejor de varias repeticiones), números por segundo,
+memoria pico (tracemalloc, que también ve los arreglos de NumPy) y `bloques_vivos`:
+los bloques asignados durante la llamada que siguen vivos al terminar, no el total
+de asignaciones (CPython no expone un contador acumulado). Sale con código 1 si
+hay regresiones.
+
+benchmarks/base.json es la línea base del repositorio (con n hasta 10^6; la máquina
+en la que se midió está en su campo 'maquina'). Las comparaciones de tiempo solo
+tienen sentido en la misma máquina: en otra, primero hay que regenerarla.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calculadora import GenerationCache, NumberGeneration, StatisticalTests  # noqa: E402
+
+# ==================== CASOS ====================
+# Parámetros que no degeneran a 0 en 10^7 pasos (cuadrados medios siempre degenera
+# pronto: se mide igual, con n efectivo menor)
+GENERADORES = {
+    'cuadrados_medios': lambda n, h: NumberGeneration.cuadrados_medios(5115, n, con_historial=h),
+    'productos_medios': lambda n, h: NumberGeneration.productos_medios(1001, 5678, n, con_historial=h),
+    'multiplicador_constante': lambda n, h: NumberGeneration.multiplicador_constante(1234, 4091, n, con_historial=h),
+    'multiplicador_constante_8': lambda n, h: NumberGeneration.multiplicador_constante(
+        12345678, 98765431, n, con_historial=h, digitos=8),
+    'productos_medios_8': lambda n, h: NumberGeneration.productos_medios(12345678, 87654321, n, con_historial=h,
+                                                                          digitos=8),
+    'congruencial_lineal': lambda n, h: NumberGeneration.congruencial_lineal(12345, 1103515245, 12345, 2 ** 31, n,
+                                                                             con_historial=h),
+    'congruencial_combinado': lambda n, h: NumberGeneration.congruencial_combinado(12345, 67890, n, con_historial=h),
+}
+
+PRUEBAS = (
+    'media_test', 'varianza_test', 'uniformidad_test', 'corridas_arriba_abajo_test', 'corridas_media_test',
+    'autocorrelacion_test', 'poker_test', 'huecos_test', 'series_test', 'kolmogorov_smirnov_test',
+)
+
+TAMANOS = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+# Diferencias absolutas por debajo de esto son ruido del reloj, no regresiones
+MIN_SEGUNDOS = 1e-3
+
+
+def _numeros_uniformes(n):
+    """ri de 4 dígitos reproducibles"""
+    return np.floor(np.random.default_rng(12345).random(n) * 10000) / 10000
+
+
+def _sin_cache(generar, n, con_historial):
+    GenerationCache.limpiar()
+    return generar(n, con_historial)
+
+
+def casos(n_max, filtro=''):
+    """(nombre, n, función sin argumentos) de cada caso hasta n_max cuyo nombre contiene `filtro`.
+
+    La preparación de cada caso (generar para saber el n efectivo, los números de
+    las pruebas, la ventana) solo se hace si algún caso que la usa pasa el filtro.
+    """
+    for n in (t for t in TAMANOS if t <= n_max):
+        for metodo, generar in GENERADORES.items():
+            # en_cache mide servir sin generar los n números que dejó en la caché la
+            # corrida anterior (los congruenciales no pasan por la caché)
+            variantes = ('sin_historial', 'con_historial') if metodo.startswith('congruencial') else (
+                'sin_historial', 'con_historial', 'en_cache')
+            nombres = [f"generacion.{metodo}.{variante}.{n}" for variante in variantes]
+            if not any(filtro in nombre for nombre in nombres):
+                continue
+            efectivo = len(_sin_cache(generar, n, False)[0])
+            funciones = (lambda g=generar, n=n: _sin_cache(g, n, False), lambda g=generar, n=n: _sin_cache(g, n, True),
+                         lambda g=generar, n=n: g(n, False))
+            for nombre, funcion in zip(nombres, funciones):
+                if filtro in nombre:
+                    yield nombre, efectivo, funcion
+    for n in (t for t in TAMANOS if t <= n_max):
+        nombres = [(f"pruebas.{nombre}.{n}", nombre) for nombre in PRUEBAS]
+        if not any(filtro in caso for caso, _ in nombres):
+            continue
+        numeros = _numeros_uniformes(n)
+        for caso, nombre in nombres:
+            if filtro in caso:
+                yield caso, n, lambda p=getattr(StatisticalTests, nombre), x=numeros: p(x)
+    yield from casos_interfaz(n_max, filtro)
+
+
+def casos_interfaz(n_max, filtro=''):
+    """Caminos de la interfaz sin interacción; se omiten si no hay pantalla o el filtro los excluye"""
+    tamanos = [t for t in TAMANOS if t <= min(n_max, 10 ** 6)]
+    acciones = ('generar', 'paginar', 'prueba_uniformidad', 'histograma')
+    if not any(filtro in f"interfaz.{accion}.{n}" for n in tamanos for accion in acciones):
+        return
+    try:
+        import tkinter as tk
+        raiz = tk.Tk()
+    except Exception as e:
+        print(f"# interfaz omitida: {e}", file=sys.stderr)
+        return
+    raiz.withdraw()
+    from calculadora.interfaz import RandomNumberApp
+    app = RandomNumberApp(raiz)
+    app.mostrar_multiplicador_constante()
+
+    def esperar_tarea():
+        while app.tarea_activa is not None:
+            raiz.update()
+            time.sleep(0.001)
+        raiz.update()
+
+    def generar(n):
+        app.n.set(n)
+        app.semilla_multiplicador.set(1234)
+        app.constante_multiplicador.set(4091)
+        app.generar_multiplicador_constante()
+        esperar_tarea()
+
+    def paginar():
+        total = len(app.historial_generacion)
+        for inicio in np.linspace(0, max(total - 1, 0), 200).astype(int):
+            app.mostrar_pagina(int(inicio))
+        raiz.update()
+
+    def uniformidad():
+        app.prueba_uniformidad()
+        esperar_tarea()
+
+    def histograma():
+        app.mostrar_histograma()
+        raiz.update()
+
+    for n in tamanos:
+        # paginar, la uniformidad y el histograma miden sobre lo último generado
+        casos_n = ((f"interfaz.generar.{n}", n, lambda n=n: generar(n)),
+                   (f"interfaz.paginar.{n}", 200, paginar),
+                   (f"interfaz.prueba_uniformidad.{n}", n, uniformidad),
+                   (f"interfaz.histograma.{n}", n, histograma))
+        if not any(filtro in nombre for nombre, _, _ in casos_n):
+            continue
+        if filtro not in casos_n[0][0]:
+            generar(n)
+        for caso in casos_n:
+            if filtro in caso[0]:
+                yield caso
+    raiz.destroy()
+
+
+# ==================== MEDICIÓN ====================
+def medir(funcion, n, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+        bloques_vivos = sum(estadistica.count for estadistica in tracemalloc.take_snapshot().statistics('filename'))
+    finally:
+        tracemalloc.stop()
+    return {'n': n, 'segundos': mejor, 'por_segundo': n / mejor if mejor else None,
+            'memoria_pico': pico, 'bloques_vivos': bloques_vivos}
+
+
+def comparar(actual, base, tolerancia):
+    """Casos más lentos o con más memoria pico que la base más la tolerancia relativa"""
+    regresiones = []
+    for nombre, medicion in actual['casos'].items():
+        referencia = base['casos'].get(nombre)
+        if referencia is None:
+            continue
+        for campo in ('segundos', 'memoria_pico'):
+            if campo == 'segundos' and medicion[campo] - referencia[campo] < MIN_SEGUNDOS:
+                continue
+            if referencia[campo] and medicion[campo] > referencia[campo] * (1 + tolerancia):
+                regresiones.append((nombre, campo, referencia[campo], medicion[campo]))
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mediciones de generación, pruebas e interfaz")
+    parser.add_argument('--n-max', type=int, default=10 ** 6, help="mayor n a medir (hasta 10^7)")
+    parser.add_argument('--filtro', default='', help="solo casos cuyo nombre contenga este texto")
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--guardar', help="escribir los resultados como línea base JSON")
+    parser.add_argument('--base', help="línea base JSON contra la que comparar")
+    parser.add_argument('--tolerancia', type=float, default=0.25, help="empeoramiento relativo permitido")
+    args = parser.parse_args(argv)
+
+    resultados = {
+        'maquina': {'python': platform.python_version(), 'numpy': np.__version__,
+                    'plataforma': platform.platform(), 'procesador': platform.processor()},
+        'casos': {},
+    }
+    print(f"{'caso':<60} {'mejor tiempo':>12} {'números/s':>16} {'memoria pico':>13} {'bloques vivos al terminar':>26}")
+    for nombre, n, funcion in casos(args.n_max, args.filtro):
+        medicion = medir(funcion, n, args.repeticiones)
+        resultados['casos'][nombre] = medicion
+        print(f"{nombre:<60} {medicion['segundos']:>10.4f} s {medicion['por_segundo'] or 0:>14.0f}/s "
+              f"{medicion['memoria_pico'] / 2**20:>9.2f} MiB {medicion['bloques_vivos']:>26}")
+
+    if args.guardar:
+        with open(args.guardar, 'w', encoding='utf-8') as salida:
+            json.dump(resultados, salida, indent=1)
+    if args.base:
+        with open(args.base, encoding='utf-8') as entrada:
+            regresiones = comparar(resultados, json.load(entrada), args.tolerancia)
+        for nombre, campo, antes, ahora in regresiones:
+            print(f"REGRESIÓN {nombre}: {campo} {antes:.6g} -> {ahora:.6g}")
+        if regresiones:
+            return 1
+        print("Sin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""Generación de números pseudoaleatorios (dígitos medios y congruenciales) y sus pruebas estadísticas.
+
+El núcleo (generación, ciclos y pruebas) solo depende de NumPy. La interfaz
+gráfica se importa bajo demanda al pedir RandomNumberApp o main.
+"""
+from .bateria import TestBattery
+from .busqueda import ParameterSearch
+from .ciclos import CycleDetection, CycleInfo, SuccessorTables
+from .congruencial import CongruentialGeneration, CongruentialStream, CongruentialTrace
+from .criticos import CriticalValues
+from .digitos import DigitExtraction
+from .exportacion import StreamExport
+from .generacion import GenerationCache, GenerationStream, NumberGeneration, SequenceAccess
+from .perfil import Profiler
+from .pruebas import StatisticalAccumulator, StatisticalTests
+from .traza import GenerationTrace
+
+__all__ = [
+    'CongruentialGeneration', 'CongruentialStream', 'CongruentialTrace', 'CriticalValues', 'CycleDetection',
+    'CycleInfo', 'DigitExtraction', 'GenerationCache', 'GenerationStream', 'GenerationTrace', 'NumberGeneration',
+    'ParameterSearch', 'Profiler', 'RandomNumberApp', 'SequenceAccess', 'StatisticalAccumulator',
+    'StatisticalTests', 'StreamExport', 'SuccessorTables', 'TestBattery', 'main',
+]
+
+
+def __getattr__(nombre):
+    if nombre in ('RandomNumberApp', 'main'):
+        from . import interfaz
+        return getattr(interfaz, nombre)
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
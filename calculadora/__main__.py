@@ -0,0 +1,16 @@
+import sys
+
+
+def main(argv=None):
+    """Sin argumentos abre la ventana; con argumentos usa la línea de comandos"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        from .cli import main as main_cli
+        return main_cli(argv)
+    from .interfaz import main as main_interfaz
+    main_interfaz()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
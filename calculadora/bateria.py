@@ -0,0 +1,166 @@
+"""Batería completa de pruebas en paralelo sobre una o varias secuencias"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .exportacion import StreamExport
+from .perfil import Profiler
+from .pruebas import StatisticalTests
+
+# ==================== BATERÍA DE PRUEBAS EN PARALELO ====================
+# Los pools arrancan procesos nuevos en lugar de bifurcar: la ventana los lanza desde
+# un hilo de un proceso con Tk y matplotlib, que no se pueden copiar con fork
+CONTEXTO_POOL = multiprocessing.get_context('spawn')
+
+def _extremos(li, ls):
+    return [float(li), float(ls)]
+
+# nombre -> (método de StatisticalTests, función que saca (estadístico, crítico) del resultado)
+PRUEBAS = {
+    'medias': ('media_test', lambda r: (r[0], _extremos(r[1], r[2]))),
+    'varianza': ('varianza_test', lambda r: (r[0], _extremos(r[1], r[2]))),
+    'uniformidad': ('uniformidad_test', lambda r: (r[2], r[3])),
+    'corridas_arriba_abajo': ('corridas_arriba_abajo_test', lambda r: (r[3], r[4])),
+    'corridas_media': ('corridas_media_test', lambda r: (r[5], r[6])),
+    'autocorrelacion': ('autocorrelacion_test', lambda r: (r[2], r[3])),
+    'poker': ('poker_test', lambda r: (r[2], r[3])),
+    'huecos': ('huecos_test', lambda r: (r[2], r[3])),
+    'series': ('series_test', lambda r: (r[2], r[3])),
+    'kolmogorov_smirnov': ('kolmogorov_smirnov_test', lambda r: (r[0], r[1])),
+}
+
+
+def _abrir_fuente(fuente):
+    """Arreglo de números en el proceso trabajador y lo que hay que cerrar después"""
+    tipo, dato = fuente[0], fuente[1]
+    if tipo == 'compartida':
+        memoria = shared_memory.SharedMemory(name=dato)
+        return np.ndarray((fuente[2],), dtype=np.float64, buffer=memoria.buf), memoria
+    if tipo == 'archivo':
+        # Solo llegan aquí los archivos de ri (escala 1): los .bin se pasan antes a ri
+        return StreamExport.abrir_numeros(dato)[0], None
+    return dato, None
+
+
+def _ejecutar_prueba(nombre, fuente, confianza, intervalos, digitos=4):
+    """Corre una prueba en el proceso trabajador (nivel de módulo para poder enviarla al pool)"""
+    numeros, memoria = _abrir_fuente(fuente)
+    try:
+        metodo, extraer = PRUEBAS[nombre]
+        prueba = getattr(StatisticalTests, metodo)
+        if nombre == 'uniformidad':
+            resultado = prueba(numeros, intervalos, confianza)
+        elif nombre == 'poker':
+            # Los archivos de ri pueden venir de cualquier generador: sus decimales se truncan
+            resultado = prueba(numeros, confianza=confianza, digitos=digitos, exactos=fuente[0] != 'archivo')
+        else:
+            resultado = prueba(numeros, confianza=confianza)
+        estadistico, critico = extraer(resultado)
+        return {'pasa': bool(resultado[-1]), 'estadistico': float(estadistico),
+                'critico': critico if isinstance(critico, list) else float(critico)}
+    except ValueError as e:
+        return {'pasa': False, 'error': str(e)}
+    finally:
+        # La vista sobre el bloque compartido debe soltarse antes de cerrarlo
+        del numeros
+        if memoria is not None:
+            memoria.close()
+
+
+class TestBattery:
+    """Corre todas las pruebas de StatisticalTests a la vez en un pool de procesos.
+
+    Los arreglos grandes se copian una sola vez a memoria compartida y cada proceso
+    los ve sin copiarlos; las rutas de archivos de ri se mapean en memoria en cada
+    proceso y los .bin de yi* se pasan a ri una sola vez, en esa memoria compartida.
+    El informe por secuencia tiene n, cada prueba con pasa/estadístico/crítico, y el
+    total de aprobadas.
+    """
+    # Por debajo de este tamaño conviene más enviar el arreglo que compartirlo
+    MIN_COMPARTIDA = 1 << 16
+
+    @staticmethod
+    def _copiar_ri(numeros, escala, destino):
+        """destino = numeros / escala, por bloques para no crear un temporal del tamaño de la entrada"""
+        for inicio in range(0, numeros.size, StatisticalTests.BLOQUE):
+            bloque = destino[inicio:inicio + StatisticalTests.BLOQUE]
+            bloque[:] = numeros[inicio:inicio + StatisticalTests.BLOQUE]
+            if escala != 1:
+                bloque /= float(escala)
+        return destino
+
+    @staticmethod
+    def _fuente(secuencia, memorias):
+        escala = 1
+        if isinstance(secuencia, str):
+            arreglo, escala = StreamExport.abrir_numeros(secuencia)
+            if escala == 1:
+                return ('archivo', secuencia), len(arreglo)
+            # Los yi* de un .bin se pasan a ri una sola vez aquí y no en cada trabajador
+            secuencia = arreglo
+        numeros = np.asarray(secuencia) if escala != 1 else np.asarray(secuencia, dtype=np.float64)
+        if numeros.size < TestBattery.MIN_COMPARTIDA or memorias is None:
+            if escala != 1:
+                numeros = TestBattery._copiar_ri(numeros, escala, np.empty(numeros.size))
+            return ('arreglo', numeros), numeros.size
+        memoria = shared_memory.SharedMemory(create=True, size=numeros.size * 8)
+        memorias.append(memoria)
+        TestBattery._copiar_ri(numeros, escala, np.ndarray((numeros.size,), dtype=np.float64, buffer=memoria.buf))
+        return ('compartida', memoria.name, numeros.size), numeros.size
+
+    @staticmethod
+    @Profiler.medido('pruebas.bateria')
+    def ejecutar_varias(secuencias, confianza=0.95, intervalos=10, pruebas=None, procesos=None, al_avanzar=None,
+                        digitos=4):
+        """Informe por secuencia de un dict {nombre: arreglo o ruta}; cada (secuencia, prueba) es una tarea.
+
+        procesos=1 corre todo en este proceso. al_avanzar(hechas, total) se llama al
+        terminar cada tarea. `digitos` es el ancho que lee el póker (ver
+        StatisticalTests.digitos_poker).
+        """
+        pruebas = tuple(pruebas or PRUEBAS)
+        desconocidas = set(pruebas) - set(PRUEBAS)
+        if desconocidas:
+            raise ValueError(f"Pruebas desconocidas: {', '.join(sorted(desconocidas))}")
+        procesos = procesos or os.cpu_count() or 1
+        memorias = [] if procesos > 1 else None
+        try:
+            fuentes = {clave: TestBattery._fuente(secuencia, memorias) for clave, secuencia in secuencias.items()}
+            tareas = [(clave, nombre) for clave in fuentes for nombre in pruebas]
+            if procesos == 1:
+                resultados = []
+                for clave, nombre in tareas:
+                    resultados.append(_ejecutar_prueba(nombre, fuentes[clave][0], confianza, intervalos, digitos))
+                    if al_avanzar is not None:
+                        al_avanzar(len(resultados), len(tareas))
+            else:
+                with ProcessPoolExecutor(max_workers=min(procesos, len(tareas) or 1), mp_context=CONTEXTO_POOL) as pool:
+                    futuros = [pool.submit(_ejecutar_prueba, nombre, fuentes[clave][0], confianza, intervalos, digitos)
+                               for clave, nombre in tareas]
+                    for hechas, futuro in enumerate(futuros, 1):
+                        futuro.result()
+                        if al_avanzar is not None:
+                            al_avanzar(hechas, len(tareas))
+                    resultados = [futuro.result() for futuro in futuros]
+        finally:
+            for memoria in memorias or ():
+                memoria.close()
+                memoria.unlink()
+
+        informes = {clave: {'n': fuente[1], 'confianza': confianza, 'pruebas': {}} for clave, fuente in fuentes.items()}
+        for (clave, nombre), resultado in zip(tareas, resultados):
+            informes[clave]['pruebas'][nombre] = resultado
+        for informe in informes.values():
+            informe['aprobadas'] = sum(r['pasa'] for r in informe['pruebas'].values())
+            informe['total'] = len(informe['pruebas'])
+            informe['pasa'] = informe['aprobadas'] == informe['total']
+        return informes
+
+    @staticmethod
+    def ejecutar(numeros, confianza=0.95, intervalos=10, pruebas=None, procesos=None, al_avanzar=None, digitos=4):
+        """Informe de una sola secuencia (arreglo, lista, memmap o ruta de archivo)"""
+        return TestBattery.ejecutar_varias({'secuencia': numeros}, confianza, intervalos, pruebas,
+                                           procesos, al_avanzar, digitos)['secuencia']
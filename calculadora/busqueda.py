@@ -0,0 +1,132 @@
+"""Búsqueda de semillas y constantes ordenadas por el resultado de la batería de pruebas"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .bateria import CONTEXTO_POOL, PRUEBAS, TestBattery
+from .ciclos import ESTADOS, CycleDetection
+from .generacion import NumberGeneration
+from .perfil import Profiler
+
+# ==================== BÚSQUEDA DE PARÁMETROS ====================
+def _evaluar_bloque(metodo, semillas1, semillas2, constantes, n, confianza, intervalos, pruebas, min_periodo):
+    """Poda y prueba un bloque de candidatos (nivel de módulo para poder enviarlo al pool)"""
+    filas = []
+    vivos = []
+    for i in range(len(semillas1)):
+        semillas = (int(semillas1[i]),) if semillas2 is None else (int(semillas1[i]), int(semillas2[i]))
+        constante = None if constantes is None else int(constantes[i])
+        fila = {'semillas': list(semillas), 'constante': constante}
+        # Con tablas el ciclo sale en O(1); productos medios usa Brent acotado
+        ciclo = CycleDetection.detectar(metodo, semillas, constante, max_pasos=2 * n + 2)
+        if ciclo is not None:
+            fila.update(cola=ciclo.cola, periodo=ciclo.periodo, distintos=CycleDetection.limite_sin_repetir(ciclo))
+            if ciclo.degenera and max(ciclo.cola, 1) <= n:
+                fila['podado'] = 'degenera'
+            elif not ciclo.degenera and ciclo.periodo < min_periodo:
+                fila['podado'] = 'ciclo_corto'
+        else:
+            fila.update(cola=None, periodo=None, distintos=None)
+        filas.append(fila)
+        if 'podado' not in fila:
+            vivos.append(i)
+
+    if vivos:
+        vivos = np.array(vivos)
+        if metodo == 'cuadrados_medios':
+            numeros, validos = NumberGeneration.lote_cuadrados_medios(semillas1[vivos], n)
+        elif metodo == 'productos_medios':
+            numeros, validos = NumberGeneration.lote_productos_medios(semillas1[vivos], semillas2[vivos], n)
+        else:
+            numeros, validos = NumberGeneration.lote_multiplicador_constante(semillas1[vivos], constantes[vivos], n)
+        # Por si algún ciclo no se pudo calcular: toda fila que llegó a 0 queda podada
+        secuencias = {}
+        for j, i in enumerate(vivos):
+            if validos[j].all():
+                secuencias[int(i)] = numeros[j]
+            else:
+                filas[i]['podado'] = 'degenera'
+        informes = TestBattery.ejecutar_varias(secuencias, confianza, intervalos, pruebas, procesos=1)
+        for i, informe in informes.items():
+            filas[i].update(aprobadas=informe['aprobadas'], total=informe['total'],
+                            pruebas={nombre: r['pasa'] for nombre, r in informe['pruebas'].items()})
+    return filas
+
+
+class ParameterSearch:
+    """Recorre un espacio de semillas (y constantes) de uno de los tres métodos.
+
+    Cada candidato se poda antes de generar si degenera a 0 dentro de los n números
+    o cae en un ciclo de periodo menor que min_periodo; los demás se generan por
+    lotes y pasan por la batería de TestBattery. Los bloques de candidatos se
+    reparten en un pool de procesos.
+    """
+    TAM_BLOQUE = 256
+    MIN_PERIODO = 16
+
+    @staticmethod
+    def _candidatos(metodo, semillas, semillas2, constantes):
+        semillas = np.atleast_1d(np.asarray(semillas, dtype=np.int64))
+        if metodo == 'cuadrados_medios':
+            return semillas, None, None
+        if metodo == 'productos_medios':
+            if semillas2 is None:
+                raise ValueError("productos_medios necesita semillas2")
+            s1, s2 = np.meshgrid(semillas, np.atleast_1d(np.asarray(semillas2, dtype=np.int64)), indexing='ij')
+            return s1.ravel(), s2.ravel(), None
+        if metodo == 'multiplicador_constante':
+            if constantes is None:
+                raise ValueError("multiplicador_constante necesita constantes")
+            # Ordenados por constante, así cada bloque reutiliza el análisis de la misma tabla
+            c, s = np.meshgrid(np.atleast_1d(np.asarray(constantes, dtype=np.int64)), semillas, indexing='ij')
+            return s.ravel(), None, c.ravel()
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    @staticmethod
+    @Profiler.medido('busqueda')
+    def buscar(metodo, semillas=range(ESTADOS), n=1000, constantes=None, semillas2=None, confianza=0.95,
+               intervalos=10, pruebas=None, min_periodo=MIN_PERIODO, cantidad=None, procesos=None,
+               al_avanzar=None):
+        """Ranking de candidatos: más pruebas aprobadas primero, luego más valores distintos antes de repetir.
+
+        Devuelve {'ranking': filas, 'podados': {'degenera': k, 'ciclo_corto': m}, 'evaluados': e}.
+        Cada fila tiene semillas, constante, cola, periodo, distintos, aprobadas, total
+        y el resultado de cada prueba. al_avanzar(hechos, total) se llama por bloque.
+        """
+        if n < 3:
+            raise ValueError("La búsqueda necesita n de al menos 3")
+        pruebas = tuple(pruebas or PRUEBAS)
+        s1, s2, c = ParameterSearch._candidatos(metodo, semillas, semillas2, constantes)
+        if s1.size and s1.min() < 0 or s2 is not None and s2.size and s2.min() < 0 or c is not None and c.size and c.min() < 0:
+            raise ValueError("Las semillas y constantes deben ser enteros no negativos")
+        bloques = []
+        for inicio in range(0, s1.size, ParameterSearch.TAM_BLOQUE):
+            corte = slice(inicio, inicio + ParameterSearch.TAM_BLOQUE)
+            bloques.append((metodo, s1[corte], None if s2 is None else s2[corte], None if c is None else c[corte],
+                            n, confianza, intervalos, pruebas, min_periodo))
+
+        procesos = procesos or os.cpu_count() or 1
+        filas = []
+        if procesos == 1 or len(bloques) <= 1:
+            for bloque in bloques:
+                filas.extend(_evaluar_bloque(*bloque))
+                if al_avanzar is not None:
+                    al_avanzar(len(filas), s1.size)
+        else:
+            with ProcessPoolExecutor(max_workers=min(procesos, len(bloques)), mp_context=CONTEXTO_POOL) as pool:
+                for resultado in pool.map(_evaluar_bloque, *zip(*bloques)):
+                    filas.extend(resultado)
+                    if al_avanzar is not None:
+                        al_avanzar(len(filas), s1.size)
+
+        podados = {'degenera': 0, 'ciclo_corto': 0}
+        ranking = []
+        for fila in filas:
+            if 'podado' in fila:
+                podados[fila['podado']] += 1
+            else:
+                ranking.append(fila)
+        # Sin ciclo conocido (productos medios que no cierra en 2n pasos) cuenta como el mejor caso
+        ranking.sort(key=lambda f: (-f['aprobadas'], -(f['distintos'] if f['distintos'] is not None else float('inf'))))
+        return {'ranking': ranking[:cantidad] if cantidad else ranking, 'podados': podados, 'evaluados': len(ranking)}
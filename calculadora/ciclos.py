@@ -0,0 +1,239 @@
+"""Tablas de sucesores y detección de ciclos de los métodos de dígitos medios"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from .digitos import DigitExtraction, MAX_INT64
+
+# ==================== TABLAS DE SUCESORES ====================
+ESTADOS = 10000
+# Mayor constante cuyo producto con un estado de 4 dígitos cabe en int64
+MAX_CONSTANTE_TABLA = MAX_INT64 // (ESTADOS - 1)
+
+class SuccessorTables:
+    """Tablas estado -> estado siguiente para los 10^4 estados de 4 dígitos.
+
+    Con ellas la generación es una búsqueda en tabla y se puede analizar todo el
+    espacio de semillas (cola, periodo y degeneración a 0) de forma vectorizada.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def cuadrados_medios():
+        x = np.arange(ESTADOS, dtype=np.int64)
+        return DigitExtraction.medio_par_vec(x * x)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def multiplicador_constante(constante):
+        x = np.arange(ESTADOS, dtype=np.int64)
+        return DigitExtraction.medio_par_vec(x * constante)
+
+    @staticmethod
+    def multiplicador_constantes(constantes):
+        """Tabla 2-D (una fila por constante)"""
+        constantes = np.asarray(constantes, dtype=np.int64)
+        x = np.arange(ESTADOS, dtype=np.int64)
+        return DigitExtraction.medio_par_vec(constantes[:, None] * x[None, :])
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def lista(metodo, constante=None):
+        """Tabla como lista de Python, para búsquedas escalares rápidas en los bucles de generación"""
+        if metodo == 'cuadrados_medios':
+            return SuccessorTables.cuadrados_medios().tolist()
+        return SuccessorTables.multiplicador_constante(constante).tolist()
+
+    @staticmethod
+    def disponible(metodo, constante=None, digitos=4):
+        """Las tablas solo cubren el ancho de 4 dígitos"""
+        if digitos != 4:
+            return False
+        if metodo == 'cuadrados_medios':
+            return True
+        return metodo == 'multiplicador_constante' and constante <= MAX_CONSTANTE_TABLA
+
+    @staticmethod
+    def analizar(tabla):
+        """Cola, periodo y degeneración para cada semilla 0..9999.
+
+        Acepta una tabla 1-D o 2-D (una fila por constante) y devuelve tres arreglos
+        con la misma forma.
+        """
+        una_fila = np.ndim(tabla) == 1
+        tabla = np.atleast_2d(np.asarray(tabla, dtype=np.intp))
+        filas = tabla.shape[0]
+        desfase = (np.arange(filas, dtype=np.intp) * ESTADOS)[:, None]
+        plana = (tabla + desfase).ravel()
+
+        # Saltos f^(2^k) para k = 0..13; f^(2^14)(x) ya está dentro del ciclo porque 2^14 > 10^4 estados
+        saltos = [plana]
+        for _ in range(14):
+            saltos.append(saltos[-1][saltos[-1]])
+        potencia = saltos.pop()
+        en_ciclo = np.zeros(plana.size, dtype=bool)
+        en_ciclo[potencia] = True
+
+        # Periodo: se recorre cada ciclo solo desde sus propios nodos
+        periodo_nodo = np.zeros(plana.size, dtype=np.int64)
+        nodos = np.flatnonzero(en_ciclo)
+        w = plana[nodos]
+        pasos = 1
+        while nodos.size:
+            cerrado = w == nodos
+            periodo_nodo[nodos[cerrado]] = pasos
+            nodos, w = nodos[~cerrado], plana[w[~cerrado]]
+            pasos += 1
+        periodo = periodo_nodo[potencia]
+
+        # Cola por búsqueda binaria sobre los saltos: se avanza mientras no se pise el ciclo
+        cola = np.zeros(plana.size, dtype=np.int64)
+        y = np.arange(plana.size, dtype=np.intp)
+        for k in range(len(saltos) - 1, -1, -1):
+            candidato = saltos[k][y]
+            fuera = ~en_ciclo[candidato]
+            y = np.where(fuera, candidato, y)
+            cola += fuera.astype(np.int64) << k
+        cola += ~en_ciclo
+
+        # El 0 es punto fijo en ambos métodos: si el ciclo lo contiene, es {0}
+        degenera = potencia % ESTADOS == 0
+        forma = (filas, ESTADOS)
+        resultado = (cola.reshape(forma), periodo.reshape(forma), degenera.reshape(forma))
+        if una_fila:
+            return tuple(r[0] for r in resultado)
+        return resultado
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _analisis(metodo, constante=None):
+        if metodo == 'cuadrados_medios':
+            return SuccessorTables.analizar(SuccessorTables.cuadrados_medios())
+        return SuccessorTables.analizar(SuccessorTables.multiplicador_constante(constante))
+
+    @staticmethod
+    def ciclo(metodo, semilla, constante=None):
+        """CycleInfo de una semilla en O(1) a partir del análisis precalculado"""
+        cola, periodo, degenera = SuccessorTables._analisis(metodo, constante)
+        pasos_extra = 0
+        if semilla >= ESTADOS:
+            f = CycleDetection.transicion(metodo, constante)
+            semilla = f(semilla)
+            pasos_extra = 1
+        return CycleInfo(int(cola[semilla]) + pasos_extra, int(periodo[semilla]), bool(degenera[semilla]))
+
+    @staticmethod
+    def barrido_semillas(metodo, constante=None):
+        """Cola, periodo y degeneración de todas las semillas de 4 dígitos"""
+        cola, periodo, degenera = SuccessorTables._analisis(metodo, constante)
+        return {'semilla': np.arange(ESTADOS), 'cola': cola, 'periodo': periodo, 'degenera': degenera}
+
+    @staticmethod
+    def barrido_constantes(constantes=range(ESTADOS), tam_bloque=64):
+        """Recorre las constantes por bloques; produce (constantes, cola, periodo, degenera) 2-D"""
+        constantes = np.asarray(constantes, dtype=np.int64)
+        for inicio in range(0, len(constantes), tam_bloque):
+            bloque = constantes[inicio:inicio + tam_bloque]
+            cola, periodo, degenera = SuccessorTables.analizar(SuccessorTables.multiplicador_constantes(bloque))
+            yield bloque, cola, periodo, degenera
+
+    @staticmethod
+    def mejores_semillas(metodo, constante=None, cantidad=10):
+        """Semillas que no degeneran a 0, ordenadas por cantidad de valores distintos (cola + periodo)"""
+        barrido = SuccessorTables.barrido_semillas(metodo, constante)
+        distintos = np.where(barrido['degenera'], -1, barrido['cola'] + barrido['periodo'])
+        orden = np.argsort(-distintos, kind='stable')[:cantidad]
+        return [(int(s), int(barrido['cola'][s]), int(barrido['periodo'][s])) for s in orden if distintos[s] > 0]
+
+    @staticmethod
+    def resumen_constantes(constantes=range(ESTADOS), tam_bloque=64):
+        """Por constante: periodo máximo, semilla que lo alcanza y fracción de semillas que degeneran"""
+        resumen = []
+        for bloque, cola, periodo, degenera in SuccessorTables.barrido_constantes(constantes, tam_bloque):
+            util = np.where(degenera, 0, periodo)
+            mejores = util.argmax(axis=1)
+            for i, constante in enumerate(bloque):
+                resumen.append((int(constante), int(util[i, mejores[i]]), int(mejores[i]), float(degenera[i].mean())))
+        return resumen
+
+# ==================== DETECCIÓN DE CICLOS ====================
+# cola: pasos desde la semilla hasta entrar al ciclo; periodo: longitud del ciclo;
+# degenera: el ciclo es el punto fijo 0 (donde la generación se corta)
+CycleInfo = namedtuple('CycleInfo', ['cola', 'periodo', 'degenera'])
+# Pasos de Brent tras los que se da el ciclo por no encontrado (productos medios y
+# anchos sin tabla pueden tener espacios de estados enormes)
+MAX_PASOS_CICLO = 10 ** 6
+
+class CycleDetection:
+    @staticmethod
+    def transicion(metodo, constante=None, digitos=4):
+        """Función estado -> estado siguiente del método (en productos medios el estado es un par)"""
+        medio_par = DigitExtraction.medio_par
+        medio_centrado = DigitExtraction.medio_centrado
+        if metodo == 'cuadrados_medios':
+            return lambda x: medio_par(x * x, digitos)
+        if metodo == 'multiplicador_constante':
+            return lambda x: medio_par(constante * x, digitos)
+        if metodo == 'productos_medios':
+            return lambda par: (par[1], medio_centrado(par[0] * par[1], digitos))
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    @staticmethod
+    def brent(f, x0, max_pasos=None):
+        """Algoritmo de Brent: devuelve (cola, periodo) o None si se superan max_pasos"""
+        potencia = periodo = 1
+        tortuga = x0
+        liebre = f(x0)
+        pasos = 1
+        while tortuga != liebre:
+            if potencia == periodo:
+                tortuga = liebre
+                potencia *= 2
+                periodo = 0
+            liebre = f(liebre)
+            periodo += 1
+            pasos += 1
+            if max_pasos is not None and pasos > max_pasos:
+                return None
+        tortuga = liebre = x0
+        for _ in range(periodo):
+            liebre = f(liebre)
+        cola = 0
+        while tortuga != liebre:
+            tortuga = f(tortuga)
+            liebre = f(liebre)
+            cola += 1
+        return cola, periodo
+
+    @staticmethod
+    def detectar(metodo, semillas, constante=None, max_pasos=MAX_PASOS_CICLO, digitos=4):
+        """Cola y periodo de la sucesión de estados; None si no se cierra en max_pasos (None: sin límite)"""
+        if SuccessorTables.disponible(metodo, constante, digitos):
+            return SuccessorTables.ciclo(metodo, semillas[0], constante)
+        f = CycleDetection.transicion(metodo, constante, digitos)
+        x0 = tuple(semillas) if metodo == 'productos_medios' else semillas[0]
+        resultado = CycleDetection.brent(f, x0, max_pasos)
+        if resultado is None:
+            return None
+        cola, periodo = resultado
+        for _ in range(cola):
+            x0 = f(x0)
+        degenera = periodo == 1 and (x0[1] if metodo == 'productos_medios' else x0) == 0
+        return CycleInfo(cola, periodo, degenera)
+
+    @staticmethod
+    def iteracion_degenera(metodo, ciclo):
+        """Iteración en la que sale el 0 de una sucesión que degenera.
+
+        En productos medios el estado es el par (yi-1, yi): llega a (0, 0) un paso
+        después de que aparece el 0.
+        """
+        if metodo == 'productos_medios':
+            return max(ciclo.cola - 1, 1)
+        return max(ciclo.cola, 1)
+
+    @staticmethod
+    def limite_sin_repetir(ciclo):
+        """Cantidad de números generados antes de que la sucesión repita un estado"""
+        return max(ciclo.cola, 1) + ciclo.periodo - 1
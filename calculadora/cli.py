@@ -0,0 +1,276 @@
+"""Línea de comandos sin interfaz gráfica: nunca importa tkinter ni matplotlib"""
+import argparse
+import csv
+import json
+import sys
+
+import numpy as np
+
+from .bateria import PRUEBAS, TestBattery
+from .busqueda import ParameterSearch
+from .ciclos import ESTADOS, MAX_PASOS_CICLO, CycleDetection
+from .digitos import MAX_DIGITOS
+from .exportacion import StreamExport
+from .generacion import GenerationStream, SequenceAccess
+from .perfil import Profiler
+from .pruebas import StatisticalAccumulator, StatisticalTests
+from .traza import GenerationTrace
+
+# ==================== LÍNEA DE COMANDOS ====================
+METODOS = ('cuadrados_medios', 'productos_medios', 'multiplicador_constante')
+ANCHOS = tuple(range(2, MAX_DIGITOS + 1, 2))
+
+def _enteros(texto):
+    """Entero o rango inclusivo 'a-b'"""
+    if '-' in texto.strip('-'):
+        inicio, fin = texto.split('-', 1)
+        return list(range(int(inicio), int(fin) + 1))
+    return [int(texto)]
+
+def _crear_parser():
+    parser = argparse.ArgumentParser(
+        description="Generación y pruebas de números pseudoaleatorios sin interfaz gráfica")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+    
+    comun = argparse.ArgumentParser(add_help=False)
+    comun.add_argument('--metodo', choices=METODOS, required=True)
+    comun.add_argument('--semillas', type=int, nargs='+', required=True,
+                       help="una semilla (dos para productos_medios)")
+    comun.add_argument('--constante', type=int, help="constante de multiplicador_constante")
+    comun.add_argument('-n', type=int, required=True, help="cantidad de números")
+    comun.add_argument('--digitos', type=int, choices=ANCHOS, default=4, metavar='D',
+                       help="ancho de los dígitos del medio, par de 2 a 18 (por defecto 4)")
+    comun.add_argument('--desde', type=int, default=0,
+                       help="saltar los primeros DESDE números sin generarlos (tramos disjuntos de una sucesión)")
+    comun.add_argument('--detener-en-ciclo', action='store_true',
+                       help="cortar la generación antes de que se repita un estado")
+    comun.add_argument('--salida', help="archivo de salida (por defecto la salida estándar)")
+    
+    generar = subparsers.add_parser('generar', parents=[comun], help="generar números")
+    generar.add_argument('--formato', choices=('json', 'csv', 'npy', 'bin'), default='json',
+                         help="npy (ri en float64) y bin (binario compacto) necesitan --salida")
+    generar.add_argument('--historial', action='store_true', help="incluir la traza de cada iteración")
+    
+    probar = subparsers.add_parser('probar', parents=[comun], help="generar y aplicar las pruebas estadísticas")
+    probar.add_argument('--formato', choices=('json', 'csv'), default='json')
+    
+    archivo = subparsers.add_parser('probar-archivo', help="aplicar las pruebas a un archivo .npy, .bin o float64 crudo")
+    archivo.add_argument('archivo', help="se mapea en memoria y se recorre por bloques")
+    archivo.add_argument('--formato', choices=('json', 'csv'), default='json')
+    archivo.add_argument('--salida', help="archivo de salida (por defecto la salida estándar)")
+    archivo.add_argument('--digitos', type=int, metavar='D',
+                         help="dígitos de ri que lee el póker (por defecto los de la cabecera de un .bin, o 4)")
+    
+    for subparser in (probar, archivo):
+        subparser.add_argument('--confianza', type=float, default=0.95)
+        subparser.add_argument('--intervalos', type=int, default=10)
+        subparser.add_argument('--bateria', nargs='*', choices=tuple(PRUEBAS), metavar='PRUEBA',
+                               help="batería completa en paralelo (o solo las pruebas nombradas): "
+                                    + ", ".join(PRUEBAS))
+        subparser.add_argument('--procesos', type=int, help="procesos de la batería (por defecto todos los núcleos)")
+    
+    iteracion = subparsers.add_parser('iteracion', help="fila de la traza de una iteración sin generar las anteriores")
+    iteracion.add_argument('--metodo', choices=METODOS, required=True)
+    iteracion.add_argument('--semillas', type=int, nargs='+', required=True,
+                           help="una semilla (dos para productos_medios)")
+    iteracion.add_argument('--constante', type=int, help="constante de multiplicador_constante")
+    iteracion.add_argument('--digitos', type=int, choices=ANCHOS, default=4, metavar='D',
+                           help="ancho de los dígitos del medio, par de 2 a 18 (por defecto 4)")
+    iteracion.add_argument('-k', type=int, nargs='+', required=True, help="iteraciones (desde 1)")
+    iteracion.add_argument('--salida', help="archivo de salida (por defecto la salida estándar)")
+    iteracion.set_defaults(formato='json')
+    
+    buscar = subparsers.add_parser('buscar', help="ordenar semillas/constantes por las pruebas que aprueban")
+    buscar.add_argument('--metodo', choices=METODOS, required=True)
+    buscar.add_argument('--semillas', type=_enteros, nargs='+', help="semillas o rangos a-b (por defecto 0-9999)")
+    buscar.add_argument('--semillas2', type=_enteros, nargs='+', help="segundas semillas de productos_medios")
+    buscar.add_argument('--constantes', type=_enteros, nargs='+', help="constantes de multiplicador_constante")
+    buscar.add_argument('-n', type=int, default=1000, help="cantidad de números por candidato")
+    buscar.add_argument('--min-periodo', type=int, default=ParameterSearch.MIN_PERIODO,
+                        help="podar candidatos con un ciclo más corto")
+    buscar.add_argument('--confianza', type=float, default=0.95)
+    buscar.add_argument('--intervalos', type=int, default=10)
+    buscar.add_argument('--cantidad', type=int, default=20, help="filas del ranking (0 para todas)")
+    buscar.add_argument('--procesos', type=int, help="por defecto todos los núcleos")
+    buscar.add_argument('--formato', choices=('json', 'csv'), default='json')
+    buscar.add_argument('--salida', help="archivo de salida (por defecto la salida estándar)")
+    
+    for subparser in (generar, probar, archivo, iteracion, buscar):
+        subparser.add_argument('--perfil', nargs='?', const='-', metavar='ARCHIVO',
+                               help="medir tiempos y contadores y volcarlos como JSON en ARCHIVO "
+                                    "(por defecto la salida de errores)")
+    return parser
+
+def _validar_argumentos(parser, args):
+    if args.comando == 'probar-archivo':
+        return
+    if args.comando == 'buscar':
+        for nombre in ('semillas', 'semillas2', 'constantes'):
+            valores = getattr(args, nombre)
+            if valores is not None:
+                setattr(args, nombre, [v for grupo in valores for v in grupo])
+        if args.semillas is None:
+            args.semillas = range(ESTADOS)
+        return
+    semillas_esperadas = 2 if args.metodo == 'productos_medios' else 1
+    if len(args.semillas) != semillas_esperadas:
+        parser.error(f"{args.metodo} necesita {semillas_esperadas} semilla(s)")
+    if args.metodo == 'multiplicador_constante' and args.constante is None:
+        parser.error("multiplicador_constante necesita --constante")
+    if args.metodo != 'multiplicador_constante':
+        args.constante = None
+    if args.comando == 'iteracion':
+        return
+    if args.desde < 0:
+        parser.error("--desde no puede ser negativo")
+    if args.formato in ('npy', 'bin') and not args.salida:
+        parser.error(f"--formato {args.formato} necesita --salida")
+
+def _flujo_desde_argumentos(args, tam_bloque=65536):
+    fin = args.desde + args.n
+    if args.detener_en_ciclo:
+        ciclo = CycleDetection.detectar(args.metodo, args.semillas, args.constante, MAX_PASOS_CICLO, args.digitos)
+        # Sin ciclo dentro del límite no se corta
+        if ciclo is not None:
+            fin = min(fin, CycleDetection.limite_sin_repetir(ciclo))
+    return GenerationStream.tramo(args.metodo, args.semillas, args.constante, args.desde,
+                                  max(fin - args.desde, 0), tam_bloque, args.digitos)
+
+def _escribir_generacion(args, salida):
+    flujo = _flujo_desde_argumentos(args)
+    columnas = GenerationTrace.COLUMNAS[args.metodo] if args.historial else ('iteracion', 'ri')
+    if args.formato == 'csv':
+        StreamExport.csv(flujo, salida, columnas, flujo.tam_bloque)
+    else:
+        filas = []
+        for inicio, traza in StreamExport.bloques(flujo, flujo.tam_bloque):
+            datos = [traza.columna(c).tolist() for c in columnas if c != 'iteracion']
+            bloque = zip(range(inicio + 1, inicio + len(traza) + 1), *datos)
+            filas.extend(dict(zip(columnas, fila)) for fila in bloque)
+        documento = {'metodo': args.metodo, 'semillas': args.semillas, 'constante': args.constante,
+                     'n': len(filas)}
+        if args.desde:
+            documento['desde'] = args.desde
+        if args.digitos != 4:
+            documento['digitos'] = args.digitos
+        if args.historial:
+            documento['historial'] = filas
+        else:
+            documento['numeros'] = [fila['ri'] for fila in filas]
+        json.dump(documento, salida)
+        salida.write('\n')
+
+def _exportar_generacion(args):
+    StreamExport.exportar(_flujo_desde_argumentos(args), args.salida, args.formato)
+
+def _resultados_pruebas(acumulador, confianza):
+    media, li, ls, z_alpha, pasa = acumulador.media_test(confianza)
+    medias = {'media': float(media), 'li': float(li), 'ls': float(ls), 'z_alpha': float(z_alpha), 'pasa': bool(pasa)}
+    varianza, li, ls, chi2_inf, chi2_sup, pasa = acumulador.varianza_test(confianza)
+    varianzas = {'varianza': float(varianza), 'li': float(li), 'ls': float(ls),
+                 'chi2_inf': float(chi2_inf), 'chi2_sup': float(chi2_sup), 'pasa': bool(pasa)}
+    frec_obs, frec_esp, chi2, chi2_critico, gl, bins, pasa = acumulador.uniformidad_test(confianza)
+    uniformidad = {'frec_obs': frec_obs.tolist(), 'frec_esp': float(frec_esp), 'chi2': float(chi2),
+                   'chi2_critico': float(chi2_critico), 'gl': int(gl), 'pasa': bool(pasa)}
+    return {'medias': medias, 'varianza': varianzas, 'uniformidad': uniformidad}
+
+def _escribir_bateria(args, salida):
+    digitos = args.digitos
+    if args.comando == 'probar-archivo':
+        numeros = args.archivo
+        origen = {'archivo': args.archivo}
+        if digitos is None:
+            escala = StreamExport.abrir_numeros(args.archivo)[1]
+            digitos = 4 if escala == 1 else StatisticalTests.digitos_poker(escala)
+    else:
+        numeros = np.concatenate([np.empty(0)] + list(_flujo_desde_argumentos(args)))
+        origen = {'metodo': args.metodo, 'semillas': args.semillas, 'constante': args.constante}
+    informe = TestBattery.ejecutar(numeros, args.confianza, args.intervalos, args.bateria or None, args.procesos,
+                                   digitos=digitos)
+    if args.formato == 'csv':
+        escritor = csv.writer(salida, lineterminator='\n')
+        escritor.writerow(('prueba', 'estadistico', 'critico', 'pasa'))
+        for nombre, resultado in informe['pruebas'].items():
+            critico = resultado.get('critico', '')
+            if isinstance(critico, list):
+                critico = ' '.join(map(str, critico))
+            escritor.writerow((nombre, resultado.get('estadistico', resultado.get('error')), critico, resultado['pasa']))
+    else:
+        json.dump({**origen, **informe}, salida)
+        salida.write('\n')
+
+def _escribir_pruebas(args, salida):
+    if args.bateria is not None:
+        return _escribir_bateria(args, salida)
+    if args.comando == 'probar-archivo':
+        acumulador = StatisticalAccumulator.desde_archivo(args.archivo, args.intervalos)
+        origen = {'archivo': args.archivo}
+    else:
+        acumulador = StatisticalAccumulator(args.intervalos).agregar_flujo(_flujo_desde_argumentos(args))
+        origen = {'metodo': args.metodo, 'semillas': args.semillas, 'constante': args.constante}
+    if acumulador.n < 2:
+        raise ValueError("Las pruebas necesitan al menos 2 números")
+    pruebas = _resultados_pruebas(acumulador, args.confianza)
+    if args.formato == 'csv':
+        escritor = csv.writer(salida, lineterminator='\n')
+        escritor.writerow(('prueba', 'estadistico', 'li', 'ls', 'pasa'))
+        escritor.writerow(('medias', pruebas['medias']['media'], pruebas['medias']['li'],
+                           pruebas['medias']['ls'], pruebas['medias']['pasa']))
+        escritor.writerow(('varianza', pruebas['varianza']['varianza'], pruebas['varianza']['li'],
+                           pruebas['varianza']['ls'], pruebas['varianza']['pasa']))
+        escritor.writerow(('uniformidad', pruebas['uniformidad']['chi2'], '',
+                           pruebas['uniformidad']['chi2_critico'], pruebas['uniformidad']['pasa']))
+    else:
+        json.dump({**origen, 'n': acumulador.n, 'confianza': args.confianza, 'intervalos': args.intervalos,
+                   'pruebas': pruebas}, salida)
+        salida.write('\n')
+
+def _escribir_iteracion(args, salida):
+    acceso = SequenceAccess(args.metodo, args.semillas, args.constante, args.digitos)
+    try:
+        filas = [acceso.fila(k) for k in args.k]
+    except IndexError as e:
+        raise ValueError(str(e)) from None
+    json.dump({'metodo': args.metodo, 'semillas': args.semillas, 'constante': args.constante,
+               'digitos': args.digitos, 'cola': acceso.ciclo.cola, 'periodo': acceso.ciclo.periodo, 'degenera': acceso.ciclo.degenera,
+               'filas': filas}, salida)
+    salida.write('\n')
+
+def _escribir_busqueda(args, salida):
+    resultado = ParameterSearch.buscar(args.metodo, args.semillas, args.n, args.constantes, args.semillas2,
+                                       args.confianza, args.intervalos, min_periodo=args.min_periodo,
+                                       cantidad=args.cantidad, procesos=args.procesos)
+    if args.formato == 'csv':
+        escritor = csv.writer(salida, lineterminator='\n')
+        escritor.writerow(('puesto', 'semillas', 'constante', 'cola', 'periodo', 'distintos', 'aprobadas', 'total'))
+        for puesto, fila in enumerate(resultado['ranking'], 1):
+            escritor.writerow((puesto, ' '.join(map(str, fila['semillas'])), fila['constante'], fila['cola'],
+                               fila['periodo'], fila['distintos'], fila['aprobadas'], fila['total']))
+    else:
+        json.dump({'metodo': args.metodo, 'n': args.n, 'confianza': args.confianza, **resultado}, salida)
+        salida.write('\n')
+
+def main(argv=None):
+    parser = _crear_parser()
+    args = parser.parse_args(argv)
+    _validar_argumentos(parser, args)
+    escribir = {'generar': _escribir_generacion, 'buscar': _escribir_busqueda,
+                'iteracion': _escribir_iteracion}.get(args.comando, _escribir_pruebas)
+    Profiler.activar(args.perfil is not None)
+    try:
+        with Profiler.medir(f"cli.{args.comando}"):
+            if args.formato in ('npy', 'bin'):
+                _exportar_generacion(args)
+            elif args.salida:
+                with open(args.salida, 'w', encoding='utf-8', newline='') as salida:
+                    escribir(args, salida)
+            else:
+                escribir(args, sys.stdout)
+        if args.perfil is not None:
+            Profiler.volcar(sys.stderr if args.perfil == '-' else args.perfil)
+    except (OSError, ValueError) as e:
+        parser.exit(2, f"Error: {e}\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
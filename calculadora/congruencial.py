@@ -0,0 +1,369 @@
+"""Generadores congruenciales lineal, multiplicativo y combinado de L'Ecuyer"""
+import math
+from array import array
+from functools import lru_cache
+
+import numpy as np
+
+from .ciclos import CycleInfo
+from .digitos import MAX_INT64
+from .perfil import Profiler
+from .traza import GenerationTrace
+
+# ==================== PARÁMETROS ====================
+# L'Ecuyer (1988): dos multiplicativos (a, m) con módulos primos cercanos a 2^31
+LECUYER = ((40014, 2147483563), (40692, 2147483399))
+# Mayor módulo con el que a*x + c cabe en int64 para cualesquiera a, x, c < m
+MAX_MODULO_VEC = math.isqrt(MAX_INT64)
+
+# ==================== GENERACIÓN CONGRUENCIAL ====================
+class CongruentialGeneration:
+    """Recurrencias afines x -> (a*x + c) mod m generadas por bloques con NumPy.
+
+    Los parámetros son (a, c, m) en el lineal, (a, m) en el multiplicativo y los
+    dos pares (a, m) de LECUYER en el combinado. Cada componente es una función afín,
+    así que k pasos también lo son: (A_k, C_k) sale en O(log k) multiplicaciones y
+    un bloque entero es (A_j*x + C_j) mod m con los coeficientes j = 1..bloque
+    precalculados. Con m hasta MAX_MODULO_VEC todo cabe en int64; con módulos
+    mayores (hasta 2^63) se usa un bucle con enteros de Python.
+    """
+    METODOS = ('congruencial_lineal', 'congruencial_multiplicativo', 'congruencial_combinado')
+    BLOQUE = 1 << 16
+
+    @staticmethod
+    def componentes(metodo, parametros):
+        """Lista de (a, c, m) de cada recurrencia del método"""
+        if metodo == 'congruencial_lineal':
+            return [tuple(parametros)]
+        if metodo == 'congruencial_multiplicativo':
+            a, m = parametros
+            return [(a, 0, m)]
+        if metodo == 'congruencial_combinado':
+            return [(a, 0, m) for a, m in parametros]
+        raise ValueError(f"Método desconocido: {metodo}")
+
+    @staticmethod
+    def escala(metodo, parametros):
+        """Divisor de los valores generados: m, o m1 en el combinado"""
+        return CongruentialGeneration.componentes(metodo, parametros)[0][2]
+
+    @staticmethod
+    def validar(metodo, semillas, parametros):
+        """Parámetros como tupla de enteros; ValueError si no forman un generador válido"""
+        if metodo == 'congruencial_combinado':
+            parametros = LECUYER if parametros is None else tuple(tuple(int(v) for v in p) for p in parametros)
+        else:
+            parametros = tuple(int(v) for v in parametros)
+        componentes = CongruentialGeneration.componentes(metodo, parametros)
+        if len(semillas) != len(componentes):
+            raise ValueError(f"{metodo} necesita {len(componentes)} semilla(s)")
+        for semilla, (a, c, m) in zip(semillas, componentes):
+            if not 2 <= m <= MAX_INT64 + 1:
+                raise ValueError("El módulo debe estar entre 2 y 2^63")
+            if not 0 < a < m or not 0 <= c < m:
+                raise ValueError("Se necesita 0 < a < m y 0 <= c < m")
+            # Sin incremento el 0 es punto fijo
+            minimo = 0 if c else 1
+            if not minimo <= semilla < m:
+                raise ValueError(f"La semilla debe estar entre {minimo} y m - 1")
+        return parametros
+
+    @staticmethod
+    def potencia(a, c, m, k):
+        """(A, C) con x_{i+k} = (A*x_i + C) mod m, en O(log k) multiplicaciones"""
+        resultado = (1, 0)
+        base = (a % m, c % m)
+        while k:
+            if k & 1:
+                resultado = (base[0] * resultado[0] % m, (base[0] * resultado[1] + base[1]) % m)
+            base = (base[0] * base[0] % m, (base[0] * base[1] + base[1]) % m)
+            k >>= 1
+        return resultado
+
+    @staticmethod
+    def saltar(metodo, semillas, parametros, k):
+        """Estado tras k pasos sin generar los intermedios"""
+        estado = []
+        for x, (a, c, m) in zip(semillas, CongruentialGeneration.componentes(metodo, parametros)):
+            A, C = CongruentialGeneration.potencia(a, c, m, k)
+            estado.append((A * x + C) % m)
+        return tuple(estado)
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _coeficientes(a, c, m, tam):
+        """A_j y C_j para j = 1..tam, por duplicación: x_{L+j} = A_j*(A_L*x + C_L) + C_j"""
+        A = np.empty(tam, dtype=np.int64)
+        C = np.empty(tam, dtype=np.int64)
+        A[0], C[0] = a, c
+        largo = 1
+        while largo < tam:
+            k = min(largo, tam - largo)
+            A[largo:largo + k] = A[:k] * A[largo - 1] % m
+            C[largo:largo + k] = (A[:k] * C[largo - 1] + C[:k]) % m
+            largo += k
+        A.setflags(write=False)
+        C.setflags(write=False)
+        return A, C
+
+    @staticmethod
+    def _recurrencia(x, a, c, m, n):
+        """(n valores siguientes a x como int64, último valor)"""
+        if m > MAX_MODULO_VEC:
+            valores = array('q', [0]) * n
+            for i in range(n):
+                x = (a * x + c) % m
+                valores[i] = x
+            return np.frombuffer(valores, dtype=np.int64, count=n), x
+        tam = min(CongruentialGeneration.BLOQUE, 1 << max(n - 1, 0).bit_length())
+        A, C = CongruentialGeneration._coeficientes(a, c, m, tam)
+        valores = np.empty(n, dtype=np.int64)
+        for inicio in range(0, n, tam):
+            k = min(tam, n - inicio)
+            bloque = valores[inicio:inicio + k]
+            np.multiply(A[:k], x, out=bloque)
+            bloque += C[:k]
+            bloque %= m
+            x = int(bloque[-1])
+        return valores, x
+
+    @staticmethod
+    def _salidas(metodo, semillas, parametros, n):
+        """n estados siguientes de cada componente"""
+        return [CongruentialGeneration._recurrencia(x, a, c, m, n)[0]
+                for x, (a, c, m) in zip(semillas, CongruentialGeneration.componentes(metodo, parametros))]
+
+    @staticmethod
+    def _combinar(metodo, parametros, salidas):
+        """Valores generados a partir de los estados de los componentes"""
+        if metodo != 'congruencial_combinado':
+            return salidas[0]
+        m1 = parametros[0][1]
+        valores = (salidas[0] - salidas[1]) % (m1 - 1)
+        valores[valores == 0] = m1 - 1
+        return valores
+
+    @staticmethod
+    @Profiler.medido('generacion.estados.congruencial')
+    def estados(metodo, semillas, parametros, n):
+        """(n valores como int64, estado final); el combinado da z en 1..m1-1"""
+        n = max(n, 0)
+        salidas = CongruentialGeneration._salidas(metodo, semillas, parametros, n)
+        estado = tuple(int(s[-1]) for s in salidas) if n else tuple(semillas)
+        Profiler.contar('generacion.numeros', n)
+        return CongruentialGeneration._combinar(metodo, parametros, salidas), estado
+
+    # -------------------- Periodo --------------------
+    @staticmethod
+    def _factores_primos(n):
+        factores = set()
+        d = 2
+        while d * d <= n:
+            while n % d == 0:
+                factores.add(d)
+                n //= d
+            d += 1 if d == 2 else 2
+        if n > 1:
+            factores.add(n)
+        return factores
+
+    @staticmethod
+    def _orden(a, m):
+        """Orden multiplicativo de a módulo un primo m"""
+        orden = m - 1
+        for p in CongruentialGeneration._factores_primos(m - 1):
+            while orden % p == 0 and pow(a, orden // p, m) == 1:
+                orden //= p
+        return orden
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _periodo(a, c, m):
+        """Periodo del componente si se puede asegurar (Hull-Dobell, o m primo sin incremento); si no, None.
+
+        Factorizar m y m - 1 cuesta más que generar pocos números: se guarda por parámetros.
+        """
+        if m > MAX_MODULO_VEC:
+            return None
+        factores = CongruentialGeneration._factores_primos(m)
+        if c:
+            completo = (math.gcd(c, m) == 1 and all((a - 1) % p == 0 for p in factores)
+                        and (m % 4 or (a - 1) % 4 == 0))
+            return m if completo else None
+        return CongruentialGeneration._orden(a, m) if factores == {m} else None
+
+    @staticmethod
+    def ciclo(metodo, parametros):
+        """CycleInfo (sin cola) cuando el periodo no depende de la semilla; None si no se puede asegurar"""
+        periodos = [CongruentialGeneration._periodo(a, c, m)
+                    for a, c, m in CongruentialGeneration.componentes(metodo, parametros)]
+        if None in periodos:
+            return None
+        return CycleInfo(0, math.lcm(*periodos), False)
+
+    @staticmethod
+    def fila(metodo, semillas, parametros, k):
+        """Fila de la traza de la iteración k (desde 1), saltando las anteriores"""
+        if k < 1:
+            raise IndexError("Las iteraciones empiezan en 1")
+        flujo = CongruentialStream.tramo(metodo, semillas, parametros, k - 1, 1)
+        estado = flujo.semillas
+        fila = flujo.traza(estado, flujo.estados(1))[0]
+        fila['iteracion'] = k
+        return fila
+
+# ==================== TRAZA CONGRUENCIAL ====================
+class CongruentialTrace(GenerationTrace):
+    """GenerationTrace de los congruenciales: ri = valor / m y columnas propias de cada método.
+
+    `digitos` es el ancho decimal de m - 1 (decide si las frecuencias salen de los
+    conteos por valor). En el combinado los estados de cada componente no se
+    deducen de z: se recalculan desde las semillas saltando o por bloques.
+    """
+    __slots__ = ('parametros',)
+
+    COLUMNAS = {
+        'congruencial_lineal': ('iteracion', 'xi', 'afin', 'xi_siguiente', 'ri'),
+        'congruencial_multiplicativo': ('iteracion', 'xi', 'producto', 'xi_siguiente', 'ri'),
+        'congruencial_combinado': ('iteracion', 'xi1', 'xi2', 'zi', 'ri'),
+    }
+
+    def __init__(self, metodo, semillas, estrellas, parametros, ciclo=None):
+        escala = CongruentialGeneration.escala(metodo, parametros)
+        super().__init__(metodo, semillas, estrellas, None, ciclo, len(str(escala - 1)))
+        self.parametros = parametros
+
+    @property
+    def escala(self):
+        return CongruentialGeneration.escala(self.metodo, self.parametros)
+
+    def _fila(self, i):
+        estrella = int(self.estrellas[i])
+        ri = estrella / float(self.escala)
+        if self.metodo == 'congruencial_combinado':
+            x1, x2 = CongruentialGeneration.saltar(self.metodo, self.semillas, self.parametros, i + 1)
+            return {'iteracion': i + 1, 'xi1': x1, 'xi2': x2, 'zi': estrella, 'ri': ri}
+        xi = self._estado(i)
+        a, c, _ = CongruentialGeneration.componentes(self.metodo, self.parametros)[0]
+        columna = 'afin' if self.metodo == 'congruencial_lineal' else 'producto'
+        return {'iteracion': i + 1, 'xi': xi, columna: a * xi + c, 'xi_siguiente': estrella, 'ri': ri}
+
+    def columna(self, nombre):
+        if nombre not in self.columnas:
+            raise KeyError(nombre)
+        if nombre == 'iteracion':
+            return np.arange(1, len(self) + 1, dtype=np.int64)
+        if nombre in ('xi_siguiente', 'zi'):
+            return self.estrellas
+        if nombre == 'ri':
+            return self.ri
+        if nombre in ('xi1', 'xi2'):
+            componente = int(nombre[-1]) - 1
+            a, m = self.parametros[componente]
+            return CongruentialGeneration._recurrencia(self.semillas[componente], a, 0, m, len(self))[0]
+        xi = self._estados(0)
+        if nombre == 'xi':
+            return xi
+        a, c, _ = CongruentialGeneration.componentes(self.metodo, self.parametros)[0]
+        producto = self._producto(xi, np.full(len(self), a, dtype=np.int64))
+        if producto.dtype != object and len(producto) and int(producto.max()) + c > MAX_INT64:
+            producto = producto.astype(object)
+        return producto + c
+
+# ==================== FLUJO CONGRUENCIAL ====================
+class CongruentialStream:
+    """Iterador perezoso y reanudable de un congruencial, con la interfaz de GenerationStream.
+
+    Nunca degenera (terminado solo cambia al llegar a n). `saltar` y `tramo` cuestan
+    O(log k) en lugar de k pasos: sirven para repartir una misma sucesión entre
+    varios procesos en tramos disjuntos.
+    """
+    BLOQUE_INTERNO = 4096
+
+    def __init__(self, metodo, semillas, parametros=None, n=None, tam_bloque=None, generados=0):
+        if metodo not in CongruentialGeneration.METODOS:
+            raise ValueError(f"Método desconocido: {metodo}")
+        semillas = tuple(int(s) for s in semillas)
+        self.parametros = CongruentialGeneration.validar(metodo, semillas, parametros)
+        self.metodo = metodo
+        self.semillas = semillas
+        self.constante = None
+        self.n = n
+        self.tam_bloque = tam_bloque
+        self.generados = generados
+        self.terminado = False
+        self.escala = CongruentialGeneration.escala(metodo, self.parametros)
+        self.digitos = len(str(self.escala - 1))
+        # (ri, estado) calculados por adelantado para __next__, del último al primero
+        self._bufer = []
+
+    @property
+    def estado(self):
+        """Estado serializable para reanudar más tarde"""
+        return {'metodo': self.metodo, 'semillas': list(self.semillas), 'parametros': self.parametros,
+                'n': self.n, 'generados': self.generados}
+
+    @classmethod
+    def reanudar(cls, estado, tam_bloque=None):
+        return cls(estado['metodo'], estado['semillas'], estado['parametros'], estado['n'], tam_bloque,
+                   estado['generados'])
+
+    @classmethod
+    def tramo(cls, metodo, semillas, parametros, inicio, cantidad=None, tam_bloque=None):
+        """Flujo de los números inicio+1 .. inicio+cantidad de la sucesión, sin generar los anteriores"""
+        flujo = cls(metodo, semillas, parametros, None if cantidad is None else inicio + cantidad, tam_bloque)
+        flujo.saltar(inicio)
+        return flujo
+
+    def traza(self, semillas, estrellas):
+        """Traza de `estrellas` generadas desde el estado `semillas`"""
+        return CongruentialTrace(self.metodo, semillas, estrellas, self.parametros)
+
+    def _restantes(self, cantidad):
+        if self.n is not None:
+            cantidad = min(cantidad, self.n - self.generados)
+        return max(cantidad, 0)
+
+    def estados(self, cantidad):
+        """Avanza hasta `cantidad` pasos y devuelve los valores como int64"""
+        cantidad = self._restantes(cantidad)
+        self._bufer = []
+        valores, self.semillas = CongruentialGeneration.estados(self.metodo, self.semillas, self.parametros,
+                                                                cantidad)
+        self.generados += cantidad
+        self.terminado = self.n is not None and self.generados >= self.n
+        return valores
+
+    def bloque(self, cantidad):
+        """Siguientes `cantidad` números como float64 (vacío cuando se agota)"""
+        return self.estados(cantidad) / float(self.escala)
+
+    def saltar(self, cantidad):
+        """Descarta `cantidad` números en O(log cantidad)"""
+        cantidad = self._restantes(cantidad)
+        self.semillas = CongruentialGeneration.saltar(self.metodo, self.semillas, self.parametros, cantidad)
+        self.generados += cantidad
+        self.terminado = self.n is not None and self.generados >= self.n
+        self._bufer = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.tam_bloque:
+            valores = self.bloque(self.tam_bloque)
+            if not len(valores):
+                raise StopIteration
+            return valores
+        if not self._bufer:
+            # Se calcula por bloques sin avanzar: el estado público sigue a lo entregado
+            salidas = CongruentialGeneration._salidas(self.metodo, self.semillas, self.parametros,
+                                                      self._restantes(self.BLOQUE_INTERNO))
+            valores = CongruentialGeneration._combinar(self.metodo, self.parametros, salidas) / float(self.escala)
+            self._bufer = list(zip(valores.tolist(), zip(*(s.tolist() for s in salidas))))[::-1]
+            if not self._bufer:
+                raise StopIteration
+        valor, self.semillas = self._bufer.pop()
+        self.generados += 1
+        self.terminado = self.n is not None and self.generados >= self.n
+        return valor
@@ -0,0 +1,146 @@
+"""Valores críticos de la normal y la chi-cuadrado"""
+import math
+from functools import lru_cache
+
+# ==================== VALORES CRÍTICOS ====================
+class CriticalValues:
+    """Percentiles exactos (a precisión de máquina) de la normal y la chi-cuadrado.
+
+    Los valores de los niveles y grados de libertad más usados se precalculan en
+    una tabla la primera vez que se piden; el resto se memoriza en una caché acotada.
+    """
+    PROBABILIDADES_TABLA = (0.005, 0.01, 0.025, 0.05, 0.1, 0.9, 0.95, 0.975, 0.99, 0.995)
+    MAX_GL_TABLA = 100
+    # Por encima de estos grados de libertad Wilson-Hilferty ya tiene error relativo < 1e-9
+    MAX_GL_EXACTO = 10 ** 6
+    _tabla_chi2 = None
+
+    # Coeficientes de la aproximación racional de Acklam
+    _A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+          1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+    _B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+          6.680131188771972e+01, -1.328068155288572e+01)
+    _C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+          -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+    _D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+          3.754408661907416e+00)
+
+    @staticmethod
+    def _clave(p):
+        return round(p, 12)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def norm_ppf(p):
+        """Percentil de la normal estándar: Acklam más un paso de Halley con erfc"""
+        if not 0 < p < 1:
+            raise ValueError("La probabilidad debe estar entre 0 y 1")
+        a, b, c, d = CriticalValues._A, CriticalValues._B, CriticalValues._C, CriticalValues._D
+        if p < 0.02425:
+            q = math.sqrt(-2 * math.log(p))
+            x = (((((c[0]*q + c[1])*q + c[2])*q + c[3])*q + c[4])*q + c[5]) / \
+                ((((d[0]*q + d[1])*q + d[2])*q + d[3])*q + 1)
+        elif p > 1 - 0.02425:
+            q = math.sqrt(-2 * math.log(1 - p))
+            x = -(((((c[0]*q + c[1])*q + c[2])*q + c[3])*q + c[4])*q + c[5]) / \
+                ((((d[0]*q + d[1])*q + d[2])*q + d[3])*q + 1)
+        else:
+            q = p - 0.5
+            r = q * q
+            x = (((((a[0]*r + a[1])*r + a[2])*r + a[3])*r + a[4])*r + a[5])*q / \
+                (((((b[0]*r + b[1])*r + b[2])*r + b[3])*r + b[4])*r + 1)
+        e = 0.5 * math.erfc(-x / math.sqrt(2)) - p
+        u = e * math.sqrt(2 * math.pi) * math.exp(x * x / 2)
+        return x - u / (1 + x * u / 2)
+
+    @staticmethod
+    def _gamma_regularizada(a, x):
+        """P(a, x), función gamma incompleta inferior regularizada"""
+        if x <= 0:
+            return 0.0
+        log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+        if x < a + 1:
+            termino = suma = 1.0 / a
+            ap = a
+            while abs(termino) > abs(suma) * 1e-16:
+                ap += 1
+                termino *= x / ap
+                suma += termino
+            return suma * math.exp(log_prefactor)
+        # Fracción continua de Lentz para Q(a, x)
+        diminuto = 1e-300
+        b = x + 1 - a
+        c = 1 / diminuto
+        d = 1 / b
+        h = d
+        i = 0
+        while True:
+            i += 1
+            an = -i * (i - a)
+            b += 2
+            d = an * d + b
+            d = diminuto if abs(d) < diminuto else d
+            c = b + an / c
+            c = diminuto if abs(c) < diminuto else c
+            d = 1 / d
+            delta = d * c
+            h *= delta
+            if abs(delta - 1) < 1e-16 or i > 10 ** 6:
+                break
+        return 1 - math.exp(log_prefactor) * h
+
+    @staticmethod
+    def _wilson_hilferty(p, df):
+        return df * (1 - 2/(9*df) + CriticalValues.norm_ppf(p) * math.sqrt(2/(9*df))) ** 3
+
+    @staticmethod
+    def _chi2_exacto(p, df):
+        """Invierte la CDF de chi-cuadrado con Newton protegido por bisección"""
+        k = df / 2
+        log_norm = -k * math.log(2) - math.lgamma(k)
+        x = max(CriticalValues._wilson_hilferty(p, df), 1e-8)
+        inferior, superior = 0.0, math.inf
+        for _ in range(200):
+            error = CriticalValues._gamma_regularizada(k, x / 2) - p
+            if error > 0:
+                superior = min(superior, x)
+            else:
+                inferior = max(inferior, x)
+            densidad = math.exp((k - 1) * math.log(x) - x / 2 + log_norm)
+            siguiente = x - error / densidad if densidad > 0 else math.nan
+            if not inferior < siguiente < superior:
+                siguiente = (inferior + superior) / 2 if superior < math.inf else 2 * x
+            if abs(siguiente - x) <= 1e-15 * x:
+                return siguiente
+            x = siguiente
+        return x
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _chi2_calculado(p, df):
+        if df > CriticalValues.MAX_GL_EXACTO:
+            return CriticalValues._wilson_hilferty(p, df)
+        return CriticalValues._chi2_exacto(p, df)
+
+    @staticmethod
+    def _tabla():
+        if CriticalValues._tabla_chi2 is None:
+            CriticalValues._tabla_chi2 = {
+                (CriticalValues._clave(p), df): CriticalValues._chi2_exacto(p, df)
+                for p in CriticalValues.PROBABILIDADES_TABLA
+                for df in range(1, CriticalValues.MAX_GL_TABLA + 1)
+            }
+        return CriticalValues._tabla_chi2
+
+    @staticmethod
+    def chi2_ppf(p, df):
+        """Percentil p de la chi-cuadrado con df grados de libertad"""
+        if not 0 < p < 1:
+            raise ValueError("La probabilidad debe estar entre 0 y 1")
+        if df < 1:
+            raise ValueError("Los grados de libertad deben ser al menos 1")
+        clave = (CriticalValues._clave(p), df)
+        valor = CriticalValues._tabla().get(clave)
+        if valor is None:
+            valor = CriticalValues._chi2_calculado(*clave)
+        return valor
@@ -0,0 +1,86 @@
+"""Extracción de los dígitos del medio"""
+import numpy as np
+
+# ==================== EXTRACCIÓN ARITMÉTICA DE DÍGITOS ====================
+# Potencias de 10 precalculadas y cantidad de dígitos del menor entero con b bits
+_MAX_DIGITOS_TABLA = 64
+_POTENCIAS_10 = [10 ** k for k in range(_MAX_DIGITOS_TABLA + 2)]
+_DIGITOS_POR_BITS = [1] + [len(str(1 << (b - 1))) for b in range(1, int(_MAX_DIGITOS_TABLA * 3.33))]
+_POTENCIAS_10_INT64 = np.array(_POTENCIAS_10[:19], dtype=np.int64)
+MAX_INT64 = np.iinfo(np.int64).max
+# Anchos de dígitos del medio: pares, y los yi* deben caber en int64
+MAX_DIGITOS = 18
+# Mayor ancho cuyo producto de dos valores cabe en int64 (camino vectorizado)
+MAX_DIGITOS_VEC = 8
+
+class DigitExtraction:
+    """Extracción de los dígitos del medio usando solo aritmética entera.
+
+    El ancho (`digitos`) es 4 por defecto y puede ser cualquier par hasta
+    MAX_DIGITOS; las versiones vectorizadas necesitan que los productos quepan en
+    int64 (anchos de hasta 8 dígitos al cuadrado).
+    """
+
+    @staticmethod
+    def validar_ancho(digitos):
+        if not (isinstance(digitos, (int, np.integer)) and 2 <= digitos <= MAX_DIGITOS and digitos % 2 == 0):
+            raise ValueError(f"El ancho de dígitos debe ser par, entre 2 y {MAX_DIGITOS}")
+        return int(digitos)
+
+    @staticmethod
+    def longitud(v):
+        """Cantidad de dígitos decimales de un entero no negativo"""
+        bits = v.bit_length()
+        if bits >= len(_DIGITOS_POR_BITS):
+            return len(str(v))
+        digitos = _DIGITOS_POR_BITS[bits]
+        if v >= _POTENCIAS_10[digitos]:
+            digitos += 1
+        return digitos
+
+    @staticmethod
+    def medio_par(v, digitos=4):
+        """`digitos` dígitos del medio completando con un cero a la izquierda si la longitud es impar"""
+        modulo = _POTENCIAS_10[digitos]
+        if v < modulo:
+            return v
+        longitud = DigitExtraction.longitud(v)
+        longitud += longitud & 1
+        desplazamiento = (longitud - digitos) // 2
+        if desplazamiento < len(_POTENCIAS_10):
+            return v // _POTENCIAS_10[desplazamiento] % modulo
+        return v // 10 ** desplazamiento % modulo
+
+    @staticmethod
+    def medio_centrado(v, digitos=4):
+        """`digitos` dígitos del medio completando con ceros hasta `digitos` dígitos"""
+        modulo = _POTENCIAS_10[digitos]
+        if v < modulo:
+            return v
+        longitud = DigitExtraction.longitud(v)
+        desplazamiento = longitud - (longitud - digitos) // 2 - digitos
+        if desplazamiento < len(_POTENCIAS_10):
+            return v // _POTENCIAS_10[desplazamiento] % modulo
+        return v // 10 ** desplazamiento % modulo
+
+    @staticmethod
+    def longitud_vec(v):
+        """Cantidad de dígitos de cada elemento de un arreglo int64 no negativo (0 tiene 1)"""
+        return np.maximum(np.searchsorted(_POTENCIAS_10_INT64, v, side='right'), 1)
+
+    @staticmethod
+    def medio_par_vec(v, digitos=4):
+        """Versión vectorizada de medio_par para arreglos int64"""
+        modulo = _POTENCIAS_10[digitos]
+        longitud = DigitExtraction.longitud_vec(v)
+        longitud += longitud & 1
+        desplazamiento = np.maximum((longitud - digitos) // 2, 0)
+        return np.where(v < modulo, v, v // _POTENCIAS_10_INT64[desplazamiento] % modulo)
+
+    @staticmethod
+    def medio_centrado_vec(v, digitos=4):
+        """Versión vectorizada de medio_centrado para arreglos int64"""
+        modulo = _POTENCIAS_10[digitos]
+        longitud = np.maximum(DigitExtraction.longitud_vec(v), digitos)
+        desplazamiento = longitud - (longitud - digitos) // 2 - digitos
+        return np.where(v < modulo, v, v // _POTENCIAS_10_INT64[desplazamiento] % modulo)
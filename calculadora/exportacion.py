@@ -0,0 +1,178 @@
+"""Exportación por bloques de la generación a CSV, .npy y binario compacto, y lectura de archivos de números"""
+import csv
+import json
+import os
+
+import numpy as np
+
+# ==================== EXPORTACIÓN POR BLOQUES ====================
+class StreamExport:
+    """Escribe un GenerationStream a disco bloque a bloque, sin juntar la sucesión en memoria.
+
+    Todos los exportadores aceptan `continuar`, una función sin argumentos que se
+    consulta antes de cada bloque; si devuelve False la exportación se corta y el
+    archivo queda válido con lo escrito hasta ahí. Devuelven la cantidad de números
+    escritos. `abrir_numeros` y `bloques_archivo` hacen el camino inverso, también
+    para archivos producidos por otros generadores.
+    """
+    TAM_BLOQUE = 65536
+    MAGICO = b'CALCRND\x00'
+    VERSION = 1
+    # Cabecera JSON de largo fijo para poder reescribir n al terminar
+    LARGO_CABECERA = 512
+
+    @staticmethod
+    def bloques(flujo, tam_bloque=TAM_BLOQUE, continuar=None):
+        """(inicio, traza del bloque): la traza se arma desde el estado previo al bloque.
+
+        `flujo` es un GenerationStream o un CongruentialStream.
+        """
+        while continuar is None or continuar():
+            semillas, inicio = flujo.semillas, flujo.generados
+            estrellas = flujo.estados(tam_bloque)
+            if not len(estrellas):
+                return
+            yield inicio, flujo.traza(semillas, estrellas)
+
+    @staticmethod
+    def csv(flujo, destino, columnas=('iteracion', 'ri'), tam_bloque=TAM_BLOQUE, continuar=None):
+        """CSV con las columnas pedidas de la traza; destino es una ruta o un archivo de texto abierto"""
+        if isinstance(destino, str):
+            with open(destino, 'w', encoding='utf-8', newline='') as salida:
+                return StreamExport.csv(flujo, salida, columnas, tam_bloque, continuar)
+
+        escritor = csv.writer(destino, lineterminator='\n')
+        escritor.writerow(columnas)
+        escritos = 0
+        for inicio, traza in StreamExport.bloques(flujo, tam_bloque, continuar):
+            datos = [traza.columna(c).tolist() for c in columnas if c != 'iteracion']
+            if 'iteracion' in columnas:
+                datos.insert(columnas.index('iteracion'), range(inicio + 1, inicio + len(traza) + 1))
+            escritor.writerows(zip(*datos))
+            escritos += len(traza)
+        return escritos
+
+    @staticmethod
+    def npy(flujo, ruta, tam_bloque=TAM_BLOQUE, continuar=None):
+        """Los ri como .npy float64 de una dimensión (se puede abrir con np.load(mmap_mode='r'))"""
+        with open(ruta, 'wb') as salida:
+            # La forma se desconoce hasta el final: se reserva la cabecera y se reescribe
+            np.lib.format.write_array_header_1_0(salida, StreamExport._cabecera_npy(0))
+            inicio_datos = salida.tell()
+            escritos = 0
+            for _, traza in StreamExport.bloques(flujo, tam_bloque, continuar):
+                salida.write(traza.ri.astype('<f8').tobytes())
+                escritos += len(traza)
+            salida.seek(0)
+            np.lib.format.write_array_header_1_0(salida, StreamExport._cabecera_npy(escritos))
+            if salida.tell() != inicio_datos:
+                raise ValueError("La cabecera .npy cambió de tamaño al reescribirla")
+        return escritos
+
+    @staticmethod
+    def _cabecera_npy(n):
+        # La cabecera de NumPy se rellena a 64 bytes: n de 0 a 20 dígitos cabe en el mismo largo
+        return {'descr': '<f8', 'fortran_order': False, 'shape': (n,)}
+
+    @staticmethod
+    def _dtype_estrellas(escala):
+        """Entero sin signo más chico que guarda valores de 0 a escala - 1"""
+        if escala <= 1 << 16:
+            return '<u2'
+        return '<u4' if escala <= 1 << 32 else '<u8'
+
+    @staticmethod
+    def binario(flujo, ruta, tam_bloque=TAM_BLOQUE, continuar=None):
+        """Formato compacto: MAGICO, versión, cabecera JSON (método, semillas, constante, dígitos, n) y los yi*.
+
+        Con 4 dígitos cada número ocupa 2 bytes (uint16) en lugar de 8; hasta 8 dígitos
+        (o módulos hasta 2^32), 4 bytes. ri = yi* / escala.
+        """
+        dtype = StreamExport._dtype_estrellas(flujo.escala)
+        metadatos = {'metodo': flujo.metodo, 'semillas': list(flujo.semillas), 'constante': flujo.constante,
+                     'digitos': flujo.digitos, 'n': 0, 'dtype': dtype, 'escala': flujo.escala}
+        parametros = getattr(flujo, 'parametros', None)
+        if parametros is not None:
+            metadatos['parametros'] = parametros
+        with open(ruta, 'wb') as salida:
+            StreamExport._escribir_cabecera(salida, metadatos)
+            for _, traza in StreamExport.bloques(flujo, tam_bloque, continuar):
+                salida.write(traza.estrellas.astype(dtype).tobytes())
+                metadatos['n'] += len(traza)
+            salida.seek(0)
+            StreamExport._escribir_cabecera(salida, metadatos)
+        return metadatos['n']
+
+    @staticmethod
+    def _escribir_cabecera(salida, metadatos):
+        texto = json.dumps(metadatos).encode('utf-8')
+        if len(texto) > StreamExport.LARGO_CABECERA - len(StreamExport.MAGICO) - 1:
+            raise ValueError("Metadatos demasiado largos para la cabecera")
+        salida.write(StreamExport.MAGICO + bytes((StreamExport.VERSION,)))
+        salida.write(texto.ljust(StreamExport.LARGO_CABECERA - len(StreamExport.MAGICO) - 1))
+
+    @staticmethod
+    def leer_binario(ruta):
+        """(metadatos, yi* como memmap de solo lectura con el dtype de la cabecera) de un archivo escrito por `binario`"""
+        with open(ruta, 'rb') as entrada:
+            inicio = entrada.read(StreamExport.LARGO_CABECERA)
+        if inicio[:len(StreamExport.MAGICO)] != StreamExport.MAGICO:
+            raise ValueError(f"{ruta} no es un archivo binario de la calculadora")
+        if inicio[len(StreamExport.MAGICO)] != StreamExport.VERSION:
+            raise ValueError(f"Versión de archivo no soportada: {inicio[len(StreamExport.MAGICO)]}")
+        metadatos = json.loads(inicio[len(StreamExport.MAGICO) + 1:].decode('utf-8'))
+        if not metadatos['n']:
+            return metadatos, np.empty(0, dtype=metadatos['dtype'])
+        estrellas = np.memmap(ruta, dtype=metadatos['dtype'], mode='r',
+                              offset=StreamExport.LARGO_CABECERA, shape=(metadatos['n'],))
+        return metadatos, estrellas
+
+    @staticmethod
+    def exportar(flujo, ruta, formato=None, columnas=('iteracion', 'ri'), tam_bloque=TAM_BLOQUE, continuar=None):
+        """Elige el exportador por `formato` ('csv', 'npy', 'bin') o por la extensión de la ruta"""
+        formato = formato or ruta.rsplit('.', 1)[-1].lower()
+        if formato == 'csv':
+            return StreamExport.csv(flujo, ruta, columnas, tam_bloque, continuar)
+        if formato == 'npy':
+            return StreamExport.npy(flujo, ruta, tam_bloque, continuar)
+        if formato == 'bin':
+            return StreamExport.binario(flujo, ruta, tam_bloque, continuar)
+        raise ValueError(f"Formato de exportación desconocido: {formato}")
+
+    @staticmethod
+    def abrir_numeros(ruta):
+        """Mapea en memoria un archivo de números sin leerlo: (arreglo, escala).
+
+        Acepta .npy (cualquier dtype numérico), el binario compacto de `binario`
+        (yi* con la escala de su cabecera) y, para cualquier otra extensión, float64 crudo
+        little-endian. Los números son arreglo / escala.
+        """
+        with open(ruta, 'rb') as entrada:
+            inicio = entrada.read(len(StreamExport.MAGICO))
+        if inicio == StreamExport.MAGICO:
+            metadatos, estrellas = StreamExport.leer_binario(ruta)
+            return estrellas, metadatos['escala']
+        if ruta.lower().endswith('.npy'):
+            arreglo = np.load(ruta, mmap_mode='r')
+            if arreglo.ndim != 1:
+                arreglo = arreglo.reshape(-1)
+            return arreglo, 1
+        tamano = os.path.getsize(ruta)
+        if tamano % 8:
+            raise ValueError(f"{ruta}: el tamaño no es múltiplo de 8 bytes, no es float64 crudo")
+        if not tamano:
+            return np.empty(0, dtype=np.float64), 1
+        return np.memmap(ruta, dtype='<f8', mode='r'), 1
+
+    @staticmethod
+    def bloques_archivo(ruta, tam_bloque=TAM_BLOQUE, continuar=None):
+        """Números del archivo como bloques float64; con float64 en disco son vistas sin copia"""
+        arreglo, escala = StreamExport.abrir_numeros(ruta)
+        for inicio in range(0, len(arreglo), tam_bloque):
+            if continuar is not None and not continuar():
+                return
+            bloque = arreglo[inicio:inicio + tam_bloque]
+            if escala == 1:
+                yield bloque.astype(np.float64, copy=False)
+            else:
+                yield bloque / float(escala)
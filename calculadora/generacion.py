@@ -0,0 +1,627 @@
+"""Generación de números pseudoaleatorios"""
+import math
+import threading
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+
+from .ciclos import CycleDetection, SuccessorTables, ESTADOS, MAX_CONSTANTE_TABLA, MAX_PASOS_CICLO
+from .congruencial import CongruentialGeneration, CongruentialTrace
+from .digitos import DigitExtraction, MAX_DIGITOS_VEC, MAX_INT64
+from .perfil import Profiler
+from .traza import GenerationTrace
+
+# ==================== CLASE PARA GENERACIÓN DE NÚMEROS ====================
+class NumberGeneration:
+    @staticmethod
+    def _validar_enteros(**valores):
+        for nombre, valor in valores.items():
+            if valor < 0:
+                raise ValueError(f"La {nombre} debe ser un entero no negativo")
+
+    @staticmethod
+    def _valores(estados):
+        """Vista int64 de los yi* generados.
+
+        Los bucles agregan a un array('q') que crece por tramos: no se reserva n de
+        antemano, así una sucesión que degenera o se corta pronto no paga 8n bytes.
+        """
+        return np.frombuffer(estados, dtype=np.int64)
+
+    @staticmethod
+    @Profiler.medido('generacion.estados.cuadrados_medios')
+    def _estados_cuadrados_medios(semilla, n, digitos=4):
+        medio_par = DigitExtraction.medio_par
+        tabla = SuccessorTables.lista('cuadrados_medios') if digitos == 4 else ()
+        limite = len(tabla)
+        estados = array('q')
+        agregar = estados.append
+        x = semilla
+        cantidad = 0
+        while cantidad < n:
+            x = tabla[x] if x < limite else medio_par(x * x, digitos)
+            agregar(x)
+            cantidad += 1
+            if x == 0:
+                break
+        Profiler.contar('generacion.numeros', cantidad)
+        return NumberGeneration._valores(estados)
+
+    @staticmethod
+    @Profiler.medido('generacion.estados.productos_medios')
+    def _estados_productos_medios(semilla1, semilla2, n, digitos=4):
+        medio_centrado = DigitExtraction.medio_centrado
+        estados = array('q')
+        agregar = estados.append
+        x0 = semilla1
+        x1 = semilla2
+        cantidad = 0
+        while cantidad < n:
+            x0, x1 = x1, medio_centrado(x0 * x1, digitos)
+            agregar(x1)
+            cantidad += 1
+            if x1 == 0:
+                break
+        Profiler.contar('generacion.numeros', cantidad)
+        return NumberGeneration._valores(estados)
+
+    @staticmethod
+    @Profiler.medido('generacion.estados.multiplicador_constante')
+    def _estados_multiplicador_constante(semilla, constante, n, digitos=4):
+        medio_par = DigitExtraction.medio_par
+        if not SuccessorTables.disponible('multiplicador_constante', constante, digitos):
+            tabla = ()
+        else:
+            tabla = SuccessorTables.lista('multiplicador_constante', constante)
+        limite = len(tabla)
+        estados = array('q')
+        agregar = estados.append
+        x = semilla
+        cantidad = 0
+        while cantidad < n:
+            x = tabla[x] if x < limite else medio_par(constante * x, digitos)
+            agregar(x)
+            cantidad += 1
+            if x == 0:
+                break
+        Profiler.contar('generacion.numeros', cantidad)
+        return NumberGeneration._valores(estados)
+
+    @staticmethod
+    def _estados(metodo, semillas, constante, n, digitos=4):
+        """n yi* desde las semillas con el bucle escalar del método, sin caché"""
+        if metodo == 'cuadrados_medios':
+            return NumberGeneration._estados_cuadrados_medios(semillas[0], n, digitos)
+        if metodo == 'productos_medios':
+            return NumberGeneration._estados_productos_medios(semillas[0], semillas[1], n, digitos)
+        return NumberGeneration._estados_multiplicador_constante(semillas[0], constante, n, digitos)
+
+    @staticmethod
+    def _resultado(traza, con_historial):
+        if not con_historial:
+            return traza.ri, None
+        return traza.ri.tolist(), traza
+
+    @staticmethod
+    def _ciclo(metodo, semillas, constante, n, detener_en_ciclo, digitos=4):
+        """Detecta el ciclo si se pidió cortar la generación al repetirse; devuelve (ciclo, n efectivo).
+
+        Si el ciclo no se cierra en MAX_PASOS_CICLO pasos no se corta nada y el ciclo es None.
+        """
+        n = max(n, 0)
+        if not detener_en_ciclo:
+            return None, n
+        ciclo = CycleDetection.detectar(metodo, semillas, constante, MAX_PASOS_CICLO, digitos)
+        if ciclo is None:
+            return None, n
+        return ciclo, min(n, CycleDetection.limite_sin_repetir(ciclo))
+
+    @staticmethod
+    @Profiler.medido('generacion.cuadrados_medios')
+    def cuadrados_medios(semilla, n, con_historial=True, detener_en_ciclo=False, digitos=4):
+        """Genera n números; con_historial=False devuelve (ndarray de ri, None) sin construir la traza.
+
+        Con detener_en_ciclo=True se corta antes de repetir un estado y la traza guarda el ciclo.
+        `digitos` es el ancho de los dígitos del medio (par, 4 por defecto).
+        """
+        NumberGeneration._validar_enteros(semilla=semilla)
+        digitos = DigitExtraction.validar_ancho(digitos)
+        ciclo, n = NumberGeneration._ciclo('cuadrados_medios', (semilla,), None, n, detener_en_ciclo, digitos)
+        estrellas = GenerationCache.estados('cuadrados_medios', (semilla,), None, n, digitos)
+        traza = GenerationTrace('cuadrados_medios', (semilla,), estrellas, ciclo=ciclo, digitos=digitos)
+        return NumberGeneration._resultado(traza, con_historial)
+
+    @staticmethod
+    @Profiler.medido('generacion.productos_medios')
+    def productos_medios(semilla1, semilla2, n, con_historial=True, detener_en_ciclo=False, digitos=4):
+        """Genera n números; con_historial=False devuelve (ndarray de ri, None) sin construir la traza.
+
+        Con detener_en_ciclo=True se corta antes de repetir un estado y la traza guarda el ciclo.
+        `digitos` es el ancho de los dígitos del medio (par, 4 por defecto).
+        """
+        NumberGeneration._validar_enteros(semilla1=semilla1, semilla2=semilla2)
+        digitos = DigitExtraction.validar_ancho(digitos)
+        ciclo, n = NumberGeneration._ciclo('productos_medios', (semilla1, semilla2), None, n, detener_en_ciclo,
+                                           digitos)
+        estrellas = GenerationCache.estados('productos_medios', (semilla1, semilla2), None, n, digitos)
+        traza = GenerationTrace('productos_medios', (semilla1, semilla2), estrellas, ciclo=ciclo, digitos=digitos)
+        return NumberGeneration._resultado(traza, con_historial)
+
+    @staticmethod
+    @Profiler.medido('generacion.multiplicador_constante')
+    def multiplicador_constante(semilla, constante, n, con_historial=True, detener_en_ciclo=False, digitos=4):
+        """Genera n números; con_historial=False devuelve (ndarray de ri, None) sin construir la traza.
+
+        Con detener_en_ciclo=True se corta antes de repetir un estado y la traza guarda el ciclo.
+        `digitos` es el ancho de los dígitos del medio (par, 4 por defecto).
+        """
+        NumberGeneration._validar_enteros(semilla=semilla, constante=constante)
+        digitos = DigitExtraction.validar_ancho(digitos)
+        ciclo, n = NumberGeneration._ciclo('multiplicador_constante', (semilla,), constante, n, detener_en_ciclo,
+                                           digitos)
+        estrellas = GenerationCache.estados('multiplicador_constante', (semilla,), constante, n, digitos)
+        traza = GenerationTrace('multiplicador_constante', (semilla,), estrellas, constante, ciclo, digitos)
+        return NumberGeneration._resultado(traza, con_historial)
+
+    # ==================== GENERADORES CONGRUENCIALES ====================
+    @staticmethod
+    def _congruencial(metodo, semillas, parametros, n, con_historial):
+        parametros = CongruentialGeneration.validar(metodo, semillas, parametros)
+        estrellas, _ = CongruentialGeneration.estados(metodo, semillas, parametros, n)
+        ciclo = CongruentialGeneration.ciclo(metodo, parametros)
+        traza = CongruentialTrace(metodo, semillas, estrellas, parametros, ciclo)
+        return NumberGeneration._resultado(traza, con_historial)
+
+    @staticmethod
+    @Profiler.medido('generacion.congruencial_lineal')
+    def congruencial_lineal(semilla, a, c, m, n, con_historial=True):
+        """x_{i+1} = (a*x_i + c) mod m y ri = x_{i+1} / m, por bloques vectorizados.
+
+        Devuelve lo mismo que los métodos de dígitos medios; la traza es una
+        CongruentialTrace y guarda el periodo cuando se puede asegurar (Hull-Dobell).
+        """
+        return NumberGeneration._congruencial('congruencial_lineal', (semilla,), (a, c, m), n, con_historial)
+
+    @staticmethod
+    @Profiler.medido('generacion.congruencial_multiplicativo')
+    def congruencial_multiplicativo(semilla, a, m, n, con_historial=True):
+        """x_{i+1} = a*x_i mod m y ri = x_{i+1} / m; la semilla no puede ser 0"""
+        return NumberGeneration._congruencial('congruencial_multiplicativo', (semilla,), (a, m), n, con_historial)
+
+    @staticmethod
+    @Profiler.medido('generacion.congruencial_combinado')
+    def congruencial_combinado(semilla1, semilla2, n, con_historial=True):
+        """Combinado de L'Ecuyer: z = (x1 - x2) mod (m1 - 1), ri = z / m1 (z = 0 se toma como m1 - 1)"""
+        return NumberGeneration._congruencial('congruencial_combinado', (semilla1, semilla2), None, n,
+                                              con_historial)
+
+    # ==================== GENERACIÓN POR LOTES ====================
+    @staticmethod
+    def _arreglo_semillas(nombre, valores, limite):
+        valores = np.atleast_1d(np.asarray(valores, dtype=np.int64))
+        if valores.size and valores.min() < 0:
+            raise ValueError(f"Las {nombre} deben ser enteros no negativos")
+        if valores.size and valores.max() > limite:
+            raise ValueError(f"Las {nombre} deben ser menores que {limite + 1} para el cálculo por lotes")
+        return valores
+
+    @staticmethod
+    def _ancho_lote(digitos):
+        digitos = DigitExtraction.validar_ancho(digitos)
+        if digitos > MAX_DIGITOS_VEC:
+            raise ValueError(f"El cálculo por lotes admite hasta {MAX_DIGITOS_VEC} dígitos")
+        return digitos
+
+    @staticmethod
+    def _lote(avanzar, estado, filas, n, digitos=4):
+        """Avanza todas las filas a la vez; devuelve (numeros, validos) de forma (filas, n).
+
+        validos[i, j] es False después de que la fila i generó un 0, igual que el
+        corte de los métodos individuales; ahí numeros vale NaN.
+        """
+        n = max(n, 0)
+        estrellas = np.zeros((n, filas), dtype=np.int64)
+        validos = np.zeros((n, filas), dtype=bool)
+        activos = np.ones(filas, dtype=bool)
+        for j in range(n):
+            if not activos.any():
+                break
+            estado, estrella = avanzar(estado)
+            estrellas[j] = estrella
+            validos[j] = activos
+            activos &= estrella != 0
+        numeros = np.where(validos, estrellas / float(10 ** digitos), np.nan)
+        return np.ascontiguousarray(numeros.T), np.ascontiguousarray(validos.T)
+
+    @staticmethod
+    @Profiler.medido('generacion.lote_cuadrados_medios')
+    def lote_cuadrados_medios(semillas, n, digitos=4):
+        """Cuadrados medios para un arreglo de semillas en paralelo (hasta MAX_DIGITOS_VEC dígitos)"""
+        digitos = NumberGeneration._ancho_lote(digitos)
+        x = NumberGeneration._arreglo_semillas('semillas', semillas, math.isqrt(MAX_INT64))
+        tabla = SuccessorTables.cuadrados_medios() if digitos == 4 else None
+
+        def avanzar(x):
+            if tabla is not None and x.size and x.max() < ESTADOS:
+                x = tabla[x]
+            else:
+                x = DigitExtraction.medio_par_vec(x * x, digitos)
+            return x, x
+
+        return NumberGeneration._lote(avanzar, x, x.size, n, digitos)
+
+    @staticmethod
+    @Profiler.medido('generacion.lote_productos_medios')
+    def lote_productos_medios(semillas1, semillas2, n, digitos=4):
+        """Productos medios para arreglos de pares de semillas en paralelo (hasta MAX_DIGITOS_VEC dígitos)"""
+        digitos = NumberGeneration._ancho_lote(digitos)
+        x0 = NumberGeneration._arreglo_semillas('semillas', semillas1, math.isqrt(MAX_INT64))
+        x1 = NumberGeneration._arreglo_semillas('semillas', semillas2, math.isqrt(MAX_INT64))
+        x0, x1 = np.broadcast_arrays(x0, x1)
+
+        def avanzar(estado):
+            x0, x1 = estado
+            nuevo = DigitExtraction.medio_centrado_vec(x0 * x1, digitos)
+            return (x1, nuevo), nuevo
+
+        return NumberGeneration._lote(avanzar, (x0, x1), x0.size, n, digitos)
+
+    @staticmethod
+    @Profiler.medido('generacion.lote_multiplicador_constante')
+    def lote_multiplicador_constante(semillas, constantes, n, digitos=4):
+        """Multiplicador constante para arreglos de semillas y constantes (se difunden entre sí)"""
+        digitos = NumberGeneration._ancho_lote(digitos)
+        x = NumberGeneration._arreglo_semillas('semillas', semillas, math.isqrt(MAX_INT64))
+        c = NumberGeneration._arreglo_semillas('constantes', constantes, math.isqrt(MAX_INT64))
+        x, c = (np.array(a) for a in np.broadcast_arrays(x, c))
+        # Con pocas constantes distintas se avanza con una tabla 2-D (fila por constante)
+        unicas, fila = np.unique(c, return_inverse=True)
+        tabla = None
+        if digitos == 4 and unicas.size <= 1024 and unicas.max(initial=0) <= MAX_CONSTANTE_TABLA:
+            tabla = SuccessorTables.multiplicador_constantes(unicas).ravel()
+            fila = fila.ravel() * ESTADOS
+
+        def avanzar(x):
+            if tabla is not None and x.size and x.max() < ESTADOS:
+                x = tabla[fila + x]
+            else:
+                x = DigitExtraction.medio_par_vec(c * x, digitos)
+            return x, x
+
+        return NumberGeneration._lote(avanzar, x, x.size, n, digitos)
+
+# ==================== GENERACIÓN EN FLUJO ====================
+class GenerationStream:
+    """Iterador perezoso y reanudable sobre cualquiera de los tres métodos.
+
+    Sin tam_bloque produce un float por vez; con tam_bloque produce arreglos float64
+    de ese tamaño (el último puede ser más corto). n=None genera sin límite hasta
+    que la sucesión llegue a 0. El estado interno se puede guardar con `estado` y
+    retomar con `reanudar`.
+
+    Cuando quedan al menos MIN_TESELADO números por calcular y el ciclo de la
+    sucesión aparece pronto (siempre con las tablas de 4 dígitos), los valores se
+    sacan del tramo sin repetir con SequenceAccess en lugar del bucle escalar.
+    """
+    BLOQUE_INTERNO = 4096
+    MIN_TESELADO = 1 << 16
+
+    def __init__(self, metodo, semillas, constante=None, n=None, tam_bloque=None, generados=0, terminado=False,
+                 digitos=4):
+        if metodo not in GenerationTrace.COLUMNAS:
+            raise ValueError(f"Método desconocido: {metodo}")
+        digitos = DigitExtraction.validar_ancho(digitos)
+        semillas = tuple(semillas)
+        nombres = ('semilla',) if len(semillas) == 1 else ('semilla1', 'semilla2')
+        NumberGeneration._validar_enteros(**dict(zip(nombres, semillas)))
+        if constante is not None:
+            NumberGeneration._validar_enteros(constante=constante)
+        self.metodo = metodo
+        self.semillas = semillas
+        self.constante = constante
+        self.n = n
+        self.tam_bloque = tam_bloque
+        self.generados = generados
+        self.terminado = terminado
+        self.digitos = digitos
+        self.escala = 10 ** digitos
+        # yi* ya calculados pero aún no entregados, y el estado tras calcularlos
+        self._bufer = np.empty(0, dtype=np.int64)
+        self._posicion = 0
+        self._frontera = semillas
+        # SequenceAccess desde un estado pasado y cuántos yi* ya se sacaron de él
+        self._acceso = None
+        self._desfase = 0
+        self._teselar = True
+
+    @property
+    def estado(self):
+        """Estado serializable (dict de enteros) para reanudar más tarde"""
+        return {'metodo': self.metodo, 'semillas': list(self.semillas), 'constante': self.constante,
+                'n': self.n, 'generados': self.generados, 'terminado': self.terminado, 'digitos': self.digitos}
+
+    @classmethod
+    def reanudar(cls, estado, tam_bloque=None):
+        return cls(estado['metodo'], estado['semillas'], estado['constante'], estado['n'],
+                   tam_bloque, estado['generados'], estado['terminado'], estado.get('digitos', 4))
+
+    @classmethod
+    def tramo(cls, metodo, semillas, constante, inicio, cantidad=None, tam_bloque=None, digitos=4):
+        """Flujo de los números inicio+1 .. inicio+cantidad de la sucesión, sin generar los anteriores.
+
+        Sirve para repartir una misma sucesión entre varios procesos en tramos disjuntos.
+        """
+        flujo = cls(metodo, semillas, constante, None if cantidad is None else inicio + cantidad, tam_bloque,
+                    digitos=digitos)
+        flujo.saltar(inicio)
+        return flujo
+
+    def traza(self, semillas, estrellas):
+        """Traza de `estrellas` generadas desde el estado `semillas`"""
+        return GenerationTrace(self.metodo, semillas, estrellas, self.constante, digitos=self.digitos)
+
+    @staticmethod
+    def _siguiente_estado(semillas, estrellas):
+        return (semillas + tuple(int(e) for e in estrellas[-2:]))[-len(semillas):]
+
+    def _acceso_desde(self, semillas, max_pasos):
+        """SequenceAccess desde `semillas` si su ciclo aparece en max_pasos pasos; si no, None"""
+        return SequenceAccess.acotado(self.metodo, semillas, self.constante, self.digitos, max_pasos)
+
+    def _generar(self, cantidad):
+        """Calcula yi* desde la frontera sin entregarlos"""
+        if self._acceso is None and self._teselar and cantidad >= self.MIN_TESELADO:
+            # Buscar el ciclo cuesta a lo sumo una fracción de lo que se iba a generar
+            self._acceso, self._desfase = self._acceso_desde(self._frontera, cantidad // 8), 0
+            self._teselar = self._acceso is not None
+        if self._acceso is not None:
+            estrellas = self._acceso.estrellas(self._desfase, cantidad)
+            self._desfase += len(estrellas)
+            Profiler.contar('generacion.numeros', len(estrellas))
+        else:
+            estrellas = NumberGeneration._estados(self.metodo, self._frontera, self.constante, cantidad,
+                                                  self.digitos)
+        if len(estrellas):
+            self._frontera = self._siguiente_estado(self._frontera, estrellas)
+        return estrellas
+
+    def _restantes(self, cantidad):
+        if self.terminado:
+            return 0
+        if self.n is not None:
+            cantidad = min(cantidad, self.n - self.generados)
+        return max(cantidad, 0)
+
+    def estados(self, cantidad):
+        """Avanza hasta `cantidad` pasos y devuelve los yi* como int64"""
+        cantidad = self._restantes(cantidad)
+        estrellas = self._bufer[self._posicion:self._posicion + cantidad]
+        self._posicion += len(estrellas)
+        if len(estrellas) < cantidad and not (len(estrellas) and estrellas[-1] == 0):
+            estrellas = np.concatenate((estrellas, self._generar(cantidad - len(estrellas))))
+        if len(estrellas):
+            self.semillas = self._siguiente_estado(self.semillas, estrellas)
+            self.generados += len(estrellas)
+            self.terminado = bool(estrellas[-1] == 0)
+        return estrellas
+
+    def bloque(self, cantidad):
+        """Siguientes `cantidad` números como float64 (vacío cuando se agota)"""
+        return self.estados(cantidad) / self.escala
+
+    def saltar(self, cantidad):
+        """Descarta `cantidad` números sin devolverlos.
+
+        Los saltos largos no generan nada: el estado de destino sale de la cola y el
+        periodo de la sucesión (SequenceAccess). Si el ciclo no aparece en `cantidad`
+        pasos se avanza generando.
+        """
+        cantidad = self._restantes(cantidad)
+        acceso = self._acceso_desde(self.semillas, cantidad) if cantidad > self.BLOQUE_INTERNO else None
+        if acceso is not None:
+            if acceso.largo is not None:
+                cantidad = min(cantidad, acceso.largo)
+            self.semillas = self._frontera = acceso.estado(cantidad)
+            self.generados += cantidad
+            self.terminado = acceso.largo == cantidad
+            self._bufer = np.empty(0, dtype=np.int64)
+            self._posicion = 0
+            # Lo que siga se saca del mismo acceso
+            self._acceso, self._desfase = acceso, cantidad
+            return
+        while cantidad > 0:
+            avance = len(self.estados(min(cantidad, self.BLOQUE_INTERNO)))
+            if not avance:
+                break
+            cantidad -= avance
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.tam_bloque:
+            valores = self.bloque(self.tam_bloque)
+            if not len(valores):
+                raise StopIteration
+            return valores
+        if self._posicion >= len(self._bufer) and not self.terminado:
+            self._bufer = self._generar(self._restantes(self.BLOQUE_INTERNO))
+            self._posicion = 0
+        estrella = self.estados(1)
+        if not len(estrella):
+            raise StopIteration
+        return float(estrella[0]) / self.escala
+
+# ==================== CACHÉ DE CORRIDAS ====================
+class GenerationCache:
+    """Caché LRU de los yi* generados, por método, semillas, constante y ancho de dígitos.
+
+    Pedir menos números que los guardados devuelve un corte sin generar; pedir más
+    continúa desde el último estado guardado y solo genera lo que falta. Las
+    corridas se guardan como arreglos de solo lectura y se descartan las menos
+    usadas cuando el total supera PRESUPUESTO bytes.
+    """
+    PRESUPUESTO = 256 * 2 ** 20
+    activo = True
+    _corridas = OrderedDict()
+    _bytes = 0
+    _cerrojo = threading.Lock()
+
+    @staticmethod
+    def _clave(metodo, semillas, constante, digitos):
+        return metodo, tuple(int(s) for s in semillas), None if constante is None else int(constante), digitos
+
+    @staticmethod
+    def buscar(metodo, semillas, constante=None, digitos=4):
+        """yi* guardados para estos parámetros (vacío si no hay)"""
+        clave = GenerationCache._clave(metodo, semillas, constante, digitos)
+        with GenerationCache._cerrojo:
+            estrellas = GenerationCache._corridas.get(clave)
+            if estrellas is None:
+                return np.empty(0, dtype=np.int64)
+            GenerationCache._corridas.move_to_end(clave)
+            return estrellas
+
+    @staticmethod
+    def guardar(metodo, semillas, constante, estrellas, digitos=4):
+        """Guarda la corrida si es más larga que la que ya había; devuelve una vista de solo lectura"""
+        estrellas = np.asarray(estrellas, dtype=np.int64).view()
+        estrellas.setflags(write=False)
+        if not GenerationCache.activo or estrellas.nbytes > GenerationCache.PRESUPUESTO:
+            return estrellas
+        clave = GenerationCache._clave(metodo, semillas, constante, digitos)
+        with GenerationCache._cerrojo:
+            anterior = GenerationCache._corridas.get(clave)
+            if anterior is not None:
+                if len(anterior) >= len(estrellas):
+                    return estrellas
+                GenerationCache._bytes -= anterior.nbytes
+            GenerationCache._corridas[clave] = estrellas
+            GenerationCache._corridas.move_to_end(clave)
+            GenerationCache._bytes += estrellas.nbytes
+            while GenerationCache._bytes > GenerationCache.PRESUPUESTO:
+                _, descartada = GenerationCache._corridas.popitem(last=False)
+                GenerationCache._bytes -= descartada.nbytes
+        return estrellas
+
+    @staticmethod
+    def continuar(metodo, semillas, constante, n, digitos=4):
+        """(yi* guardados hasta n, GenerationStream por lo que falta o None si no falta nada)"""
+        if GenerationCache.activo:
+            previos = GenerationCache.buscar(metodo, semillas, constante, digitos)
+        else:
+            previos = np.empty(0, dtype=np.int64)
+        if len(previos) >= n or (len(previos) and previos[-1] == 0):
+            Profiler.contar('generacion.cache.reutilizados', min(len(previos), n))
+            return previos[:n], None
+        Profiler.contar('generacion.cache.reutilizados', len(previos))
+        frontera = GenerationStream._siguiente_estado(tuple(semillas), previos)
+        return previos, GenerationStream(metodo, frontera, constante, n - len(previos), digitos=digitos)
+
+    @staticmethod
+    def estados(metodo, semillas, constante, n, digitos=4):
+        """n yi* (menos si degenera a 0) reutilizando y ampliando la caché"""
+        previos, flujo = GenerationCache.continuar(metodo, semillas, constante, n, digitos)
+        if flujo is None:
+            return previos
+        nuevos = flujo.estados(flujo.n)
+        estrellas = np.concatenate((previos, nuevos)) if len(previos) else nuevos
+        return GenerationCache.guardar(metodo, semillas, constante, estrellas, digitos)
+
+    @staticmethod
+    def limpiar():
+        with GenerationCache._cerrojo:
+            GenerationCache._corridas.clear()
+            GenerationCache._bytes = 0
+
+    @staticmethod
+    def ocupado():
+        """(corridas guardadas, bytes que ocupan)"""
+        with GenerationCache._cerrojo:
+            return len(GenerationCache._corridas), GenerationCache._bytes
+
+# ==================== ACCESO DIRECTO POR ITERACIÓN ====================
+class SequenceAccess:
+    """Valor, fila de la traza y estado de cualquier iteración k sin recorrer las anteriores.
+
+    La sucesión de estados es finalmente periódica: tras `cola` pasos entra a un
+    ciclo de largo `periodo`. Se generan una sola vez los valores hasta justo antes
+    de que se repita un estado (con el bucle escalar del método, sin pasar por la
+    caché); cualquier k posterior se reduce a esa parte con aritmética modular. Si
+    la sucesión degenera a 0, `largo` es la cantidad de números que tiene (la
+    generación se corta en el 0); si no, `largo` es None.
+    """
+
+    def __init__(self, metodo, semillas, constante=None, digitos=4, ciclo=None):
+        if metodo not in GenerationTrace.COLUMNAS:
+            raise ValueError(f"Método desconocido: {metodo}")
+        self.metodo = metodo
+        self.semillas = tuple(int(s) for s in semillas)
+        self.constante = constante
+        self.digitos = DigitExtraction.validar_ancho(digitos)
+        nombres = ('semilla',) if len(self.semillas) == 1 else ('semilla1', 'semilla2')
+        NumberGeneration._validar_enteros(**dict(zip(nombres, self.semillas)))
+        if constante is not None:
+            NumberGeneration._validar_enteros(constante=constante)
+        if ciclo is None:
+            ciclo = CycleDetection.detectar(metodo, self.semillas, constante, MAX_PASOS_CICLO, self.digitos)
+        if ciclo is None:
+            raise ValueError(f"No se encontró el ciclo de la sucesión en {MAX_PASOS_CICLO} pasos")
+        self.ciclo = ciclo
+        self.prefijo = NumberGeneration._estados(metodo, self.semillas, constante,
+                                                 CycleDetection.limite_sin_repetir(self.ciclo), self.digitos)
+        # Al degenerar, la generación se corta en el 0 y el prefijo es la sucesión entera
+        self.largo = len(self.prefijo) if self.ciclo.degenera else None
+
+    @classmethod
+    def acotado(cls, metodo, semillas, constante=None, digitos=4, max_pasos=MAX_PASOS_CICLO):
+        """SequenceAccess si el ciclo se encuentra en max_pasos pasos (sin límite con las tablas); si no, None"""
+        ciclo = CycleDetection.detectar(metodo, tuple(semillas), constante, max_pasos, digitos)
+        return None if ciclo is None else cls(metodo, semillas, constante, digitos, ciclo)
+
+    def _reducir(self, k):
+        """Iteración equivalente a k dentro del prefijo"""
+        if k < 1:
+            raise IndexError("Las iteraciones empiezan en 1")
+        if self.largo is not None and k > self.largo:
+            raise IndexError(f"La sucesión degenera a 0 en la iteración {self.largo}")
+        limite, periodo = len(self.prefijo), self.ciclo.periodo
+        if k > limite:
+            k -= periodo * ((k - limite + periodo - 1) // periodo)
+        return k
+
+    def estrella(self, k):
+        """yi* de la iteración k (desde 1)"""
+        return int(self.prefijo[self._reducir(k) - 1])
+
+    def ri(self, k):
+        return self.estrella(k) / float(10 ** self.digitos)
+
+    def estrellas(self, inicio, cantidad):
+        """yi* de las iteraciones inicio+1 .. inicio+cantidad como int64 (se corta donde degenera)"""
+        if inicio < 0:
+            raise IndexError("Las iteraciones empiezan en 1")
+        fin = inicio + cantidad if self.largo is None else min(inicio + cantidad, self.largo)
+        k = np.arange(inicio + 1, max(fin, inicio) + 1, dtype=np.int64)
+        limite, periodo = len(self.prefijo), self.ciclo.periodo
+        k = np.where(k > limite, k - periodo * ((k - limite + periodo - 1) // periodo), k)
+        return self.prefijo[k - 1]
+
+    def _posicion(self, p):
+        """p-ésimo valor de la sucesión semillas + yi*"""
+        return self.semillas[p] if p < len(self.semillas) else self.estrella(p - len(self.semillas) + 1)
+
+    def estado(self, k):
+        """Estado tras generar k números: las semillas desde las que sigue la iteración k+1"""
+        if self.largo is not None and k > self.largo:
+            raise IndexError(f"La sucesión degenera a 0 en la iteración {self.largo}")
+        return tuple(self._posicion(p) for p in range(k, k + len(self.semillas)))
+
+    def fila(self, k):
+        """Fila de la traza de la iteración k, como las de GenerationTrace"""
+        estrella = self.estrella(k)
+        fila = GenerationTrace(self.metodo, self.estado(k - 1), np.array([estrella], dtype=np.int64), self.constante,
+                               digitos=self.digitos)[0]
+        fila['iteracion'] = k
+        return fila
@@ -0,0 +1,1470 @@
+"""Interfaz gráfica (tkinter); matplotlib se carga al abrir el histograma"""
+import os
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+from datetime import datetime
+
+import numpy as np
+
+from .bateria import TestBattery
+from .busqueda import ParameterSearch
+from .ciclos import MAX_PASOS_CICLO, CycleDetection, SuccessorTables
+from .congruencial import LECUYER, CongruentialGeneration, CongruentialStream, CongruentialTrace
+from .digitos import DigitExtraction
+from .exportacion import StreamExport
+from .generacion import GenerationCache, GenerationStream, SequenceAccess
+from .perfil import Profiler
+from .pruebas import StatisticalAccumulator, StatisticalTests
+from .traza import MAX_DIGITOS_CONTEOS, GenerationTrace
+
+# ==================== CLASE PRINCIPAL DE LA APLICACIÓN ====================
+class RandomNumberApp:
+    MAX_PASOS_CICLO = MAX_PASOS_CICLO
+    # Tamaño de bloque del hilo de generación, filas visibles de la tabla y milisegundos entre sondeos
+    TAM_BLOQUE = 16384
+    FILAS_TABLA = 15
+    INTERVALO_SONDEO = 50
+    # Milisegundos entre refrescos del panel de estadísticas de rendimiento
+    INTERVALO_ESTADISTICAS = 500
+    # Por encima de estos intervalos la línea observada del histograma se dibuja sin marcadores
+    MAX_MARCADORES = 50
+    ENCABEZADOS = {
+        'iteracion': "Iteración", 'yi': "Yi", 'yi0': "Yi (1)", 'yi1': "Yi (2)", 'constante': "Constante",
+        'yi_cuadrado': "Yi²", 'producto': "Producto", 'yi_estrella': "Yi*", 'ri': "Ri",
+        'xi': "Xi", 'afin': "aXi + c", 'xi_siguiente': "Xi+1", 'xi1': "X1", 'xi2': "X2", 'zi': "Zi",
+    }
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Sistema de Generación de Números Pseudoaleatorios")
+        self.root.geometry("1000x800")
+        self.root.configure(bg="#0a041a")
+        
+        # Estilo futurista
+        self.colors = {
+            "bg_dark": "#0a041a",
+            "bg_medium": "#1a0c38",
+            "bg_light": "#2a1460",
+            "accent": "#8a2be2",  # Violeta
+            "neon": "#bf00ff",    # Magenta neón
+            "text": "#ffffff",
+            "highlight": "#00ffff"  # Cian neón
+        }
+        
+        # Configurar estilo
+        self.setup_styles()
+        
+        # Variables para almacenar parámetros
+        self.n = tk.IntVar(value=15)
+        self.confianza_medias = tk.DoubleVar(value=0.95)
+        self.confianza_varianza = tk.DoubleVar(value=0.95)
+        self.confianza_uniformidad = tk.DoubleVar(value=0.95)
+        self.intervalos_chi = tk.IntVar(value=10)
+        
+        # Variables específicas para métodos
+        self.semilla1_cuadrados = tk.IntVar(value=5115)
+        self.semilla1_medios = tk.IntVar(value=1234)
+        self.semilla2_medios = tk.IntVar(value=5678)
+        self.semilla_multiplicador = tk.IntVar(value=1234)
+        self.constante_multiplicador = tk.IntVar(value=5678)
+        self.digitos = tk.IntVar(value=4)
+        self.semilla_lineal = tk.IntVar(value=12345)
+        self.a_lineal = tk.IntVar(value=1103515245)
+        self.c_lineal = tk.IntVar(value=12345)
+        self.m_lineal = tk.IntVar(value=2 ** 31)
+        self.semilla_multiplicativo = tk.IntVar(value=12345)
+        self.a_multiplicativo = tk.IntVar(value=16807)
+        self.m_multiplicativo = tk.IntVar(value=2 ** 31 - 1)
+        self.semilla1_combinado = tk.IntVar(value=12345)
+        self.semilla2_combinado = tk.IntVar(value=67890)
+        self.detener_en_ciclo = tk.BooleanVar(value=False)
+        
+        # ri generados (ndarray; las pruebas lo reciben sin convertirlo)
+        self.numeros_generados = np.empty(0)
+        self.historial_generacion = []
+        self.metodo_actual = ""
+        
+        # Tarea en segundo plano (evento de cancelación) y widgets de progreso
+        self.tarea_activa = None
+        self.barra_progreso = None
+        
+        # Tabla paginada del historial: solo se insertan las filas visibles
+        self.tabla = None
+        self.metodo_tabla = None
+        self.inicio_tabla = 0
+        self.ir_a_iteracion = tk.IntVar(value=1)
+        
+        # Panel de estadísticas de rendimiento; la casilla enciende y apaga Profiler
+        self.ventana_estadisticas = None
+        self.tabla_estadisticas = None
+        self.perfil_activo = tk.BooleanVar(value=Profiler.activo)
+        self.perfil_activo.trace_add('write', lambda *_: Profiler.activar(self.perfil_activo.get()))
+        
+        # Histograma: la ventana, la figura y sus artistas se reutilizan entre redibujos
+        self.ventana_histograma = None
+        self.canvas_histograma = None
+        self.ejes_histograma = None
+        self.escalones_histograma = None
+        self.linea_histograma = None
+        
+        # Mostrar menú principal al inicio
+        self.mostrar_menu_principal()
+    
+    def setup_styles(self):
+        style = ttk.Style()
+        style.theme_use('clam')
+        
+        # Configurar colores
+        style.configure('TFrame', background=self.colors["bg_dark"])
+        style.configure('TLabel', background=self.colors["bg_dark"], foreground=self.colors["text"], font=('Roboto', 10))
+        style.configure('Title.TLabel', background=self.colors["bg_dark"], foreground=self.colors["neon"], font=('Roboto', 16, 'bold'))
+        style.configure('Neon.TLabel', background=self.colors["bg_dark"], foreground=self.colors["neon"], font=('Roboto', 10, 'bold'))
+        style.configure('TCheckbutton', background=self.colors["bg_dark"], foreground=self.colors["text"], font=('Roboto', 10))
+        
+        # Configurar botones
+        style.configure('Neon.TButton', 
+                       background=self.colors["bg_light"],
+                       foreground=self.colors["text"],
+                       bordercolor=self.colors["neon"],
+                       focuscolor=self.colors["bg_medium"],
+                       font=('Roboto', 10, 'bold'),
+                       padding=(10, 5))
+        style.map('Neon.TButton',
+                 background=[('active', self.colors["accent"])],
+                 foreground=[('active', self.colors["text"])])
+        
+        # Configurar entrada de texto
+        style.configure('Neon.TEntry',
+                       fieldbackground=self.colors["bg_light"],
+                       foreground=self.colors["text"],
+                       bordercolor=self.colors["neon"],
+                       focuscolor=self.colors["neon"])
+        
+        # Configurar LabelFrame
+        style.configure('Neon.TLabelframe', 
+                       background=self.colors["bg_dark"],
+                       foreground=self.colors["neon"],
+                       bordercolor=self.colors["neon"])
+        style.configure('Neon.TLabelframe.Label', 
+                       background=self.colors["bg_dark"],
+                       foreground=self.colors["neon"],
+                       font=('Roboto', 10, 'bold'))
+        
+        # Configurar tabla de resultados
+        style.configure('Neon.Treeview',
+                       background=self.colors["bg_light"],
+                       fieldbackground=self.colors["bg_light"],
+                       foreground=self.colors["text"],
+                       font=('Consolas', 9))
+        style.configure('Neon.Treeview.Heading',
+                       background=self.colors["bg_medium"],
+                       foreground=self.colors["neon"],
+                       font=('Roboto', 9, 'bold'))
+        style.map('Neon.Treeview', background=[('selected', self.colors["accent"])])
+        
+        # Configurar barra de progreso
+        style.configure('Neon.Horizontal.TProgressbar',
+                       troughcolor=self.colors["bg_light"],
+                       background=self.colors["neon"],
+                       bordercolor=self.colors["bg_medium"])
+        
+    def crear_boton(self, parent, text, command, width=25):
+        return ttk.Button(parent, text=text, command=command, style='Neon.TButton', width=width)
+    
+    def crear_entrada(self, parent, textvariable, width=10):
+        return ttk.Entry(parent, textvariable=textvariable, style='Neon.TEntry', width=width)
+    
+    def crear_etiqueta(self, parent, text, style='TLabel'):
+        return ttk.Label(parent, text=text, style=style)
+    
+    def crear_casilla(self, parent, text, variable):
+        return ttk.Checkbutton(parent, text=text, variable=variable, style='TCheckbutton')
+    
+    def crear_frame_estilo(self, parent, text=None):
+        if text:
+            return ttk.LabelFrame(parent, text=text, style='Neon.TLabelframe')
+        return ttk.Frame(parent, style='TFrame')
+    
+    def mostrar_menu_principal(self):
+        # Limpiar ventana principal
+        self.limpiar_ventana()
+        
+        # Frame principal con degradado
+        frame_principal = self.crear_frame_estilo(self.root)
+        frame_principal.pack(fill='both', expand=True, padx=20, pady=20)
+        
+        # Título con efecto neón
+        titulo = self.crear_etiqueta(frame_principal, 
+                                    "SISTEMA DE GENERACIÓN DE NÚMEROS PSEUDOALEATORIOS", 
+                                    'Title.TLabel')
+        titulo.pack(pady=30)
+        
+        # Subtítulo
+        subtitulo = self.crear_etiqueta(frame_principal, 
+                                       "Seleccione un método para generar números pseudoaleatorios",
+                                       'Neon.TLabel')
+        subtitulo.pack(pady=(0, 30))
+        
+        # Frame para botones con diseño de cuadrícula futurista
+        frame_botones = self.crear_frame_estilo(frame_principal)
+        frame_botones.pack(pady=20)
+        
+        # Botones del menú principal con estilo neón
+        botones = [
+            ("Método de Cuadrados Medios", self.mostrar_cuadrados_medios),
+            ("Método de Productos Medios", self.mostrar_productos_medios),
+            ("Método del Multiplicador Constante", self.mostrar_multiplicador_constante),
+            ("Congruencial Lineal", self.mostrar_congruencial_lineal),
+            ("Congruencial Multiplicativo", self.mostrar_congruencial_multiplicativo),
+            ("Congruencial Combinado (L'Ecuyer)", self.mostrar_congruencial_combinado),
+            ("Pruebas Estadísticas", self.mostrar_pruebas_estadisticas),
+            ("Estadísticas de Rendimiento", self.mostrar_estadisticas)
+        ]
+        
+        for texto, comando in botones:
+            btn = self.crear_boton(frame_botones, texto, comando, width=30)
+            btn.pack(pady=12)
+        
+        # Footer con estilo futurista
+        footer = self.crear_etiqueta(frame_principal, 
+                                    "© 2025 Sistema de Simulación ", 
+                                    'Neon.TLabel')
+        footer.pack(side='bottom', pady=20)
+    
+    # ==================== MÉTODOS DE GENERACIÓN ====================
+    def mostrar_cuadrados_medios(self):
+        self.limpiar_ventana()
+        self.metodo_actual = "Cuadrados Medios"
+        
+        # Frame principal
+        frame_principal = self.crear_frame_estilo(self.root)
+        frame_principal.pack(fill='both', expand=True, padx=15, pady=15)
+        
+        # Título
+        titulo = self.crear_etiqueta(frame_principal, "MÉTODO DE CUADRADOS MEDIOS", 'Title.TLabel')
+        titulo.pack(pady=15)
+        
+        # Frame de parámetros
+        frame_params = self.crear_frame_estilo(frame_principal, "Parámetros")
+        frame_params.pack(fill='x', padx=10, pady=10)
+        
+        self.crear_etiqueta(frame_params, "Cantidad de números (n):").grid(row=0, column=0, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.n).grid(row=0, column=1, padx=5, pady=8)
+        
+        self.crear_etiqueta(frame_params, "Semilla inicial:").grid(row=0, column=2, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.semilla1_cuadrados).grid(row=0, column=3, padx=5, pady=8)
+        
+        self.crear_etiqueta(frame_params, "Dígitos:").grid(row=0, column=4, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.digitos, width=4).grid(row=0, column=5, padx=5, pady=8)
+        
+        self.crear_casilla(frame_params, "Detener al repetirse el ciclo", self.detener_en_ciclo).grid(row=1, column=0, columnspan=2, padx=5, pady=8, sticky='w')
+        self.crear_boton(frame_params, "Mejores Semillas", lambda: self.mostrar_mejores_semillas('cuadrados_medios')).grid(row=1, column=2, columnspan=2, padx=5, pady=8)
+        self.crear_boton(frame_params, "Buscar por Pruebas", lambda: self.buscar_parametros('cuadrados_medios')).grid(row=2, column=0, columnspan=2, padx=5, pady=8)
+        
+        # Frame para pruebas estadísticas
+        frame_pruebas = self.crear_frame_estilo(frame_principal, "Pruebas Estadísticas")
+        frame_pruebas.pack(fill='x', padx=10, pady=10)
+        
+        # Configuración de nivel de confianza para pruebas
+        self.crear_etiqueta(frame_pruebas, "Nivel de Confianza:").grid(row=0, column=0, padx=5, pady=5, sticky='e')
+        self.crear_entrada(frame_pruebas, self.confianza_medias).grid(row=0, column=1, padx=5, pady=5)
+        
+        # Botones
+        frame_botones = self.crear_frame_estilo(frame_principal)
+        frame_botones.pack(pady=12)
+        
+        self.crear_boton(frame_botones, "Generar Números", self.generar_cuadrados_medios).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Medias", self.prueba_medias).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Varianza", self.prueba_varianza).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Uniformidad", self.prueba_uniformidad).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Mostrar Histograma", self.mostrar_histograma).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Exportar a TXT", self.exportar_txt).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Atrás", self.mostrar_menu_principal).pack(side='left', padx=8)
+        
+        # Progreso de las tareas en segundo plano
+        self.crear_barra_progreso(frame_principal)
+        
+        # Área de resultados
+        frame_resultados = self.crear_frame_estilo(frame_principal, "Resultados")
+        frame_resultados.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Tabla paginada del historial
+        self.crear_tabla_traza(frame_resultados, 'cuadrados_medios')
+        
+        self.text_resultados = scrolledtext.ScrolledText(
+            frame_resultados, 
+            height=8,
+            bg=self.colors["bg_light"],
+            fg=self.colors["text"],
+            insertbackground=self.colors["neon"],
+            selectbackground=self.colors["accent"],
+            font=('Consolas', 9)
+        )
+        self.text_resultados.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Configurar tags para colores
+        self.text_resultados.tag_configure("title", foreground=self.colors["neon"])
+        self.text_resultados.tag_configure("divider", foreground=self.colors["accent"])
+        self.text_resultados.tag_configure("success", foreground=self.colors["highlight"])
+        self.text_resultados.tag_configure("error", foreground="#ff5555")
+        self.text_resultados.tag_configure("subtitle", foreground=self.colors["accent"])
+    
+    def mostrar_productos_medios(self):
+        self.limpiar_ventana()
+        self.metodo_actual = "Productos Medios"
+        
+        # Frame principal
+        frame_principal = self.crear_frame_estilo(self.root)
+        frame_principal.pack(fill='both', expand=True, padx=15, pady=15)
+        
+        # Título
+        titulo = self.crear_etiqueta(frame_principal, "MÉTODO DE PRODUCTOS MEDIOS", 'Title.TLabel')
+        titulo.pack(pady=15)
+        
+        # Frame de parámetros
+        frame_params = self.crear_frame_estilo(frame_principal, "Parámetros")
+        frame_params.pack(fill='x', padx=10, pady=10)
+        
+        self.crear_etiqueta(frame_params, "Cantidad de números (n):").grid(row=0, column=0, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.n).grid(row=0, column=1, padx=5, pady=8)
+        
+        self.crear_etiqueta(frame_params, "Semilla 1:").grid(row=0, column=2, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.semilla1_medios).grid(row=0, column=3, padx=5, pady=8)
+        
+        self.crear_etiqueta(frame_params, "Dígitos:").grid(row=0, column=4, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.digitos, width=4).grid(row=0, column=5, padx=5, pady=8)
+        
+        self.crear_etiqueta(frame_params, "Semilla 2:").grid(row=1, column=0, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.semilla2_medios).grid(row=1, column=1, padx=5, pady=8)
+        
+        self.crear_casilla(frame_params, "Detener al repetirse el ciclo", self.detener_en_ciclo).grid(row=1, column=2, columnspan=2, padx=5, pady=8, sticky='w')
+        self.crear_boton(frame_params, "Buscar por Pruebas", lambda: self.buscar_parametros('productos_medios')).grid(row=2, column=0, columnspan=2, padx=5, pady=8)
+        
+        # Frame para pruebas estadísticas
+        frame_pruebas = self.crear_frame_estilo(frame_principal, "Pruebas Estadísticas")
+        frame_pruebas.pack(fill='x', padx=10, pady=10)
+        
+        # Configuración de nivel de confianza para pruebas
+        self.crear_etiqueta(frame_pruebas, "Nivel de Confianza:").grid(row=0, column=0, padx=5, pady=5, sticky='e')
+        self.crear_entrada(frame_pruebas, self.confianza_medias).grid(row=0, column=1, padx=5, pady=5)
+        
+        # Botones
+        frame_botones = self.crear_frame_estilo(frame_principal)
+        frame_botones.pack(pady=12)
+        
+        self.crear_boton(frame_botones, "Generar Números", self.generar_productos_medios).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Medias", self.prueba_medias).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba of Varianza", self.prueba_varianza).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Uniformidad", self.prueba_uniformidad).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Mostrar Histograma", self.mostrar_histograma).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Exportar a TXT", self.exportar_txt).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Atrás", self.mostrar_menu_principal).pack(side='left', padx=8)
+        
+        # Progreso de las tareas en segundo plano
+        self.crear_barra_progreso(frame_principal)
+        
+        # Área de resultados
+        frame_resultados = self.crear_frame_estilo(frame_principal, "Resultados")
+        frame_resultados.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Tabla paginada del historial
+        self.crear_tabla_traza(frame_resultados, 'productos_medios')
+        
+        self.text_resultados = scrolledtext.ScrolledText(
+            frame_resultados, 
+            height=8,
+            bg=self.colors["bg_light"],
+            fg=self.colors["text"],
+            insertbackground=self.colors["neon"],
+            selectbackground=self.colors["accent"],
+            font=('Consolas', 9)
+        )
+        self.text_resultados.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Configurar tags para colores
+        self.text_resultados.tag_configure("title", foreground=self.colors["neon"])
+        self.text_resultados.tag_configure("divider", foreground=self.colors["accent"])
+        self.text_resultados.tag_configure("success", foreground=self.colors["highlight"])
+        self.text_resultados.tag_configure("error", foreground="#ff5555")
+        self.text_resultados.tag_configure("subtitle", foreground=self.colors["accent"])
+    
+    def mostrar_multiplicador_constante(self):
+        self.limpiar_ventana()
+        self.metodo_actual = "Multiplicador Constante"
+        
+        # Frame principal
+        frame_principal = self.crear_frame_estilo(self.root)
+        frame_principal.pack(fill='both', expand=True, padx=15, pady=15)
+        
+        # Título
+        titulo = self.crear_etiqueta(frame_principal, "MÉTODO DEL MULTIPLICADOR CONSTANTE", 'Title.TLabel')
+        titulo.pack(pady=15)
+        
+        # Frame de parámetros
+        frame_params = self.crear_frame_estilo(frame_principal, "Parámetros")
+        frame_params.pack(fill='x', padx=10, pady=10)
+        
+        self.crear_etiqueta(frame_params, "Cantidad de números (n):").grid(row=0, column=0, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.n).grid(row=0, column=1, padx=5, pady=8)
+        
+        self.crear_etiqueta(frame_params, "Semilla:").grid(row=0, column=2, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.semilla_multiplicador).grid(row=0, column=3, padx=5, pady=8)
+        
+        self.crear_etiqueta(frame_params, "Dígitos:").grid(row=0, column=4, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.digitos, width=4).grid(row=0, column=5, padx=5, pady=8)
+        
+        self.crear_etiqueta(frame_params, "Constante:").grid(row=1, column=0, padx=5, pady=8, sticky='e')
+        self.crear_entrada(frame_params, self.constante_multiplicador).grid(row=1, column=1, padx=5, pady=8)
+        
+        self.crear_casilla(frame_params, "Detener al repetirse el ciclo", self.detener_en_ciclo).grid(row=1, column=2, columnspan=2, padx=5, pady=8, sticky='w')
+        self.crear_boton(frame_params, "Mejores Semillas", lambda: self.mostrar_mejores_semillas('multiplicador_constante')).grid(row=2, column=0, columnspan=2, padx=5, pady=8)
+        self.crear_boton(frame_params, "Buscar por Pruebas", lambda: self.buscar_parametros('multiplicador_constante')).grid(row=2, column=2, columnspan=2, padx=5, pady=8)
+        
+        # Frame para pruebas estadísticas
+        frame_pruebas = self.crear_frame_estilo(frame_principal, "Pruebas Estadísticas")
+        frame_pruebas.pack(fill='x', padx=10, pady=10)
+        
+        # Configuración de nivel de confianza para pruebas
+        self.crear_etiqueta(frame_pruebas, "Nivel de Confianza:").grid(row=0, column=0, padx=5, pady=5, sticky='e')
+        self.crear_entrada(frame_pruebas, self.confianza_medias).grid(row=0, column=1, padx=5, pady=5)
+        
+        # Botones
+        frame_botones = self.crear_frame_estilo(frame_principal)
+        frame_botones.pack(pady=12)
+        
+        self.crear_boton(frame_botones, "Generar Números", self.generar_multiplicador_constante).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Medias", self.prueba_medias).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Varianza", self.prueba_varianza).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Uniformidad", self.prueba_uniformidad).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Mostrar Histograma", self.mostrar_histograma).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Exportar a TXT", self.exportar_txt).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Atrás", self.mostrar_menu_principal).pack(side='left', padx=8)
+        
+        # Progreso de las tareas en segundo plano
+        self.crear_barra_progreso(frame_principal)
+        
+        # Área de resultados
+        frame_resultados = self.crear_frame_estilo(frame_principal, "Resultados")
+        frame_resultados.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Tabla paginada del historial
+        self.crear_tabla_traza(frame_resultados, 'multiplicador_constante')
+        
+        self.text_resultados = scrolledtext.ScrolledText(
+            frame_resultados, 
+            height=8,
+            bg=self.colors["bg_light"],
+            fg=self.colors["text"],
+            insertbackground=self.colors["neon"],
+            selectbackground=self.colors["accent"],
+            font=('Consolas', 9)
+        )
+        self.text_resultados.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Configurar tags para colores
+        self.text_resultados.tag_configure("title", foreground=self.colors["neon"])
+        self.text_resultados.tag_configure("divider", foreground=self.colors["accent"])
+        self.text_resultados.tag_configure("success", foreground=self.colors["highlight"])
+        self.text_resultados.tag_configure("error", foreground="#ff5555")
+        self.text_resultados.tag_configure("subtitle", foreground=self.colors["accent"])
+    
+    def mostrar_congruencial_lineal(self):
+        self.mostrar_congruencial(
+            'congruencial_lineal', "Congruencial Lineal", "GENERADOR CONGRUENCIAL LINEAL",
+            [("Semilla (X0):", self.semilla_lineal), ("Multiplicador (a):", self.a_lineal),
+             ("Incremento (c):", self.c_lineal), ("Módulo (m):", self.m_lineal)])
+    
+    def mostrar_congruencial_multiplicativo(self):
+        self.mostrar_congruencial(
+            'congruencial_multiplicativo', "Congruencial Multiplicativo", "GENERADOR CONGRUENCIAL MULTIPLICATIVO",
+            [("Semilla (X0):", self.semilla_multiplicativo), ("Multiplicador (a):", self.a_multiplicativo),
+             ("Módulo (m):", self.m_multiplicativo)])
+    
+    def mostrar_congruencial_combinado(self):
+        self.mostrar_congruencial(
+            'congruencial_combinado', "Congruencial Combinado", "GENERADOR COMBINADO DE L'ECUYER",
+            [("Semilla 1:", self.semilla1_combinado), ("Semilla 2:", self.semilla2_combinado)])
+    
+    def mostrar_congruencial(self, metodo, nombre, titulo, campos):
+        """Pantalla de un congruencial: mismos botones, tabla y pruebas que los métodos de dígitos medios"""
+        self.limpiar_ventana()
+        self.metodo_actual = nombre
+        
+        frame_principal = self.crear_frame_estilo(self.root)
+        frame_principal.pack(fill='both', expand=True, padx=15, pady=15)
+        
+        self.crear_etiqueta(frame_principal, titulo, 'Title.TLabel').pack(pady=15)
+        
+        frame_params = self.crear_frame_estilo(frame_principal, "Parámetros")
+        frame_params.pack(fill='x', padx=10, pady=10)
+        
+        # Dos campos por fila, empezando por n
+        campos = [("Cantidad de números (n):", self.n)] + campos
+        for i, (etiqueta, variable) in enumerate(campos):
+            fila, columna = divmod(i, 2)
+            self.crear_etiqueta(frame_params, etiqueta).grid(row=fila, column=2 * columna, padx=5, pady=8, sticky='e')
+            self.crear_entrada(frame_params, variable, width=14).grid(row=fila, column=2 * columna + 1, padx=5, pady=8)
+        if metodo == 'congruencial_combinado':
+            (a1, m1), (a2, m2) = LECUYER
+            self.crear_etiqueta(frame_params, f"a1 = {a1}, m1 = {m1}    a2 = {a2}, m2 = {m2}").grid(
+                row=len(campos) // 2 + 1, column=0, columnspan=4, padx=5, pady=8, sticky='w')
+        
+        frame_pruebas = self.crear_frame_estilo(frame_principal, "Pruebas Estadísticas")
+        frame_pruebas.pack(fill='x', padx=10, pady=10)
+        self.crear_etiqueta(frame_pruebas, "Nivel de Confianza:").grid(row=0, column=0, padx=5, pady=5, sticky='e')
+        self.crear_entrada(frame_pruebas, self.confianza_medias).grid(row=0, column=1, padx=5, pady=5)
+        
+        frame_botones = self.crear_frame_estilo(frame_principal)
+        frame_botones.pack(pady=12)
+        
+        self.crear_boton(frame_botones, "Generar Números", lambda: self.generar_congruencial(metodo)).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Medias", self.prueba_medias).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Varianza", self.prueba_varianza).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Prueba de Uniformidad", self.prueba_uniformidad).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Mostrar Histograma", self.mostrar_histograma).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Exportar a TXT", self.exportar_txt).pack(side='left', padx=8)
+        self.crear_boton(frame_botones, "Atrás", self.mostrar_menu_principal).pack(side='left', padx=8)
+        
+        self.crear_barra_progreso(frame_principal)
+        
+        frame_resultados = self.crear_frame_estilo(frame_principal, "Resultados")
+        frame_resultados.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        self.crear_tabla_traza(frame_resultados, metodo)
+        
+        self.text_resultados = scrolledtext.ScrolledText(
+            frame_resultados, 
+            height=8,
+            bg=self.colors["bg_light"],
+            fg=self.colors["text"],
+            insertbackground=self.colors["neon"],
+            selectbackground=self.colors["accent"],
+            font=('Consolas', 9)
+        )
+        self.text_resultados.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        self.text_resultados.tag_configure("title", foreground=self.colors["neon"])
+        self.text_resultados.tag_configure("divider", foreground=self.colors["accent"])
+        self.text_resultados.tag_configure("success", foreground=self.colors["highlight"])
+        self.text_resultados.tag_configure("error", foreground="#ff5555")
+        self.text_resultados.tag_configure("subtitle", foreground=self.colors["accent"])
+    
+    def mostrar_pruebas_estadisticas(self):
+        self.limpiar_ventana()
+        
+        # Frame principal
+        frame_principal = self.crear_frame_estilo(self.root)
+        frame_principal.pack(fill='both', expand=True, padx=15, pady=15)
+        
+        # Título
+        titulo = self.crear_etiqueta(frame_principal, "PRUEBAS ESTADÍSTICAS", 'Title.TLabel')
+        titulo.pack(pady=15)
+        
+        # Prueba de Medias
+        frame_medias = self.crear_frame_estilo(frame_principal, "Prueba de Medias")
+        frame_medias.pack(fill='x', padx=10, pady=8)
+        
+        self.crear_etiqueta(frame_medias, "Nivel de Confianza (ej. 0.95):").grid(row=0, column=0, padx=5, pady=5, sticky='e')
+        self.crear_entrada(frame_medias, self.confianza_medias).grid(row=0, column=1, padx=5, pady=5)
+        
+        self.crear_boton(frame_medias, "Ejecutar Prueba de Medias", self.prueba_medias).grid(row=0, column=2, padx=5, pady=5)
+        
+        # Prueba de Varianza
+        frame_varianza = self.crear_frame_estilo(frame_principal, "Prueba de Varianza")
+        frame_varianza.pack(fill='x', padx=10, pady=8)
+        
+        self.crear_etiqueta(frame_varianza, "Nivel de Confianza (ej. 0.95):").grid(row=0, column=0, padx=5, pady=5, sticky='e')
+        self.crear_entrada(frame_varianza, self.confianza_varianza).grid(row=0, column=1, padx=5, pady=5)
+        
+        self.crear_boton(frame_varianza, "Ejecutar Prueba de Varianza", self.prueba_varianza).grid(row=0, column=2, padx=5, pady=5)
+        
+        # Prueba de Uniformidad (Chi-cuadrada)
+        frame_uniformidad = self.crear_frame_estilo(frame_principal, "Prueba de Uniformidad (Chi-cuadrada)")
+        frame_uniformidad.pack(fill='x', padx=10, pady=8)
+        
+        self.crear_etiqueta(frame_uniformidad, "Número de intervalos (m):").grid(row=0, column=0, padx=5, pady=5, sticky='e')
+        self.crear_entrada(frame_uniformidad, self.intervalos_chi).grid(row=0, column=1, padx=5, pady=5)
+        
+        self.crear_etiqueta(frame_uniformidad, "Nivel de Confianza (ej. 0.95):").grid(row=0, column=2, padx=5, pady=5, sticky='e')
+        self.crear_entrada(frame_uniformidad, self.confianza_uniformidad).grid(row=0, column=3, padx=5, pady=5)
+        
+        self.crear_boton(frame_uniformidad, "Ejecutar Prueba de Uniformidad", self.prueba_uniformidad).grid(row=1, column=0, columnspan=2, padx=5, pady=5)
+        self.crear_boton(frame_uniformidad, "Mostrar Histograma", self.mostrar_histograma).grid(row=1, column=2, columnspan=2, padx=5, pady=5)
+        self.crear_boton(frame_uniformidad, "Exportar a TXT", self.exportar_txt).grid(row=2, column=0, columnspan=4, padx=5, pady=5)
+        
+        # Archivos producidos por otros generadores
+        frame_archivo = self.crear_frame_estilo(frame_principal, "Archivo Externo (.npy, .bin o float64 crudo)")
+        frame_archivo.pack(fill='x', padx=10, pady=8)
+        
+        self.crear_boton(frame_archivo, "Probar Archivo", self.probar_archivo).grid(row=0, column=0, padx=5, pady=5)
+        self.crear_etiqueta(frame_archivo, "Aplica las tres pruebas por bloques, sin cargar el archivo en memoria").grid(row=0, column=1, padx=5, pady=5, sticky='w')
+        
+        # Todas las pruebas a la vez, una por núcleo
+        frame_bateria = self.crear_frame_estilo(frame_principal, "Batería Completa")
+        frame_bateria.pack(fill='x', padx=10, pady=8)
+        
+        self.crear_boton(frame_bateria, "Ejecutar Batería Completa", self.ejecutar_bateria).grid(row=0, column=0, padx=5, pady=5)
+        self.crear_etiqueta(frame_bateria, "Medias, varianza, uniformidad, corridas, autocorrelación, póker, huecos, series y K-S en paralelo").grid(row=0, column=1, padx=5, pady=5, sticky='w')
+        
+        # Botón Atrás
+        frame_botones = self.crear_frame_estilo(frame_principal)
+        frame_botones.pack(pady=12)
+        
+        self.crear_boton(frame_botones, "Atrás", self.mostrar_menu_principal).pack(pady=5)
+        
+        # Progreso de las tareas en segundo plano
+        self.crear_barra_progreso(frame_principal)
+        
+        # Área de resultados
+        frame_resultados = self.crear_frame_estilo(frame_principal, "Resultados")
+        frame_resultados.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        self.text_resultados = scrolledtext.ScrolledText(
+            frame_resultados, 
+            height=15,
+            bg=self.colors["bg_light"],
+            fg=self.colors["text"],
+            insertbackground=self.colors["neon"],
+            selectbackground=self.colors["accent"],
+            font=('Consolas', 9)
+        )
+        self.text_resultados.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        # Configurar tags para colores
+        self.text_resultados.tag_configure("title", foreground=self.colors["neon"])
+        self.text_resultados.tag_configure("divider", foreground=self.colors["accent"])
+        self.text_resultados.tag_configure("success", foreground=self.colors["highlight"])
+        self.text_resultados.tag_configure("error", foreground="#ff5555")
+        self.text_resultados.tag_configure("subtitle", foreground=self.colors["accent"])
+    
+    def limpiar_ventana(self):
+        self.cancelar_tarea()
+        self.barra_progreso = None
+        self.tabla = None
+        for widget in self.root.winfo_children():
+            if widget is not self.ventana_estadisticas:
+                widget.destroy()
+    
+    # ==================== TAREAS EN SEGUNDO PLANO ====================
+    def crear_barra_progreso(self, parent):
+        frame_progreso = self.crear_frame_estilo(parent)
+        frame_progreso.pack(fill='x', padx=10, pady=(0, 5))
+        
+        self.barra_progreso = ttk.Progressbar(frame_progreso, mode='determinate', maximum=100,
+                                              style='Neon.Horizontal.TProgressbar')
+        self.barra_progreso.pack(side='left', fill='x', expand=True, padx=5)
+        self.etiqueta_progreso = self.crear_etiqueta(frame_progreso, "")
+        self.etiqueta_progreso.pack(side='left', padx=5)
+        self.boton_cancelar = self.crear_boton(frame_progreso, "Cancelar", self.cancelar_tarea, width=12)
+        self.boton_cancelar.pack(side='left', padx=5)
+        self.boton_cancelar.state(['disabled'])
+    
+    def actualizar_progreso(self, fraccion, texto=None):
+        if self.barra_progreso is None:
+            return
+        self.barra_progreso['value'] = 100 * fraccion
+        if texto is not None:
+            self.etiqueta_progreso.configure(text=texto)
+    
+    def cancelar_tarea(self):
+        if self.tarea_activa is not None:
+            self.tarea_activa.set()
+    
+    def _terminar_tarea(self, texto):
+        self.tarea_activa = None
+        if self.barra_progreso is not None:
+            self.actualizar_progreso(0, texto)
+            self.boton_cancelar.state(['disabled'])
+    
+    def ejecutar_en_segundo_plano(self, descripcion, trabajo, al_terminar):
+        """Corre trabajo(avisar, cancelado) en un hilo y llama a al_terminar(resultado) en el hilo de Tk.
+        
+        El trabajo informa su avance con avisar(fraccion) y debe revisar cancelado.is_set();
+        nunca toca widgets, solo el hilo de Tk lo hace al sondear la cola.
+        """
+        if self.tarea_activa is not None:
+            messagebox.showwarning("Advertencia", "Ya hay una tarea en curso; cancélela o espere a que termine")
+            return
+        
+        cola = queue.Queue()
+        cancelado = threading.Event()
+        
+        def ejecutar():
+            try:
+                with Profiler.medir(f"interfaz.tarea.{descripcion}"):
+                    resultado = trabajo(lambda fraccion: cola.put(('progreso', fraccion)), cancelado)
+                cola.put(('fin', resultado))
+            except Exception as e:
+                cola.put(('error', e))
+        
+        self.tarea_activa = cancelado
+        self.actualizar_progreso(0, f"{descripcion}...")
+        if self.barra_progreso is not None:
+            self.boton_cancelar.state(['!disabled'])
+        threading.Thread(target=ejecutar, daemon=True).start()
+        self.root.after(self.INTERVALO_SONDEO, self._sondear_tarea, cola, cancelado, descripcion, al_terminar)
+    
+    def _sondear_tarea(self, cola, cancelado, descripcion, al_terminar):
+        try:
+            while True:
+                tipo, dato = cola.get_nowait()
+                if tipo == 'progreso':
+                    if not cancelado.is_set():
+                        self.actualizar_progreso(dato)
+                    continue
+                if self.tarea_activa is cancelado:
+                    self._terminar_tarea("Cancelado" if cancelado.is_set() else "")
+                if cancelado.is_set():
+                    return
+                if tipo == 'error':
+                    messagebox.showerror("Error", f"Error en {descripcion}: {str(dato)}")
+                else:
+                    al_terminar(dato)
+                return
+        except queue.Empty:
+            self.root.after(self.INTERVALO_SONDEO, self._sondear_tarea, cola, cancelado, descripcion, al_terminar)
+    
+    # ==================== TABLA PAGINADA DEL HISTORIAL ====================
+    def crear_tabla_traza(self, parent, metodo):
+        frame_tabla = self.crear_frame_estilo(parent)
+        frame_tabla.pack(fill='both', expand=True, padx=5, pady=5)
+        
+        columnas = (CongruentialTrace if metodo in CongruentialGeneration.METODOS else GenerationTrace).COLUMNAS[metodo]
+        self.tabla = ttk.Treeview(frame_tabla, columns=columnas, show='headings',
+                                  height=self.FILAS_TABLA, style='Neon.Treeview')
+        for columna in columnas:
+            self.tabla.heading(columna, text=self.ENCABEZADOS[columna])
+            self.tabla.column(columna, width=110, anchor='e')
+        self.tabla.pack(side='left', fill='both', expand=True)
+        
+        # La barra no desplaza el Treeview: indica y cambia qué página del historial se muestra
+        self.barra_tabla = ttk.Scrollbar(frame_tabla, orient='vertical', command=self.desplazar_tabla)
+        self.barra_tabla.pack(side='left', fill='y')
+        self.tabla.bind('<MouseWheel>', lambda e: self.desplazar_tabla('scroll', -1 if e.delta > 0 else 1, 'units'))
+        self.tabla.bind('<Button-4>', lambda e: self.desplazar_tabla('scroll', -1, 'units'))
+        self.tabla.bind('<Button-5>', lambda e: self.desplazar_tabla('scroll', 1, 'units'))
+        
+        frame_salto = self.crear_frame_estilo(parent)
+        frame_salto.pack(fill='x', padx=5)
+        self.crear_etiqueta(frame_salto, "Ir a iteración:").pack(side='left', padx=5)
+        self.crear_entrada(frame_salto, self.ir_a_iteracion).pack(side='left', padx=5)
+        self.crear_boton(frame_salto, "Ir", self.saltar_a_iteracion, width=6).pack(side='left', padx=5)
+        self.crear_boton(frame_salto, "Exportar Datos", self.exportar_datos, width=16).pack(side='right', padx=5)
+        
+        self.metodo_tabla = metodo
+        self.inicio_tabla = 0
+        self.barra_tabla.set(0, 1)
+        if self.traza_en_tabla() is not None:
+            self.mostrar_pagina(0)
+    
+    def traza_en_tabla(self):
+        """Historial que corresponde a la tabla visible, o None si no hay nada que mostrar"""
+        traza = self.historial_generacion
+        if self.tabla is None or not len(traza) or traza.metodo != self.metodo_tabla:
+            return None
+        return traza
+    
+    @Profiler.medido('interfaz.tabla')
+    def mostrar_pagina(self, inicio):
+        """Rellena la tabla con las FILAS_TABLA filas del historial a partir de inicio"""
+        traza = self.historial_generacion
+        total = len(traza)
+        inicio = max(0, min(inicio, total - self.FILAS_TABLA))
+        self.inicio_tabla = inicio
+        
+        self.tabla.delete(*self.tabla.get_children())
+        for fila in traza[inicio:inicio + self.FILAS_TABLA]:
+            valores = [fila[columna] for columna in traza.columnas]
+            valores[-1] = f"{fila['ri']:.{traza.digitos}f}"
+            self.tabla.insert('', 'end', iid=str(fila['iteracion']), values=valores)
+        
+        if total:
+            self.barra_tabla.set(inicio / total, min(inicio + self.FILAS_TABLA, total) / total)
+        else:
+            self.barra_tabla.set(0, 1)
+    
+    def desplazar_tabla(self, accion, cantidad, unidad=None):
+        traza = self.traza_en_tabla()
+        if traza is None:
+            return
+        if accion == 'moveto':
+            inicio = int(float(cantidad) * len(traza))
+        else:
+            paso = self.FILAS_TABLA if unidad == 'pages' else 1
+            inicio = self.inicio_tabla + int(cantidad) * paso
+        self.mostrar_pagina(inicio)
+    
+    def saltar_a_iteracion(self):
+        traza = self.traza_en_tabla()
+        if traza is None:
+            messagebox.showwarning("Advertencia", "Primero genere números aleatorios")
+            return
+        try:
+            iteracion = self.ir_a_iteracion.get()
+        except Exception as e:
+            messagebox.showerror("Error", f"Iteración inválida: {str(e)}")
+            return
+        if iteracion < 1:
+            messagebox.showerror("Error", "La iteración debe ser al menos 1")
+            return
+        if iteracion > len(traza):
+            # Puede tener que buscar el ciclo: se calcula fuera del hilo de Tk
+            self.ejecutar_en_segundo_plano(
+                "Calculando iteración",
+                lambda avisar, cancelado: self.fila_sin_generar(traza, iteracion),
+                lambda fila: self.mostrar_iteracion_sin_generar(traza, iteracion, fila))
+            return
+        
+        self.mostrar_pagina(iteracion - 1)
+        self.tabla.selection_set(str(iteracion))
+        self.tabla.see(str(iteracion))
+    
+    @staticmethod
+    def fila_sin_generar(traza, iteracion):
+        """Fila de una iteración posterior a lo generado, calculada con la cola y el periodo de la sucesión"""
+        if isinstance(traza, CongruentialTrace):
+            return CongruentialGeneration.fila(traza.metodo, traza.semillas, traza.parametros, iteracion)
+        return SequenceAccess(traza.metodo, traza.semillas, traza.constante, traza.digitos).fila(iteracion)
+    
+    def mostrar_iteracion_sin_generar(self, traza, iteracion, fila):
+        valores = [f"{self.ENCABEZADOS[columna]}: {fila[columna]}" for columna in traza.columnas[1:-1]]
+        valores.append(f"{self.ENCABEZADOS['ri']}: {fila['ri']:.{traza.digitos}f}")
+        self.text_resultados.insert(tk.END, f"Iteración {iteracion} (sin generar): {'  '.join(valores)}\n", "subtitle")
+        self.text_resultados.see(tk.END)
+    
+    # ==================== GENERACIÓN DE NÚMEROS ====================
+    def generar_cuadrados_medios(self):
+        try:
+            n = self.n.get()
+            semilla = self.semilla1_cuadrados.get()
+            digitos = DigitExtraction.validar_ancho(self.digitos.get())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al generar números: {str(e)}")
+            return
+        
+        self.generar_en_segundo_plano(
+            'cuadrados_medios', (semilla,), None, n, "GENERANDO NÚMEROS POR CUADRADOS MEDIOS", 60, digitos)
+    
+    def generar_productos_medios(self):
+        try:
+            n = self.n.get()
+            semilla1 = self.semilla1_medios.get()
+            semilla2 = self.semilla2_medios.get()
+            digitos = DigitExtraction.validar_ancho(self.digitos.get())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al generar números: {str(e)}")
+            return
+        
+        self.generar_en_segundo_plano(
+            'productos_medios', (semilla1, semilla2), None, n, "GENERANDO NÚMEROS POR PRODUCTOS MEDIOS", 70, digitos)
+    
+    def generar_multiplicador_constante(self):
+        try:
+            n = self.n.get()
+            semilla = self.semilla_multiplicador.get()
+            constante = self.constante_multiplicador.get()
+            digitos = DigitExtraction.validar_ancho(self.digitos.get())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al generar números: {str(e)}")
+            return
+        
+        self.generar_en_segundo_plano(
+            'multiplicador_constante', (semilla,), constante, n, "GENERANDO NÚMEROS POR MULTIPLICADOR CONSTANTE", 70,
+            digitos)
+    
+    def generar_en_segundo_plano(self, metodo, semillas, constante, n, titulo, ancho, digitos=4):
+        detener_en_ciclo = self.detener_en_ciclo.get()
+        
+        def trabajo(avisar, cancelado):
+            ciclo = CycleDetection.detectar(metodo, semillas, constante, max_pasos=self.MAX_PASOS_CICLO,
+                                            digitos=digitos)
+            limite = max(n, 0)
+            if detener_en_ciclo and ciclo is not None:
+                limite = min(limite, CycleDetection.limite_sin_repetir(ciclo))
+            # Lo ya generado con los mismos parámetros sale de la caché; solo se genera lo que falta
+            previos, flujo = GenerationCache.continuar(metodo, semillas, constante, limite, digitos)
+            bloques = [previos]
+            while flujo is not None and not cancelado.is_set():
+                estrellas = flujo.estados(self.TAM_BLOQUE)
+                if not len(estrellas):
+                    break
+                bloques.append(estrellas)
+                avisar((len(previos) + flujo.generados) / max(limite, 1))
+            estrellas = np.concatenate(bloques) if len(bloques) > 1 else previos
+            if not cancelado.is_set():
+                estrellas = GenerationCache.guardar(metodo, semillas, constante, estrellas, digitos)
+            return self.resumir_generacion(GenerationTrace(metodo, semillas, estrellas, constante, ciclo, digitos))
+        
+        self.ejecutar_en_segundo_plano(
+            "Generando", trabajo, lambda resumen: self.mostrar_generacion(resumen, titulo, ancho))
+    
+    def generar_congruencial(self, metodo):
+        try:
+            n = self.n.get()
+            if metodo == 'congruencial_lineal':
+                semillas = (self.semilla_lineal.get(),)
+                parametros = (self.a_lineal.get(), self.c_lineal.get(), self.m_lineal.get())
+            elif metodo == 'congruencial_multiplicativo':
+                semillas = (self.semilla_multiplicativo.get(),)
+                parametros = (self.a_multiplicativo.get(), self.m_multiplicativo.get())
+            else:
+                semillas = (self.semilla1_combinado.get(), self.semilla2_combinado.get())
+                parametros = None
+            parametros = CongruentialGeneration.validar(metodo, semillas, parametros)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al generar números: {str(e)}")
+            return
+        
+        def trabajo(avisar, cancelado):
+            flujo = CongruentialStream(metodo, semillas, parametros, max(n, 0))
+            bloques = [np.empty(0, dtype=np.int64)]
+            while not flujo.terminado and not cancelado.is_set():
+                bloques.append(flujo.estados(self.TAM_BLOQUE * 16))
+                avisar(flujo.generados / max(n, 1))
+            ciclo = CongruentialGeneration.ciclo(metodo, parametros)
+            return self.resumir_generacion(CongruentialTrace(metodo, semillas, np.concatenate(bloques), parametros, ciclo))
+        
+        titulo = f"GENERANDO NÚMEROS POR {self.metodo_actual.upper()}"
+        self.ejecutar_en_segundo_plano(
+            "Generando", trabajo, lambda resumen: self.mostrar_generacion(resumen, titulo, len(titulo) + 10))
+    
+    @staticmethod
+    def resumir_generacion(traza):
+        """ri y estadísticos del resumen de una traza; corre en el hilo de trabajo para que Tk solo escriba"""
+        ri = traza.ri
+        resumen = {'traza': traza, 'ri': ri}
+        if not len(ri):
+            return resumen
+        if traza.digitos <= MAX_DIGITOS_CONTEOS:
+            # Los conteos quedan guardados en la traza para el histograma y la uniformidad
+            distintos = int(np.count_nonzero(traza.conteos))
+        else:
+            distintos = len(np.unique(traza.estrellas))
+        resumen.update(media=ri.mean(), varianza=ri.var(ddof=1) if len(ri) > 1 else 0.0,
+                       minimo=ri.min(), maximo=ri.max(), distintos=distintos)
+        return resumen
+    
+    @Profiler.medido('interfaz.texto.generacion')
+    def mostrar_generacion(self, resumen, titulo, ancho):
+        traza = resumen['traza']
+        self.historial_generacion = traza
+        self.numeros_generados = resumen['ri']
+        
+        self.mostrar_pagina(0)
+        
+        # Resumen en lugar de volcar todas las filas
+        self.text_resultados.delete(1.0, tk.END)
+        self.text_resultados.insert(tk.END, f"{titulo}\n", "title")
+        self.text_resultados.insert(tk.END, "="*ancho + "\n", "divider")
+        if len(traza):
+            digitos = traza.digitos
+            self.text_resultados.insert(tk.END, f"{'Media:':<12} {resumen['media']:.6f}   {'Varianza:':<10} {resumen['varianza']:.6f}\n")
+            self.text_resultados.insert(tk.END, f"{'Mínimo:':<12} {resumen['minimo']:.{digitos}f}     {'Máximo:':<10} {resumen['maximo']:.{digitos}f}\n")
+            self.text_resultados.insert(tk.END, f"{'Distintos:':<12} {resumen['distintos']}\n")
+        self.text_resultados.insert(tk.END, "="*ancho + "\n", "divider")
+        self.text_resultados.insert(tk.END, f"Generados {len(self.numeros_generados)} números pseudoaleatorios\n", "success")
+        self.mostrar_ciclo()
+        try:
+            self.refrescar_histograma()
+        except (tk.TclError, ValueError):
+            pass  # intervalos inválidos: se avisa al volver a pedir el histograma
+    
+    def mostrar_ciclo(self):
+        ciclo = self.historial_generacion.ciclo
+        if ciclo is None and isinstance(self.historial_generacion, CongruentialTrace):
+            self.text_resultados.insert(tk.END, "Periodo no asegurado para estos parámetros\n", "subtitle")
+        elif ciclo is None:
+            self.text_resultados.insert(tk.END, f"No se detectó ciclo en {self.MAX_PASOS_CICLO} pasos\n", "subtitle")
+        elif ciclo.degenera:
+            iteracion = CycleDetection.iteracion_degenera(self.historial_generacion.metodo, ciclo)
+            self.text_resultados.insert(tk.END, f"La sucesión degenera a 0 en la iteración {iteracion}\n", "error")
+        else:
+            self.text_resultados.insert(tk.END, f"Ciclo: cola de {ciclo.cola} pasos, periodo {ciclo.periodo}\n", "subtitle")
+    
+    def mostrar_mejores_semillas(self, metodo):
+        try:
+            constante = self.constante_multiplicador.get() if metodo == 'multiplicador_constante' else None
+            if self.digitos.get() != 4:
+                messagebox.showwarning("Advertencia", "El análisis de semillas con tablas es solo para 4 dígitos")
+                return
+            if constante is not None and not SuccessorTables.disponible(metodo, constante):
+                messagebox.showwarning("Advertencia", "La constante es demasiado grande para analizar con tablas")
+                return
+            mejores = SuccessorTables.mejores_semillas(metodo, constante, cantidad=15)
+
+            with Profiler.medir('interfaz.texto.mejores_semillas'):
+                self.text_resultados.delete(1.0, tk.END)
+                self.text_resultados.insert(tk.END, f"=== MEJORES SEMILLAS ({self.metodo_actual}) ===\n", "title")
+                if constante is not None:
+                    self.text_resultados.insert(tk.END, f"{'Constante:':<25} {constante}\n")
+                self.text_resultados.insert(tk.END, f"{'Semilla':<12} {'Cola':<12} {'Periodo':<12} {'Distintos':<12}\n")
+                self.text_resultados.insert(tk.END, "-"*48 + "\n", "divider")
+                for semilla, cola, periodo in mejores:
+                    self.text_resultados.insert(tk.END, f"{semilla:<12} {cola:<12} {periodo:<12} {cola + periodo:<12}\n")
+
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al analizar semillas: {str(e)}")
+    
+    def buscar_parametros(self, metodo):
+        """Recorre las 10^4 semillas (con la otra semilla o la constante fijas) y las ordena por la batería"""
+        try:
+            n = self.n.get()
+            confianza = self.confianza_uniformidad.get()
+            intervalos = self.intervalos_chi.get()
+            semillas2 = [self.semilla2_medios.get()] if metodo == 'productos_medios' else None
+            constantes = [self.constante_multiplicador.get()] if metodo == 'multiplicador_constante' else None
+            digitos = self.digitos.get()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al buscar parámetros: {str(e)}")
+            return
+        if digitos != 4:
+            messagebox.showwarning("Advertencia", "La búsqueda por pruebas es solo para 4 dígitos")
+            return
+        
+        self.ejecutar_en_segundo_plano(
+            "Buscando",
+            lambda avisar, cancelado: ParameterSearch.buscar(
+                metodo, n=n, constantes=constantes, semillas2=semillas2, confianza=confianza,
+                intervalos=intervalos, cantidad=15, al_avanzar=lambda hechos, total: avisar(hechos / total)),
+            lambda resultado: self.mostrar_busqueda(resultado, n, semillas2, constantes))
+    
+    @Profiler.medido('interfaz.texto.busqueda')
+    def mostrar_busqueda(self, resultado, n, semillas2, constantes):
+        self.text_resultados.delete(1.0, tk.END)
+        self.text_resultados.insert(tk.END, f"=== BÚSQUEDA POR PRUEBAS ({self.metodo_actual}) ===\n", "title")
+        if semillas2 is not None:
+            self.text_resultados.insert(tk.END, f"{'Semilla 2:':<25} {semillas2[0]}\n")
+        if constantes is not None:
+            self.text_resultados.insert(tk.END, f"{'Constante:':<25} {constantes[0]}\n")
+        self.text_resultados.insert(tk.END, f"{'Números por semilla:':<25} {n}\n")
+        self.text_resultados.insert(tk.END, f"{'Evaluadas:':<25} {resultado['evaluados']}\n")
+        self.text_resultados.insert(tk.END, f"{'Podadas (degeneran):':<25} {resultado['podados']['degenera']}\n")
+        self.text_resultados.insert(tk.END, f"{'Podadas (ciclo corto):':<25} {resultado['podados']['ciclo_corto']}\n\n")
+        self.text_resultados.insert(tk.END, f"{'Semilla':<12} {'Aprobadas':<12} {'Cola':<12} {'Periodo':<12} {'Distintos':<12}\n")
+        self.text_resultados.insert(tk.END, "-"*60 + "\n", "divider")
+        for fila in resultado['ranking']:
+            cola, periodo, distintos = (("-" if v is None else v) for v in (fila['cola'], fila['periodo'], fila['distintos']))
+            self.text_resultados.insert(tk.END, f"{fila['semillas'][0]:<12} {str(fila['aprobadas']) + '/' + str(fila['total']):<12} "
+                                                f"{cola:<12} {periodo:<12} {distintos:<12}\n")
+    
+    # ==================== PRUEBAS ESTADÍSTICAS ====================
+    def prueba_medias(self):
+        if not len(self.numeros_generados):
+            messagebox.showwarning("Advertencia", "Primero genere números aleatorios")
+            return
+        
+        try:
+            confianza = self.confianza_medias.get()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en prueba de medias: {str(e)}")
+            return
+        numeros = self.numeros_generados
+        self.ejecutar_en_segundo_plano(
+            "Prueba de medias",
+            lambda avisar, cancelado: StatisticalTests.media_test(numeros, confianza),
+            lambda resultado: self.mostrar_prueba_medias(resultado, len(numeros), confianza))
+    
+    @Profiler.medido('interfaz.texto.prueba_medias')
+    def mostrar_prueba_medias(self, resultado, cantidad, confianza, limpiar=True):
+        media, li, ls, z_alpha, pasa_prueba = resultado
+        
+        if limpiar:
+            self.text_resultados.delete(1.0, tk.END)
+        self.text_resultados.insert(tk.END, f"=== PRUEBA DE MEDIAS ({self.metodo_actual}) ===\n", "title")
+        self.text_resultados.insert(tk.END, f"{'Cantidad de números:':<25} {cantidad:>10}\n")
+        self.text_resultados.insert(tk.END, f"{'Media calculada:':<25} {media:.6f}\n")
+        self.text_resultados.insert(tk.END, f"{'Límite inferior:':<25} {li:.6f}\n")
+        self.text_resultados.insert(tk.END, f"{'Límite superior:':<25} {ls:.6f}\n")
+        self.text_resultados.insert(tk.END, f"{'Valor Z_alpha:':<25} {z_alpha:.4f}\n")
+        self.text_resultados.insert(tk.END, f"{'Nivel de confianza:':<25} {confianza}\n")
+        
+        if pasa_prueba:
+            self.text_resultados.insert(tk.END, "✅ CONCLUSIÓN: Los números pasan la prueba de medias\n", "success")
+        else:
+            self.text_resultados.insert(tk.END, "❌ CONCLUSIÓN: Los números NO pasan la prueba de medias\n", "error")
+    
+    def prueba_varianza(self):
+        if not len(self.numeros_generados):
+            messagebox.showwarning("Advertencia", "Primero genere números aleatorios")
+            return
+        
+        try:
+            confianza = self.confianza_varianza.get()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en prueba de varianza: {str(e)}")
+            return
+        numeros = self.numeros_generados
+        self.ejecutar_en_segundo_plano(
+            "Prueba de varianza",
+            lambda avisar, cancelado: StatisticalTests.varianza_test(numeros, confianza),
+            lambda resultado: self.mostrar_prueba_varianza(resultado, len(numeros), confianza))
+    
+    @Profiler.medido('interfaz.texto.prueba_varianza')
+    def mostrar_prueba_varianza(self, resultado, cantidad, confianza, limpiar=True):
+        varianza, li, ls, chi2_inf, chi2_sup, pasa_prueba = resultado
+        
+        if limpiar:
+            self.text_resultados.delete(1.0, tk.END)
+        self.text_resultados.insert(tk.END, f"=== PRUEBA DE VARIANZA ({self.metodo_actual}) ===\n", "title")
+        self.text_resultados.insert(tk.END, f"{'Cantidad de números:':<25} {cantidad:>10}\n")
+        self.text_resultados.insert(tk.END, f"{'Varianza calculada:':<25} {varianza:.6f}\n")
+        self.text_resultados.insert(tk.END, f"{'Límite inferior:':<25} {li:.6f}\n")
+        self.text_resultados.insert(tk.END, f"{'Límite superior:':<25} {ls:.6f}\n")
+        self.text_resultados.insert(tk.END, f"{'Chi² inferior:':<25} {chi2_inf:.4f}\n")
+        self.text_resultados.insert(tk.END, f"{'Chi² superior:':<25} {chi2_sup:.4f}\n")
+        self.text_resultados.insert(tk.END, f"{'Nivel de confianza:':<25} {confianza}\n")
+        
+        if pasa_prueba:
+            self.text_resultados.insert(tk.END, "✅ CONCLUSIÓN: Los números pasan la prueba de varianza\n", "success")
+        else:
+            self.text_resultados.insert(tk.END, "❌ CONCLUSIÓN: Los números NO pasan la prueba de varianza\n", "error")
+    
+    def prueba_uniformidad(self):
+        if not len(self.numeros_generados):
+            messagebox.showwarning("Advertencia", "Primero genere números aleatorios")
+            return
+        
+        try:
+            intervalos = self.intervalos_chi.get()
+            confianza = self.confianza_uniformidad.get()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en prueba de uniformidad: {str(e)}")
+            return
+        # Los conteos por yi* de la traza (hasta 6 dígitos) se comparten con el histograma
+        traza = self.historial_generacion
+        self.ejecutar_en_segundo_plano(
+            "Prueba de uniformidad",
+            lambda avisar, cancelado: StatisticalTests.uniformidad_traza(traza, intervalos, confianza),
+            lambda resultado: self.mostrar_prueba_uniformidad(resultado, len(traza), confianza))
+    
+    @Profiler.medido('interfaz.texto.prueba_uniformidad')
+    def mostrar_prueba_uniformidad(self, resultado, cantidad, confianza, limpiar=True):
+        frec_obs, frec_esp, chi2_calculado, chi2_critico, gl, bins, pasa_prueba = resultado
+        intervalos = len(frec_obs)
+        
+        if limpiar:
+            self.text_resultados.delete(1.0, tk.END)
+        self.text_resultados.insert(tk.END, f"=== PRUEBA DE UNIFORMIDAD (CHI-CUADRADA) ({self.metodo_actual}) ===\n", "title")
+        self.text_resultados.insert(tk.END, f"{'Cantidad de números:':<25} {cantidad:>10}\n")
+        self.text_resultados.insert(tk.END, f"{'Número de intervalos:':<25} {intervalos:>10}\n")
+        self.text_resultados.insert(tk.END, f"{'Frecuencia esperada:':<25} {frec_esp:.2f}\n")
+        self.text_resultados.insert(tk.END, f"{'Chi-cuadrado calculado:':<25} {chi2_calculado:.4f}\n")
+        self.text_resultados.insert(tk.END, f"{'Chi-cuadrado crítico:':<25} {chi2_critico:.4f}\n")
+        self.text_resultados.insert(tk.END, f"{'Grados de libertad:':<25} {gl:>10}\n")
+        self.text_resultados.insert(tk.END, f"{'Nivel de confianza:':<25} {confianza}\n")
+        # Mostrar tabla de frecuencias
+        self.text_resultados.insert(tk.END, "\nTABLA DE FRECUENCIAS:\n", "subtitle")
+        self.text_resultados.insert(tk.END, f"{'Intervalo':<15} {'Frec. Observada':<15} {'Frec. Esperada':<15} {'Diferencia':<15}\n")
+        self.text_resultados.insert(tk.END, "-"*60 + "\n")
+        
+        for i in range(intervalos):
+            intervalo = f"[{bins[i]:.2f}-{bins[i+1]:.2f})"
+            diferencia = (frec_obs[i] - frec_esp)**2 / frec_esp
+            self.text_resultados.insert(tk.END, f"{intervalo:<15} {frec_obs[i]:<15.0f} {frec_esp:<15.2f} {diferencia:<15.4f}\n")
+        
+        if pasa_prueba:
+            self.text_resultados.insert(tk.END, "✅ CONCLUSIÓN: Los números pasan la prueba de uniformidad\n", "success")
+        else:
+            self.text_resultados.insert(tk.END, "❌ CONCLUSIÓN: Los números NO pasan la prueba de uniformidad\n", "error")
+    
+    def probar_archivo(self):
+        archivo = filedialog.askopenfilename(
+            filetypes=[("Números", "*.npy *.bin *.f64 *.raw"), ("Todos los archivos", "*.*")],
+            title="Probar archivo de números"
+        )
+        if not archivo:
+            return
+        
+        try:
+            intervalos = self.intervalos_chi.get()
+            confianzas = (self.confianza_medias.get(), self.confianza_varianza.get(), self.confianza_uniformidad.get())
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en las pruebas: {str(e)}")
+            return
+        
+        def trabajo(avisar, cancelado):
+            acumulador = StatisticalAccumulator(intervalos)
+            total = max(len(StreamExport.abrir_numeros(archivo)[0]), 1)
+            for bloque in StreamExport.bloques_archivo(archivo, 1 << 20, lambda: not cancelado.is_set()):
+                acumulador.agregar(bloque)
+                avisar(acumulador.n / total)
+            if acumulador.n < 2:
+                raise ValueError("Las pruebas necesitan al menos 2 números")
+            return acumulador
+        
+        def al_terminar(acumulador):
+            self.metodo_actual = f"Archivo {os.path.basename(archivo)}"
+            self.text_resultados.delete(1.0, tk.END)
+            self.mostrar_prueba_medias(acumulador.media_test(confianzas[0]), acumulador.n, confianzas[0], limpiar=False)
+            self.text_resultados.insert(tk.END, "\n")
+            self.mostrar_prueba_varianza(acumulador.varianza_test(confianzas[1]), acumulador.n, confianzas[1], limpiar=False)
+            self.text_resultados.insert(tk.END, "\n")
+            self.mostrar_prueba_uniformidad(acumulador.uniformidad_test(confianzas[2]), acumulador.n, confianzas[2], limpiar=False)
+        
+        self.ejecutar_en_segundo_plano("Probando archivo", trabajo, al_terminar)
+    
+    def ejecutar_bateria(self):
+        if not len(self.numeros_generados):
+            messagebox.showwarning("Advertencia", "Primero genere números aleatorios")
+            return
+        
+        try:
+            confianza = self.confianza_uniformidad.get()
+            intervalos = self.intervalos_chi.get()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error en la batería de pruebas: {str(e)}")
+            return
+        numeros = self.numeros_generados
+        digitos = StatisticalTests.digitos_poker(self.historial_generacion.escala)
+        self.ejecutar_en_segundo_plano(
+            "Batería de pruebas",
+            lambda avisar, cancelado: TestBattery.ejecutar(
+                numeros, confianza, intervalos, al_avanzar=lambda hechas, total: avisar(hechas / total),
+                digitos=digitos),
+            self.mostrar_informe_bateria)
+    
+    @Profiler.medido('interfaz.texto.bateria')
+    def mostrar_informe_bateria(self, informe):
+        self.text_resultados.delete(1.0, tk.END)
+        self.text_resultados.insert(tk.END, f"=== BATERÍA COMPLETA DE PRUEBAS ({self.metodo_actual}) ===\n", "title")
+        self.text_resultados.insert(tk.END, f"{'Cantidad de números:':<25} {informe['n']:>10}\n")
+        self.text_resultados.insert(tk.END, f"{'Nivel de confianza:':<25} {informe['confianza']}\n\n")
+        self.text_resultados.insert(tk.END, f"{'Prueba':<24} {'Estadístico':>14} {'Crítico':>26}  Resultado\n")
+        self.text_resultados.insert(tk.END, "-"*75 + "\n")
+        
+        for nombre, resultado in informe['pruebas'].items():
+            if 'error' in resultado:
+                self.text_resultados.insert(tk.END, f"{nombre:<24} {resultado['error']}\n", "error")
+                continue
+            critico = resultado['critico']
+            critico = f"[{critico[0]:.4f}, {critico[1]:.4f}]" if isinstance(critico, list) else f"{critico:.4f}"
+            veredicto = "✅ pasa" if resultado['pasa'] else "❌ no pasa"
+            self.text_resultados.insert(tk.END, f"{nombre:<24} {resultado['estadistico']:>14.4f} {critico:>26}  {veredicto}\n",
+                                        "success" if resultado['pasa'] else "error")
+        
+        conclusion = f"{informe['aprobadas']} de {informe['total']} pruebas aprobadas"
+        if informe['pasa']:
+            self.text_resultados.insert(tk.END, f"\n✅ CONCLUSIÓN: {conclusion}\n", "success")
+        else:
+            self.text_resultados.insert(tk.END, f"\n❌ CONCLUSIÓN: {conclusion}\n", "error")
+    
+    @Profiler.medido('interfaz.histograma')
+    def mostrar_histograma(self):
+        if not len(self.numeros_generados):
+            messagebox.showwarning("Advertencia", "Primero genere números aleatorios")
+            return
+        
+        try:
+            if self.ventana_histograma is None or not self.ventana_histograma.winfo_exists():
+                self.crear_histograma()
+            self.refrescar_histograma()
+            self.ventana_histograma.lift()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al mostrar histograma: {str(e)}")
+    
+    def crear_histograma(self):
+        """Ventana, figura y artistas vacíos; refrescar_histograma les pone los datos"""
+        # matplotlib solo se carga la primera vez que se pide un histograma
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        
+        ventana_hist = tk.Toplevel(self.root)
+        ventana_hist.title("Histograma de Números Generados")
+        ventana_hist.geometry("900x700")
+        ventana_hist.configure(bg=self.colors["bg_dark"])
+        
+        fig = Figure(figsize=(9, 7), dpi=100)
+        ax = fig.add_subplot(111)
+        
+        # Barras como escalones: un solo artista cuyo costo depende de los intervalos, no de n
+        self.escalones_histograma = ax.stairs([0], [0, 1], fill=True, color=self.colors["accent"], alpha=0.7)
+        
+        # Densidad esperada de una uniforme en [0, 1)
+        ax.axhline(1.0, color=self.colors["highlight"], linestyle='--',
+                   linewidth=2, label='Densidad Esperada (1.0)')
+        
+        # Línea que sigue la forma del histograma
+        self.linea_histograma, = ax.plot([], [], color=self.colors["neon"], linestyle='-',
+                                         linewidth=2, markersize=4, label='Frecuencia Observada')
+        
+        # Personalizar el gráfico
+        ax.set_title('Distribución de Números Pseudoaleatorios', 
+                    color=self.colors["text"], fontsize=14, pad=20)
+        ax.set_xlabel('Valor', color=self.colors["text"], fontsize=12)
+        ax.set_ylabel('Densidad de Frecuencia', color=self.colors["text"], fontsize=12)
+        ax.tick_params(colors=self.colors["text"])
+        ax.set_xlim(0, 1)
+        
+        # Cambiar color del fondo
+        ax.set_facecolor(self.colors["bg_light"])
+        fig.patch.set_facecolor(self.colors["bg_dark"])
+        
+        # Añadir cuadrícula y leyenda
+        ax.grid(True, alpha=0.3, color=self.colors["neon"])
+        ax.legend()
+        
+        # Integrar matplotlib con tkinter
+        self.canvas_histograma = FigureCanvasTkAgg(fig, master=ventana_hist)
+        self.canvas_histograma.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.ejes_histograma = ax
+        self.ventana_histograma = ventana_hist
+        
+        # Añadir botón de cerrar
+        btn_cerrar = self.crear_boton(ventana_hist, "Cerrar", ventana_hist.destroy)
+        btn_cerrar.pack(pady=10)
+    
+    def refrescar_histograma(self):
+        """Actualiza en el lugar los artistas del histograma abierto con los conteos de la traza actual"""
+        if self.ventana_histograma is None or not self.ventana_histograma.winfo_exists():
+            return
+        traza = self.historial_generacion
+        if not len(traza):
+            return
+        
+        frec_obs, bins = StatisticalTests.frecuencias_traza(traza, self.intervalos_chi.get())
+        densidad = frec_obs / (len(traza) * np.diff(bins))
+        self.escalones_histograma.set_data(densidad, bins)
+        self.linea_histograma.set_data(0.5 * (bins[:-1] + bins[1:]), densidad)
+        self.linea_histograma.set_marker('o' if len(densidad) <= self.MAX_MARCADORES else '')
+        self.ejes_histograma.set_ylim(0, 1.15 * max(densidad.max(), 1.0))
+        with Profiler.medir('interfaz.histograma.dibujo'):
+            self.canvas_histograma.draw()
+    
+    # ==================== ESTADÍSTICAS DE RENDIMIENTO ====================
+    def mostrar_estadisticas(self):
+        """Ventana con los temporizadores y contadores de Profiler; se refresca mientras esté abierta"""
+        if self.ventana_estadisticas is not None and self.ventana_estadisticas.winfo_exists():
+            self.ventana_estadisticas.lift()
+            return
+        
+        ventana = tk.Toplevel(self.root)
+        ventana.title("Estadísticas de Rendimiento")
+        ventana.geometry("800x500")
+        ventana.configure(bg=self.colors["bg_dark"])
+        self.ventana_estadisticas = ventana
+        
+        frame_controles = self.crear_frame_estilo(ventana)
+        frame_controles.pack(fill='x', padx=10, pady=10)
+        self.crear_casilla(frame_controles, "Medir", self.perfil_activo).pack(side='left', padx=5)
+        self.crear_boton(frame_controles, "Reiniciar", Profiler.reiniciar, width=12).pack(side='left', padx=5)
+        self.crear_boton(frame_controles, "Exportar JSON", self.exportar_estadisticas, width=15).pack(side='left', padx=5)
+        self.crear_boton(frame_controles, "Cerrar", ventana.destroy, width=12).pack(side='right', padx=5)
+        
+        encabezados = {'nombre': "Medición", 'llamadas': "Llamadas / Cantidad", 'total': "Total (ms)",
+                       'media': "Media (ms)", 'maximo': "Máximo (ms)"}
+        self.tabla_estadisticas = ttk.Treeview(ventana, columns=tuple(encabezados), show='headings',
+                                               style='Neon.Treeview')
+        for columna, texto in encabezados.items():
+            self.tabla_estadisticas.heading(columna, text=texto)
+            self.tabla_estadisticas.column(columna, width=260 if columna == 'nombre' else 120,
+                                           anchor='w' if columna == 'nombre' else 'e')
+        self.tabla_estadisticas.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+        self.refrescar_estadisticas(ventana)
+    
+    def refrescar_estadisticas(self, ventana):
+        # Cada ventana lleva su propio ciclo de refresco, que termina al cerrarla
+        if ventana is not self.ventana_estadisticas or not ventana.winfo_exists():
+            if ventana is self.ventana_estadisticas:
+                self.ventana_estadisticas = None
+                self.tabla_estadisticas = None
+            return
+        
+        informe = Profiler.informe()
+        self.tabla_estadisticas.delete(*self.tabla_estadisticas.get_children())
+        for nombre, tiempo in informe['temporizadores'].items():
+            self.tabla_estadisticas.insert('', 'end', values=(
+                nombre, tiempo['llamadas'], f"{1000 * tiempo['total']:.2f}",
+                f"{1000 * tiempo['media']:.3f}", f"{1000 * tiempo['maximo']:.3f}"))
+        for nombre, cantidad in informe['contadores'].items():
+            self.tabla_estadisticas.insert('', 'end', values=(nombre, cantidad, "", "", ""))
+        self.root.after(self.INTERVALO_ESTADISTICAS, self.refrescar_estadisticas, ventana)
+    
+    def exportar_estadisticas(self):
+        archivo = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json"), ("Todos los archivos", "*.*")],
+            title="Exportar estadísticas como"
+        )
+        if not archivo:
+            return
+        try:
+            Profiler.volcar(archivo)
+            messagebox.showinfo("Éxito", f"Estadísticas exportadas correctamente a:\n{archivo}")
+        except OSError as e:
+            messagebox.showerror("Error", f"Error al exportar estadísticas: {str(e)}")
+    
+    # ==================== EXPORTACIÓN DE DATOS ====================
+    def exportar_datos(self):
+        traza = self.traza_en_tabla()
+        if traza is None:
+            messagebox.showwarning("Advertencia", "Primero genere números aleatorios")
+            return
+        
+        archivo = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV con el historial", "*.csv"), ("NumPy float64", "*.npy"),
+                       ("Binario compacto", "*.bin")],
+            title="Exportar datos como"
+        )
+        if not archivo:
+            return
+        
+        # Se vuelve a generar desde las semillas en lugar de leer la traza en memoria
+        n = len(traza)
+        if isinstance(traza, CongruentialTrace):
+            flujo = CongruentialStream(traza.metodo, traza.semillas, traza.parametros, n)
+        else:
+            flujo = GenerationStream(traza.metodo, traza.semillas, traza.constante, n, digitos=traza.digitos)
+        
+        def trabajo(avisar, cancelado):
+            def continuar():
+                avisar(flujo.generados / n)
+                return not cancelado.is_set()
+            return StreamExport.exportar(flujo, archivo, columnas=traza.columnas,
+                                         tam_bloque=self.TAM_BLOQUE, continuar=continuar)
+        
+        self.ejecutar_en_segundo_plano(
+            "Exportando", trabajo,
+            lambda escritos: messagebox.showinfo("Éxito", f"{escritos} números exportados correctamente a:\n{archivo}"))
+    
+    # ==================== EXPORTACIÓN A TXT ====================
+    def exportar_txt(self):
+        if not len(self.numeros_generados):
+            messagebox.showwarning("Advertencia", "Primero genere números aleatorios")
+            return
+        
+        try:
+            # Obtener el contenido del área de texto
+            contenido = self.text_resultados.get(1.0, tk.END)
+            
+            # Solicitar al usuario dónde guardar el archivo
+            archivo = filedialog.asksaveasfilename(
+                defaultextension=".txt",
+                filetypes=[("Archivos de texto", "*.txt"), ("Todos los archivos", "*.*")],
+                title="Guardar resultados como"
+            )
+            
+            if archivo:
+                # Guardar el contenido en el archivo
+                with open(archivo, 'w', encoding='utf-8') as f:
+                    f.write(f"Resultados de {self.metodo_actual}\n")
+                    f.write(f"Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                    f.write("="*50 + "\n")
+                    f.write(contenido)
+                
+                messagebox.showinfo("Éxito", f"Resultados exportados correctamente a:\n{archivo}")
+                
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al exportar a TXT: {str(e)}")
+
+# ==================== FUNCIÓN PRINCIPAL ====================
+def main():
+    root = tk.Tk()
+    app = RandomNumberApp(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+
+    main()
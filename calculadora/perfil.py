@@ -0,0 +1,106 @@
+"""Temporizadores y contadores de rendimiento que se encienden en tiempo de ejecución"""
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# ==================== INSTRUMENTACIÓN ====================
+class Profiler:
+    """Registro global de tiempos y contadores de la generación, las pruebas y la interfaz.
+
+    Apagado por defecto: cada punto medido solo consulta `Profiler.activo` y sigue,
+    sin tomar el reloj ni el cerrojo. Encendido, cada temporizador acumula llamadas,
+    tiempo total, mínimo y máximo, y cada contador una suma (por ejemplo números
+    generados). Los nombres van por capas con puntos: 'generacion.*', 'pruebas.*',
+    'interfaz.*'. Las pruebas que la batería corre en otros procesos no se ven aquí;
+    sí el tiempo total de la batería.
+    """
+    activo = False
+    _cerrojo = threading.Lock()
+    # nombre -> [llamadas, segundos totales, mínimo, máximo]
+    _temporizadores = {}
+    _contadores = {}
+
+    @staticmethod
+    def activar(activo=True):
+        Profiler.activo = bool(activo)
+
+    @staticmethod
+    def desactivar():
+        Profiler.activo = False
+
+    @staticmethod
+    def reiniciar():
+        with Profiler._cerrojo:
+            Profiler._temporizadores.clear()
+            Profiler._contadores.clear()
+
+    @staticmethod
+    def registrar(nombre, segundos):
+        with Profiler._cerrojo:
+            registro = Profiler._temporizadores.get(nombre)
+            if registro is None:
+                Profiler._temporizadores[nombre] = [1, segundos, segundos, segundos]
+            else:
+                registro[0] += 1
+                registro[1] += segundos
+                registro[2] = min(registro[2], segundos)
+                registro[3] = max(registro[3], segundos)
+
+    @staticmethod
+    def contar(nombre, cantidad=1):
+        if not Profiler.activo:
+            return
+        with Profiler._cerrojo:
+            Profiler._contadores[nombre] = Profiler._contadores.get(nombre, 0) + cantidad
+
+    @staticmethod
+    def medido(nombre):
+        """Decorador que cronometra cada llamada a la función bajo `nombre`"""
+        def decorar(funcion):
+            @functools.wraps(funcion)
+            def envoltura(*args, **kwargs):
+                if not Profiler.activo:
+                    return funcion(*args, **kwargs)
+                inicio = time.perf_counter()
+                try:
+                    return funcion(*args, **kwargs)
+                finally:
+                    Profiler.registrar(nombre, time.perf_counter() - inicio)
+            return envoltura
+        return decorar
+
+    @staticmethod
+    @contextmanager
+    def medir(nombre):
+        """Cronometra el bloque `with` bajo `nombre`"""
+        if not Profiler.activo:
+            yield
+            return
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            Profiler.registrar(nombre, time.perf_counter() - inicio)
+
+    @staticmethod
+    def informe():
+        """{'activo', 'temporizadores': {nombre: {llamadas, total, media, minimo, maximo}}, 'contadores'}, en segundos"""
+        with Profiler._cerrojo:
+            temporizadores = {
+                nombre: {'llamadas': llamadas, 'total': total, 'media': total / llamadas,
+                         'minimo': minimo, 'maximo': maximo}
+                for nombre, (llamadas, total, minimo, maximo) in sorted(Profiler._temporizadores.items())
+            }
+            contadores = dict(sorted(Profiler._contadores.items()))
+        return {'activo': Profiler.activo, 'temporizadores': temporizadores, 'contadores': contadores}
+
+    @staticmethod
+    def volcar(destino):
+        """Escribe el informe como JSON en una ruta o un archivo de texto abierto"""
+        if isinstance(destino, str):
+            with open(destino, 'w', encoding='utf-8') as salida:
+                return Profiler.volcar(salida)
+        json.dump(Profiler.informe(), destino, indent=1)
+        destino.write('\n')
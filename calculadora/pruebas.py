@@ -0,0 +1,419 @@
+"""Pruebas estadísticas de medias, varianza, uniformidad y la batería extendida"""
+import math
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+from .criticos import CriticalValues
+from .perfil import Profiler
+from .traza import MAX_DIGITOS_CONTEOS
+
+# ==================== CLASE PARA PRUEBAS ESTADÍSTICAS ====================
+class StatisticalTests:
+    @staticmethod
+    def norm_ppf(p):
+        """Percentil de la distribución normal"""
+        return CriticalValues.norm_ppf(CriticalValues._clave(p))
+    
+    @staticmethod
+    def chi2_ppf(p, df):
+        """Percentil de chi-cuadrado"""
+        return CriticalValues.chi2_ppf(p, df)
+
+    @staticmethod
+    @Profiler.medido('pruebas.media_test')
+    def media_test(numeros, confianza=0.95):
+        return StatisticalTests._media_desde(np.mean(numeros), len(numeros), confianza)
+
+    @staticmethod
+    def _media_desde(media, n, confianza):
+        z_alpha = StatisticalTests.norm_ppf(1 - (1 - confianza) / 2)
+        li = 0.5 - z_alpha * (1 / np.sqrt(12 * n))
+        ls = 0.5 + z_alpha * (1 / np.sqrt(12 * n))
+        pasa_prueba = li <= media <= ls
+        return media, li, ls, z_alpha, pasa_prueba
+
+    @staticmethod
+    @Profiler.medido('pruebas.varianza_test')
+    def varianza_test(numeros, confianza=0.95):
+        return StatisticalTests._varianza_desde(np.var(numeros), len(numeros), confianza)
+
+    @staticmethod
+    def _varianza_desde(varianza, n, confianza):
+        alpha = 1 - confianza
+        chi2_inf = StatisticalTests.chi2_ppf(alpha/2, n-1)
+        chi2_sup = StatisticalTests.chi2_ppf(1-alpha/2, n-1)
+        li = chi2_inf / (12 * (n - 1))
+        ls = chi2_sup / (12 * (n - 1))
+        pasa_prueba = li <= varianza <= ls
+        return varianza, li, ls, chi2_inf, chi2_sup, pasa_prueba
+
+    @staticmethod
+    @Profiler.medido('pruebas.uniformidad_test')
+    def uniformidad_test(numeros, intervalos=10, confianza=0.95):
+        frec_obs, bins = np.histogram(numeros, bins=intervalos, range=(0, 1))
+        return StatisticalTests._uniformidad_desde(frec_obs, bins, len(numeros), confianza)
+
+    @staticmethod
+    def frecuencias_desde_conteos(conteos, intervalos=10, escala=10000):
+        """(frec_obs, bins) de np.histogram a partir de cuántas veces aparece cada valor/escala.
+
+        Se agrupan los valores distintos con sus conteos como pesos, así que el costo
+        no depende de n y las frecuencias coinciden exactamente con las de
+        uniformidad_test sobre la secuencia completa.
+        """
+        frec_obs, bins = np.histogram(np.arange(len(conteos)) / float(escala), bins=intervalos, range=(0, 1),
+                                      weights=conteos)
+        return frec_obs.astype(np.int64), bins
+
+    @staticmethod
+    @Profiler.medido('pruebas.uniformidad_test')
+    def uniformidad_desde_conteos(conteos, intervalos=10, confianza=0.95, escala=10000):
+        """uniformidad_test a partir de los conteos por valor (por ejemplo GenerationTrace.conteos)"""
+        frec_obs, bins = StatisticalTests.frecuencias_desde_conteos(conteos, intervalos, escala)
+        return StatisticalTests._uniformidad_desde(frec_obs, bins, int(np.sum(conteos)), confianza)
+
+    @staticmethod
+    def frecuencias_traza(traza, intervalos=10):
+        """(frec_obs, bins) de una GenerationTrace: por conteos si el ancho lo permite, si no sobre los ri"""
+        if traza.digitos <= MAX_DIGITOS_CONTEOS:
+            return StatisticalTests.frecuencias_desde_conteos(traza.conteos, intervalos, traza.escala)
+        return np.histogram(traza.ri, bins=intervalos, range=(0, 1))
+
+    @staticmethod
+    @Profiler.medido('pruebas.uniformidad_test')
+    def uniformidad_traza(traza, intervalos=10, confianza=0.95):
+        """uniformidad_test de una GenerationTrace de cualquier ancho de dígitos"""
+        frec_obs, bins = StatisticalTests.frecuencias_traza(traza, intervalos)
+        return StatisticalTests._uniformidad_desde(frec_obs, bins, len(traza), confianza)
+
+    @staticmethod
+    def _uniformidad_desde(frec_obs, bins, n, confianza):
+        intervalos = len(frec_obs)
+        frec_esp = n / intervalos
+        chi2_calculado = np.sum((frec_obs - frec_esp)**2 / frec_esp)
+        grados_libertad = intervalos - 1
+        chi2_critico = StatisticalTests.chi2_ppf(confianza, grados_libertad)
+        pasa_prueba = chi2_calculado <= chi2_critico
+        return frec_obs, frec_esp, chi2_calculado, chi2_critico, grados_libertad, bins, pasa_prueba
+
+    # -------------------- Batería extendida --------------------
+    # Las pruebas siguientes trabajan sobre arreglos completos (o memmaps) con NumPy;
+    # las que generan temporales grandes recorren los datos de a BLOQUE valores.
+    BLOQUE = 1 << 22
+    # Manos y probabilidades del póker de 4 dígitos; otros anchos salen de _clases_poker
+    MANOS_POKER = ('todos_diferentes', 'un_par', 'dos_pares', 'tercia', 'poker')
+    PROB_POKER = (0.504, 0.432, 0.027, 0.036, 0.001)
+    # El póker lee los dígitos de rint(ri * 10^digitos): más de 15 no caben en un float64
+    MAX_DIGITOS_POKER = 15
+    # Hasta este ancho la mano de cada valor posible se precalcula en una tabla
+    MAX_DIGITOS_TABLA_POKER = 6
+    # Frecuencia esperada mínima de cada clase de la chi-cuadrada
+    MIN_ESPERADA = 5
+
+    @staticmethod
+    def _z_alpha(confianza):
+        return StatisticalTests.norm_ppf(1 - (1 - confianza) / 2)
+
+    @staticmethod
+    def _chi2_desde(frec_obs, frec_esp, confianza):
+        chi2_calculado = np.sum((frec_obs - frec_esp)**2 / frec_esp)
+        grados_libertad = frec_obs.size - 1
+        chi2_critico = StatisticalTests.chi2_ppf(confianza, grados_libertad)
+        return chi2_calculado, chi2_critico, grados_libertad, chi2_calculado <= chi2_critico
+
+    @staticmethod
+    @Profiler.medido('pruebas.corridas_arriba_abajo_test')
+    def corridas_arriba_abajo_test(numeros, confianza=0.95):
+        """Corridas ascendentes y descendentes: cuenta los cambios de dirección"""
+        numeros = np.asarray(numeros)
+        n = len(numeros)
+        if n < 3:
+            raise ValueError("La prueba de corridas necesita al menos 3 números")
+        corridas = 1
+        anterior = None
+        for inicio in range(0, n - 1, StatisticalTests.BLOQUE):
+            bloque = numeros[inicio:inicio + StatisticalTests.BLOQUE + 1]
+            sube = bloque[1:] > bloque[:-1]
+            corridas += int(np.count_nonzero(sube[1:] != sube[:-1]))
+            if anterior is not None and anterior != sube[0]:
+                corridas += 1
+            anterior = sube[-1]
+        media_c = (2 * n - 1) / 3
+        varianza_c = (16 * n - 29) / 90
+        z = (corridas - media_c) / np.sqrt(varianza_c)
+        z_alpha = StatisticalTests._z_alpha(confianza)
+        return corridas, media_c, varianza_c, z, z_alpha, abs(z) <= z_alpha
+
+    @staticmethod
+    @Profiler.medido('pruebas.corridas_media_test')
+    def corridas_media_test(numeros, confianza=0.95):
+        """Corridas por encima y por debajo de la media teórica 0.5"""
+        numeros = np.asarray(numeros)
+        n = len(numeros)
+        corridas, n1, anterior = 0, 0, None
+        for inicio in range(0, n, StatisticalTests.BLOQUE):
+            arriba = numeros[inicio:inicio + StatisticalTests.BLOQUE] >= 0.5
+            n1 += int(np.count_nonzero(arriba))
+            corridas += int(np.count_nonzero(arriba[1:] != arriba[:-1])) + (anterior is None or anterior != arriba[0])
+            anterior = arriba[-1]
+        n0 = n - n1
+        if not n0 or not n1:
+            raise ValueError("Todos los números quedan del mismo lado de la media")
+        media_c = 2 * n0 * n1 / n + 0.5
+        varianza_c = 2 * n0 * n1 * (2 * n0 * n1 - n) / (n * n * (n - 1))
+        z = (corridas - media_c) / np.sqrt(varianza_c)
+        z_alpha = StatisticalTests._z_alpha(confianza)
+        return corridas, n0, n1, media_c, varianza_c, z, z_alpha, abs(z) <= z_alpha
+
+    @staticmethod
+    @Profiler.medido('pruebas.autocorrelacion_test')
+    def autocorrelacion_test(numeros, retardo=1, confianza=0.95, inicio=0):
+        """Autocorrelación de retardo k entre numeros[inicio], numeros[inicio+k], numeros[inicio+2k]..."""
+        if retardo < 1:
+            raise ValueError("El retardo debe ser al menos 1")
+        serie = np.asarray(numeros)[inicio::retardo]
+        m = len(serie) - 2
+        if m < 1:
+            raise ValueError("Muy pocos números para ese retardo")
+        suma = 0.0
+        for i in range(0, m + 1, StatisticalTests.BLOQUE):
+            bloque = np.asarray(serie[i:i + StatisticalTests.BLOQUE + 1], dtype=np.float64)
+            suma += np.dot(bloque[:-1], bloque[1:])
+        rho = suma / (m + 1) - 0.25
+        sigma = np.sqrt(13 * m + 7) / (12 * (m + 1))
+        z = rho / sigma
+        z_alpha = StatisticalTests._z_alpha(confianza)
+        return rho, sigma, z, z_alpha, abs(z) <= z_alpha
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _clases_poker(digitos):
+        """(códigos, probabilidades) de las manos de `digitos` dígitos.
+
+        Una mano es cuántas veces aparece cada dígito distinto, de mayor a menor; se
+        ordenan de más a menos dígitos distintos (con 4 dígitos, como MANOS_POKER).
+        El código de una mano es la suma de 11^veces sobre los diez dígitos.
+        """
+        manos = []
+
+        def particiones(resto, maximo, mano):
+            if not resto:
+                if len(mano) <= 10:
+                    manos.append(mano)
+                return
+            for parte in range(min(resto, maximo), 0, -1):
+                particiones(resto - parte, parte, mano + (parte,))
+
+        particiones(digitos, digitos, ())
+        manos.sort(key=lambda mano: (-len(mano), mano))
+        codigos = np.array([sum(11 ** veces for veces in mano) + 10 - len(mano) for mano in manos], dtype=np.int64)
+        probabilidades = []
+        for mano in manos:
+            # Dígitos distintos para cada grupo (sin orden entre grupos del mismo tamaño) por posiciones
+            digitos_distintos = math.perm(10, len(mano)) // math.prod(map(math.factorial, Counter(mano).values()))
+            posiciones = math.factorial(digitos) // math.prod(map(math.factorial, mano))
+            probabilidades.append(digitos_distintos * posiciones / 10 ** digitos)
+        return codigos, np.array(probabilidades)
+
+    @staticmethod
+    def _manos(estrellas, digitos):
+        """Índice de la mano (en _clases_poker) de cada valor de `digitos` dígitos"""
+        codigos, _ = StatisticalTests._clases_poker(digitos)
+        orden = np.argsort(codigos)
+        filas = np.arange(len(estrellas))
+        cuentas = np.zeros((len(estrellas), 10), dtype=np.int8)
+        resto = np.asarray(estrellas, dtype=np.int64)
+        for _ in range(digitos):
+            cuentas[filas, resto % 10] += 1
+            resto = resto // 10
+        potencias = 11 ** np.arange(digitos + 1, dtype=np.int64)
+        codigo = np.zeros(len(estrellas), dtype=np.int64)
+        for cifra in range(10):
+            codigo += potencias[cuentas[:, cifra]]
+        return orden[np.searchsorted(codigos, codigo, sorter=orden)].astype(np.int16)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _manos_poker(digitos=4):
+        """Mano de póker de cada yi* de 0 a 10^digitos - 1"""
+        return StatisticalTests._manos(np.arange(10 ** digitos, dtype=np.int64), digitos)
+
+    @staticmethod
+    def _agrupar_raras(frec_obs, frec_esp):
+        """Junta en una última clase las de frecuencia esperada menor que MIN_ESPERADA.
+
+        Si esa clase sigue por debajo se le suman las más raras de las demás; siempre
+        quedan al menos dos clases.
+        """
+        comunes = [i for i in range(len(frec_esp)) if frec_esp[i] >= StatisticalTests.MIN_ESPERADA]
+        raras = [i for i in range(len(frec_esp)) if frec_esp[i] < StatisticalTests.MIN_ESPERADA]
+        if not raras or not comunes:
+            return frec_obs, frec_esp
+        while frec_esp[raras].sum() < StatisticalTests.MIN_ESPERADA and len(comunes) > 1:
+            mas_rara = min(comunes, key=lambda i: frec_esp[i])
+            comunes.remove(mas_rara)
+            raras.append(mas_rara)
+        if len(raras) == 1:
+            return frec_obs, frec_esp
+        return (np.append(frec_obs[comunes], frec_obs[raras].sum()),
+                np.append(frec_esp[comunes], frec_esp[raras].sum()))
+
+    @staticmethod
+    def digitos_poker(escala):
+        """Mayor ancho d con 10^d <= escala: los dígitos de ri que el generador produce completos"""
+        return len(str(int(escala))) - 1
+
+    @staticmethod
+    @Profiler.medido('pruebas.poker_test')
+    def poker_test(numeros, confianza=0.95, digitos=4, exactos=True):
+        """Póker sobre los primeros `digitos` decimales de ri.
+
+        Con exactos=True (salida de un generador, ri = yi* / 10^digitos) se leen de
+        rint(ri * 10^digitos); con exactos=False (números de cualquier otra fuente)
+        se truncan: 0.12349 da la mano de 1234, no la de 1235. Las manos con
+        frecuencia esperada menor que MIN_ESPERADA se juntan en una última clase
+        (ver _agrupar_raras).
+        """
+        if not 2 <= digitos <= StatisticalTests.MAX_DIGITOS_POKER:
+            raise ValueError(f"El póker necesita entre 2 y {StatisticalTests.MAX_DIGITOS_POKER} dígitos")
+        numeros = np.asarray(numeros)
+        escala = 10 ** digitos
+        # Al truncar, el error de redondeo de ri * escala no debe bajar un valor exacto al anterior
+        margen = escala * 2.0 ** -48
+        _, probabilidades = StatisticalTests._clases_poker(digitos)
+        tabla = StatisticalTests._manos_poker(digitos) if digitos <= StatisticalTests.MAX_DIGITOS_TABLA_POKER else None
+        frec_obs = np.zeros(len(probabilidades), dtype=np.int64)
+        for inicio in range(0, len(numeros), StatisticalTests.BLOQUE):
+            bloque = numeros[inicio:inicio + StatisticalTests.BLOQUE] * escala
+            bloque = np.rint(bloque) if exactos else np.floor(bloque + margen)
+            estrellas = bloque.astype(np.int64) % escala
+            manos = tabla[estrellas] if tabla is not None else StatisticalTests._manos(estrellas, digitos)
+            frec_obs += np.bincount(manos, minlength=len(frec_obs))
+        frec_obs, frec_esp = StatisticalTests._agrupar_raras(frec_obs, len(numeros) * probabilidades)
+        chi2_calculado, chi2_critico, grados_libertad, pasa_prueba = StatisticalTests._chi2_desde(frec_obs, frec_esp, confianza)
+        return frec_obs, frec_esp, chi2_calculado, chi2_critico, grados_libertad, pasa_prueba
+
+    @staticmethod
+    @Profiler.medido('pruebas.huecos_test')
+    def huecos_test(numeros, alfa=0.0, beta=0.5, max_hueco=5, confianza=0.95):
+        """Huecos entre apariciones consecutivas de números en [alfa, beta); el último grupo es >= max_hueco"""
+        p = beta - alfa
+        if not 0 < p < 1:
+            raise ValueError("El intervalo [alfa, beta) debe estar dentro de [0, 1)")
+        numeros = np.asarray(numeros)
+        frec_obs = np.zeros(max_hueco + 1, dtype=np.int64)
+        ultima = None
+        for inicio in range(0, len(numeros), StatisticalTests.BLOQUE):
+            bloque = numeros[inicio:inicio + StatisticalTests.BLOQUE]
+            posiciones = np.flatnonzero((bloque >= alfa) & (bloque < beta)) + inicio
+            if not len(posiciones):
+                continue
+            if ultima is not None:
+                posiciones = np.concatenate(([ultima], posiciones))
+            huecos = np.diff(posiciones) - 1
+            frec_obs += np.bincount(np.minimum(huecos, max_hueco), minlength=max_hueco + 1)
+            ultima = posiciones[-1]
+        total = frec_obs.sum()
+        if not total:
+            raise ValueError("No hay huecos: muy pocos números dentro de [alfa, beta)")
+        probabilidades = p * (1 - p) ** np.arange(max_hueco + 1)
+        probabilidades[-1] = (1 - p) ** max_hueco
+        frec_esp = total * probabilidades
+        chi2_calculado, chi2_critico, grados_libertad, pasa_prueba = StatisticalTests._chi2_desde(frec_obs, frec_esp, confianza)
+        return frec_obs, frec_esp, chi2_calculado, chi2_critico, grados_libertad, pasa_prueba
+
+    @staticmethod
+    @Profiler.medido('pruebas.series_test')
+    def series_test(numeros, intervalos=5, confianza=0.95):
+        """Chi-cuadrada de pares no solapados (r1, r2), (r3, r4)... en una cuadrícula intervalos x intervalos"""
+        numeros = np.asarray(numeros)
+        pares = len(numeros) // 2
+        if not pares:
+            raise ValueError("La prueba de series necesita al menos 2 números")
+        frec_obs = np.zeros(intervalos * intervalos, dtype=np.int64)
+        for inicio in range(0, 2 * pares, 2 * StatisticalTests.BLOQUE):
+            bloque = numeros[inicio:min(inicio + 2 * StatisticalTests.BLOQUE, 2 * pares)]
+            celdas = np.clip((bloque * intervalos).astype(np.int64), 0, intervalos - 1)
+            frec_obs += np.bincount(celdas[0::2] * intervalos + celdas[1::2], minlength=frec_obs.size)
+        frec_esp = pares / frec_obs.size
+        chi2_calculado, chi2_critico, grados_libertad, pasa_prueba = StatisticalTests._chi2_desde(frec_obs, frec_esp, confianza)
+        return frec_obs.reshape(intervalos, intervalos), frec_esp, chi2_calculado, chi2_critico, grados_libertad, pasa_prueba
+
+    @staticmethod
+    @Profiler.medido('pruebas.kolmogorov_smirnov_test')
+    def kolmogorov_smirnov_test(numeros, confianza=0.95):
+        """Kolmogorov-Smirnov contra la uniforme(0, 1); el valor crítico usa la corrección de Stephens"""
+        ordenados = np.sort(np.asarray(numeros, dtype=np.float64))
+        n = len(ordenados)
+        if not n:
+            raise ValueError("La prueba de Kolmogorov-Smirnov necesita al menos 1 número")
+        d = 0.0
+        for inicio in range(0, n, StatisticalTests.BLOQUE):
+            bloque = ordenados[inicio:inicio + StatisticalTests.BLOQUE]
+            i = np.arange(inicio + 1, inicio + len(bloque) + 1, dtype=np.float64)
+            d = max(d, (i / n - bloque).max(), (bloque - (i - 1) / n).max())
+        alpha = 1 - confianza
+        d_critico = np.sqrt(-0.5 * np.log(alpha / 2)) / (np.sqrt(n) + 0.12 + 0.11 / np.sqrt(n))
+        return d, d_critico, d <= d_critico
+
+# ==================== PRUEBAS EN UNA SOLA PASADA ====================
+class StatisticalAccumulator:
+    """Acumula números por bloques y resuelve las tres pruebas en una sola pasada.
+
+    Mantiene media y suma de cuadrados centrada (Welford, combinando bloques con la
+    fórmula de Chan) y las frecuencias por intervalo, así que nunca necesita la
+    secuencia completa en memoria. Los resultados coinciden con los de
+    StatisticalTests salvo el redondeo del último decimal.
+    """
+
+    def __init__(self, intervalos=10):
+        self.intervalos = intervalos
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.frec_obs = np.zeros(intervalos, dtype=np.int64)
+        self.bins = np.linspace(0, 1, intervalos + 1)
+
+    @property
+    def varianza(self):
+        return self.m2 / self.n if self.n else float('nan')
+
+    @Profiler.medido('pruebas.acumulador')
+    def agregar(self, bloque):
+        bloque = np.asarray(bloque, dtype=np.float64)
+        nb = bloque.size
+        if not nb:
+            return self
+        media_b = bloque.mean()
+        m2_b = np.square(bloque - media_b).sum()
+        total = self.n + nb
+        delta = media_b - self.media
+        self.media += delta * nb / total
+        self.m2 += m2_b + delta * delta * self.n * nb / total
+        self.n = total
+        self.frec_obs += np.histogram(bloque, bins=self.intervalos, range=(0, 1))[0]
+        Profiler.contar('pruebas.numeros_acumulados', nb)
+        return self
+
+    def agregar_flujo(self, bloques):
+        """Consume un iterable de bloques (por ejemplo un GenerationStream con tam_bloque)"""
+        for bloque in bloques:
+            self.agregar(bloque)
+        return self
+
+    @classmethod
+    def desde_archivo(cls, ruta, intervalos=10, tam_bloque=1 << 20):
+        """Acumula un archivo .npy, binario compacto o float64 crudo mapeado en memoria, por bloques"""
+        from .exportacion import StreamExport
+        return cls(intervalos).agregar_flujo(StreamExport.bloques_archivo(ruta, tam_bloque))
+
+    def media_test(self, confianza=0.95):
+        return StatisticalTests._media_desde(self.media, self.n, confianza)
+
+    def varianza_test(self, confianza=0.95):
+        return StatisticalTests._varianza_desde(self.varianza, self.n, confianza)
+
+    def uniformidad_test(self, confianza=0.95):
+        return StatisticalTests._uniformidad_desde(self.frec_obs, self.bins, self.n, confianza)
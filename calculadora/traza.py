@@ -0,0 +1,138 @@
+"""Historial de generación en columnas"""
+import numpy as np
+
+from .digitos import MAX_INT64
+
+# Mayor ancho para el que conviene contar cada valor posible (10^6 contadores)
+MAX_DIGITOS_CONTEOS = 6
+
+# ==================== TRAZA DE GENERACIÓN EN COLUMNAS ====================
+class GenerationTrace:
+    """Historial de generación en columnas.
+
+    Solo guarda las semillas, la constante y los yi* en un arreglo int64; el resto
+    de columnas (yi, productos, ri...) se reconstruye bajo demanda. Se indexa e itera
+    como la antigua lista de diccionarios. ri = yi* / 10^digitos.
+    """
+    __slots__ = ('metodo', 'semillas', 'constante', 'estrellas', 'ciclo', 'digitos', '_conteos')
+
+    COLUMNAS = {
+        'cuadrados_medios': ('iteracion', 'yi', 'yi_cuadrado', 'yi_estrella', 'ri'),
+        'productos_medios': ('iteracion', 'yi0', 'yi1', 'producto', 'yi_estrella', 'ri'),
+        'multiplicador_constante': ('iteracion', 'yi', 'constante', 'producto', 'yi_estrella', 'ri'),
+    }
+
+    def __init__(self, metodo, semillas, estrellas, constante=None, ciclo=None, digitos=4):
+        self.metodo = metodo
+        self.semillas = tuple(semillas)
+        self.constante = constante
+        self.estrellas = estrellas
+        self.ciclo = ciclo
+        self.digitos = digitos
+        self._conteos = None
+
+    def __len__(self):
+        return len(self.estrellas)
+
+    def __iter__(self):
+        for i in range(len(self.estrellas)):
+            yield self._fila(i)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._fila(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Iteración fuera del historial")
+        return self._fila(indice)
+
+    @property
+    def columnas(self):
+        return self.COLUMNAS[self.metodo]
+
+    @property
+    def escala(self):
+        return 10 ** self.digitos
+
+    @property
+    def ri(self):
+        return self.estrellas / float(self.escala)
+
+    @property
+    def conteos(self):
+        """Cuántas veces aparece cada yi* (0 a escala-1); se calcula una vez y sirve para cualquier agrupación.
+
+        Solo hasta MAX_DIGITOS_CONTEOS dígitos: con más, los contadores ocuparían más que la traza.
+        """
+        if self.digitos > MAX_DIGITOS_CONTEOS:
+            raise ValueError(f"Los conteos por valor solo se calculan hasta {MAX_DIGITOS_CONTEOS} dígitos")
+        if self._conteos is None:
+            self._conteos = np.bincount(self.estrellas, minlength=self.escala)
+        return self._conteos
+
+    def _estado(self, j):
+        """j-ésimo valor de la sucesión semillas + yi*"""
+        k = len(self.semillas)
+        return self.semillas[j] if j < k else int(self.estrellas[j - k])
+
+    def _fila(self, i):
+        estrella = int(self.estrellas[i])
+        ri = estrella / float(self.escala)
+        if self.metodo == 'productos_medios':
+            yi0, yi1 = self._estado(i), self._estado(i + 1)
+            return {'iteracion': i + 1, 'yi0': yi0, 'yi1': yi1, 'producto': yi0 * yi1,
+                    'yi_estrella': estrella, 'ri': ri}
+        yi = self._estado(i)
+        if self.metodo == 'cuadrados_medios':
+            return {'iteracion': i + 1, 'yi': yi, 'yi_cuadrado': yi * yi,
+                    'yi_estrella': estrella, 'ri': ri}
+        return {'iteracion': i + 1, 'yi': yi, 'constante': self.constante, 'producto': self.constante * yi,
+                'yi_estrella': estrella, 'ri': ri}
+
+    def _estados(self, desfase):
+        """Columna yi (o yi0/yi1) como arreglo; object si alguna semilla no cabe en int64"""
+        n = len(self)
+        if max(self.semillas) > MAX_INT64:
+            previos = np.array(self.semillas, dtype=object)
+            estrellas = self.estrellas.astype(object)
+        else:
+            previos = np.array(self.semillas, dtype=np.int64)
+            estrellas = self.estrellas
+        return np.concatenate((previos, estrellas))[desfase:desfase + n]
+
+    @staticmethod
+    def _producto(a, b):
+        """Producto elemento a elemento sin desbordar int64"""
+        if a.dtype == object or b.dtype == object:
+            return a.astype(object) * b
+        if len(a) and int(a.max()) * int(b.max()) > MAX_INT64:
+            return a.astype(object) * b
+        return a * b
+
+    def _constantes(self):
+        return np.full(len(self), self.constante, dtype=object if self.constante > MAX_INT64 else np.int64)
+
+    def columna(self, nombre):
+        """Columna completa como arreglo de NumPy"""
+        if nombre not in self.columnas:
+            raise KeyError(nombre)
+        n = len(self)
+        if nombre == 'iteracion':
+            return np.arange(1, n + 1, dtype=np.int64)
+        if nombre == 'yi_estrella':
+            return self.estrellas
+        if nombre == 'ri':
+            return self.ri
+        if nombre == 'constante':
+            return self._constantes()
+        if nombre in ('yi', 'yi0'):
+            return self._estados(0)
+        if nombre == 'yi1':
+            return self._estados(1)
+        if nombre == 'yi_cuadrado':
+            yi = self._estados(0)
+            return self._producto(yi, yi)
+        if self.metodo == 'productos_medios':
+            return self._producto(self._estados(0), self._estados(1))
+        return self._producto(self._estados(0), self._constantes())
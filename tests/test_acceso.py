@@ -0,0 +1,90 @@
+"""SequenceAccess y GenerationStream.tramo frente a generar la sucesión completa"""
+import pytest
+
+from calculadora import GenerationCache, GenerationStream, NumberGeneration, SequenceAccess
+
+# ==================== CASOS ====================
+N = 3000
+SEMILLAS = range(1, 10000, 337)
+# (método, semillas, constante, dígitos)
+SUCESIONES = (
+    [('cuadrados_medios', (s,), None, 4) for s in SEMILLAS]
+    + [('productos_medios', (s, (s * 7919 + 13) % 10000), None, 4) for s in SEMILLAS]
+    + [('multiplicador_constante', (s,), 5678, 4) for s in SEMILLAS]
+    + [('cuadrados_medios', (123456,), None, 6), ('multiplicador_constante', (12345678,), 98765431, 8)]
+)
+
+
+@pytest.fixture(autouse=True)
+def sin_cache():
+    GenerationCache.limpiar()
+    yield
+    GenerationCache.limpiar()
+
+
+def _generar(metodo, semillas, constante, digitos, n=N):
+    argumentos = semillas if constante is None else semillas + (constante,)
+    return getattr(NumberGeneration, metodo)(*argumentos, n, digitos=digitos)
+
+
+def _id(caso):
+    return '-'.join(str(parte) for parte in caso if parte is not None)
+
+
+# ==================== ACCESO DIRECTO ====================
+@pytest.mark.parametrize('caso', SUCESIONES, ids=_id)
+def test_fila_como_generacion_directa(caso):
+    metodo, semillas, constante, digitos = caso
+    _, traza = _generar(*caso)
+    acceso = SequenceAccess(metodo, semillas, constante, digitos)
+    for k in range(1, len(traza) + 1):
+        assert acceso.fila(k) == traza[k - 1]
+    assert acceso.estrellas(0, N).tolist() == traza.estrellas.tolist()
+    if acceso.largo is not None:
+        assert min(acceso.largo, N) == len(traza)
+        with pytest.raises(IndexError):
+            acceso.estrella(acceso.largo + 1)
+
+
+@pytest.mark.parametrize('caso', SUCESIONES, ids=_id)
+def test_iteraciones_lejanas_repiten_el_ciclo(caso):
+    acceso = SequenceAccess(*caso[:3], digitos=caso[3])
+    if acceso.largo is not None:
+        pytest.skip("La sucesión degenera a 0")
+    cola, periodo = acceso.ciclo.cola, acceso.ciclo.periodo
+    for k in (cola + 1, cola + 7, 10 ** 12, 10 ** 18 + 3):
+        assert acceso.estrella(k) == acceso.estrella(k + periodo)
+        assert acceso.estrella(k + 5 * periodo) == acceso.estrella(k)
+    assert acceso.estrellas(10 ** 12, 50).tolist() == [acceso.estrella(10 ** 12 + i) for i in range(1, 51)]
+
+
+def test_estado_es_el_de_la_traza():
+    _, traza = _generar('productos_medios', (1234, 5678), None, 4)
+    acceso = SequenceAccess('productos_medios', (1234, 5678))
+    assert acceso.estado(0) == (1234, 5678)
+    for k in range(1, min(len(traza), 200)):
+        fila = traza[k]
+        assert acceso.estado(k) == (fila['yi0'], fila['yi1'])
+
+
+def test_iteracion_cero_invalida():
+    with pytest.raises(IndexError):
+        SequenceAccess('cuadrados_medios', (5115,)).estrella(0)
+
+
+# ==================== TRAMOS ====================
+@pytest.mark.parametrize('inicio', (0, 1, 17, 2500, 20000))
+def test_tramo_como_corte_de_la_sucesion(inicio):
+    esperados = NumberGeneration.multiplicador_constante(1234, 5678, inicio + 1000)[1].estrellas[inicio:]
+    tramo = GenerationStream.tramo('multiplicador_constante', (1234,), 5678, inicio, 1000)
+    assert tramo.estados(1000).tolist() == esperados.tolist()
+    assert tramo.generados == inicio + 1000
+
+
+def test_tramos_disjuntos_cubren_la_sucesion():
+    esperados = NumberGeneration.multiplicador_constante(4321, 5678, 5000, con_historial=False)[0].tolist()
+    obtenidos = []
+    for inicio in range(0, 5000, 1250):
+        tramo = GenerationStream.tramo('multiplicador_constante', (4321,), 5678, inicio, 1250)
+        obtenidos += tramo.bloque(1250).tolist()
+    assert obtenidos == esperados
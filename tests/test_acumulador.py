@@ -0,0 +1,86 @@
+"""StatisticalAccumulator en una sola pasada frente a NumPy y StatisticalTests sobre la secuencia completa"""
+import numpy as np
+import pytest
+
+from calculadora import GenerationCache, GenerationStream, NumberGeneration, StatisticalAccumulator, StatisticalTests
+
+# ==================== CASOS ====================
+_azar = np.random.default_rng(12345)
+UNIFORMES = _azar.random(100003)
+# Media lejos de 0 para que una suma de cuadrados sin centrar pierda precisión
+CORRIDOS = 0.999 + _azar.random(5000) * 1e-3
+TAMANOS_BLOQUE = (7, 4096, 100003)
+
+
+@pytest.fixture(autouse=True)
+def sin_cache():
+    GenerationCache.limpiar()
+    yield
+    GenerationCache.limpiar()
+
+
+def _acumular(numeros, tam_bloque, intervalos=10):
+    acumulador = StatisticalAccumulator(intervalos)
+    for inicio in range(0, len(numeros), tam_bloque):
+        acumulador.agregar(numeros[inicio:inicio + tam_bloque])
+    return acumulador
+
+
+# ==================== MOMENTOS ====================
+@pytest.mark.parametrize('tam_bloque', TAMANOS_BLOQUE)
+def test_media_y_varianza_como_numpy(tam_bloque):
+    acumulador = _acumular(UNIFORMES, tam_bloque)
+    assert acumulador.n == len(UNIFORMES)
+    assert acumulador.media == pytest.approx(np.mean(UNIFORMES), rel=1e-12)
+    assert acumulador.varianza == pytest.approx(np.var(UNIFORMES), rel=1e-12)
+
+
+def test_varianza_estable_con_media_corrida():
+    acumulador = _acumular(CORRIDOS, 3)
+    assert acumulador.media == pytest.approx(np.mean(CORRIDOS), rel=1e-12)
+    assert acumulador.varianza == pytest.approx(np.var(CORRIDOS), rel=1e-9)
+
+
+def test_bloques_vacios_no_cambian_nada():
+    acumulador = StatisticalAccumulator().agregar(np.empty(0)).agregar(UNIFORMES[:10]).agregar([])
+    assert acumulador.n == 10
+    assert acumulador.media == pytest.approx(np.mean(UNIFORMES[:10]), rel=1e-12)
+    assert np.isnan(StatisticalAccumulator().varianza)
+
+
+# ==================== PRUEBAS ====================
+@pytest.mark.parametrize('intervalos', (5, 10, 17))
+def test_frecuencias_como_histograma(intervalos):
+    acumulador = _acumular(UNIFORMES, 4096, intervalos)
+    esperadas, bins = np.histogram(UNIFORMES, bins=intervalos, range=(0, 1))
+    assert acumulador.frec_obs.tolist() == esperadas.tolist()
+    assert np.allclose(acumulador.bins, bins)
+
+
+def test_pruebas_coinciden_con_statistical_tests():
+    acumulador = _acumular(UNIFORMES, 4096)
+
+    media, li, ls, z, pasa = acumulador.media_test()
+    esperado = StatisticalTests.media_test(UNIFORMES)
+    assert media == pytest.approx(esperado[0], rel=1e-12)
+    assert (li, ls, z, pasa) == esperado[1:]
+
+    varianza, li, ls, chi2_inf, chi2_sup, pasa = acumulador.varianza_test()
+    esperado = StatisticalTests.varianza_test(UNIFORMES)
+    assert varianza == pytest.approx(esperado[0], rel=1e-12)
+    assert (li, ls, chi2_inf, chi2_sup, pasa) == esperado[1:]
+
+    frec_obs, frec_esp, chi2, critico, gl, _, pasa = acumulador.uniformidad_test()
+    esperado = StatisticalTests.uniformidad_test(UNIFORMES)
+    assert frec_obs.tolist() == esperado[0].tolist()
+    assert chi2 == pytest.approx(esperado[2], rel=1e-12)
+    assert (frec_esp, critico, gl, pasa) == (esperado[1], esperado[3], esperado[4], esperado[6])
+
+
+def test_flujo_por_bloques_como_generacion_completa():
+    numeros, _ = NumberGeneration.multiplicador_constante(1234, 5678, 20000, con_historial=False)
+    flujo = GenerationStream('multiplicador_constante', (1234,), 5678, n=20000, tam_bloque=1000)
+    acumulador = StatisticalAccumulator().agregar_flujo(flujo)
+    assert acumulador.n == len(numeros)
+    assert acumulador.media == pytest.approx(np.mean(numeros), rel=1e-12)
+    assert acumulador.varianza == pytest.approx(np.var(numeros), rel=1e-12)
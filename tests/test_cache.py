@@ -0,0 +1,107 @@
+"""GenerationCache: reutilización de prefijos, continuación y descarte LRU"""
+import pytest
+
+from calculadora import GenerationCache, NumberGeneration
+
+# ==================== CASOS ====================
+SEMILLA, CONSTANTE = 1234, 5678
+
+
+@pytest.fixture(autouse=True)
+def sin_cache():
+    GenerationCache.limpiar()
+    yield
+    GenerationCache.limpiar()
+
+
+@pytest.fixture
+def generados(monkeypatch):
+    """Lista de cuántos yi* se pidieron al bucle de generación en cada llamada"""
+    pedidos = []
+    original = NumberGeneration._estados
+
+    def contar(metodo, semillas, constante, n, digitos=4):
+        pedidos.append(n)
+        return original(metodo, semillas, constante, n, digitos)
+
+    monkeypatch.setattr(NumberGeneration, '_estados', staticmethod(contar))
+    return pedidos
+
+
+def _sin_cache(n, digitos=4):
+    activo, GenerationCache.activo = GenerationCache.activo, False
+    try:
+        return NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, n, con_historial=False, digitos=digitos)[0]
+    finally:
+        GenerationCache.activo = activo
+
+
+# ==================== REUTILIZACIÓN ====================
+def test_prefijo_sin_generar(generados):
+    completos = NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 500, con_historial=False)[0]
+    assert generados == [500]
+    prefijo = NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 200, con_historial=False)[0]
+    assert generados == [500]
+    assert prefijo.tolist() == completos[:200].tolist()
+
+
+def test_continua_solo_lo_que_falta(generados):
+    NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 300)
+    numeros, traza = NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 800)
+    assert generados == [300, 500]
+    assert numeros == _sin_cache(800).tolist()
+    assert list(traza) == list(NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 800)[1])
+    assert len(GenerationCache.buscar('multiplicador_constante', (SEMILLA,), CONSTANTE)) == 800
+
+
+def test_claves_separan_parametros(generados):
+    NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 100)
+    NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE + 1, 100)
+    NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 100, digitos=6)
+    NumberGeneration.cuadrados_medios(SEMILLA, 100)
+    assert generados == [100, 100, 100, 100]
+    assert GenerationCache.ocupado()[0] == 4
+    assert NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 100, con_historial=False, digitos=6)[0].tolist() \
+        == _sin_cache(100, digitos=6).tolist()
+
+
+def test_sucesion_degenerada_no_regenera(generados):
+    # 0 degenera en el primer paso: pedir más no debe volver a generar
+    NumberGeneration.cuadrados_medios(0, 10)
+    NumberGeneration.cuadrados_medios(0, 1000)
+    assert generados == [10]
+
+
+def test_corridas_de_solo_lectura():
+    NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 100)
+    estrellas = GenerationCache.buscar('multiplicador_constante', (SEMILLA,), CONSTANTE)
+    with pytest.raises(ValueError):
+        estrellas[0] = 1
+
+
+# ==================== PRESUPUESTO Y DESACTIVACIÓN ====================
+def test_descarta_la_menos_usada(monkeypatch):
+    monkeypatch.setattr(GenerationCache, 'PRESUPUESTO', 3 * 100 * 8)
+    for semilla in (1111, 2222, 3333):
+        NumberGeneration.multiplicador_constante(semilla, CONSTANTE, 100)
+    # Usar la primera la deja como la más reciente; la cuarta desplaza a la segunda
+    GenerationCache.buscar('multiplicador_constante', (1111,), CONSTANTE)
+    NumberGeneration.multiplicador_constante(4444, CONSTANTE, 100)
+    assert GenerationCache.ocupado() == (3, 3 * 100 * 8)
+    assert len(GenerationCache.buscar('multiplicador_constante', (1111,), CONSTANTE)) == 100
+    assert not len(GenerationCache.buscar('multiplicador_constante', (2222,), CONSTANTE))
+
+
+def test_desactivada_no_guarda(monkeypatch, generados):
+    monkeypatch.setattr(GenerationCache, 'activo', False)
+    NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 100)
+    NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 100)
+    assert generados == [100, 100]
+    assert GenerationCache.ocupado() == (0, 0)
+
+
+def test_limpiar():
+    NumberGeneration.multiplicador_constante(SEMILLA, CONSTANTE, 100)
+    GenerationCache.limpiar()
+    assert GenerationCache.ocupado() == (0, 0)
+    assert not len(GenerationCache.buscar('multiplicador_constante', (SEMILLA,), CONSTANTE))
@@ -0,0 +1,176 @@
+"""Generadores congruenciales frente a la recurrencia paso a paso, saltos y periodos"""
+import numpy as np
+import pytest
+
+from calculadora import CongruentialGeneration, CongruentialStream, NumberGeneration
+from calculadora.congruencial import LECUYER
+
+# ==================== IMPLEMENTACIÓN DE REFERENCIA ====================
+# Recurrencias escalares con enteros de Python, un paso por número
+
+
+def _lineal_ref(semilla, a, c, m, n):
+    valores, x = [], semilla
+    for _ in range(n):
+        x = (a * x + c) % m
+        valores.append(x)
+    return valores
+
+
+def _combinado_ref(semilla1, semilla2, n):
+    (a1, m1), (a2, m2) = LECUYER
+    valores, x1, x2 = [], semilla1, semilla2
+    for _ in range(n):
+        x1, x2 = a1 * x1 % m1, a2 * x2 % m2
+        z = (x1 - x2) % (m1 - 1)
+        valores.append(z or m1 - 1)
+    return valores
+
+
+# ==================== CASOS ====================
+N = CongruentialGeneration.BLOQUE + 37
+LINEALES = (
+    (12345, 1103515245, 12345, 2 ** 31),
+    (7, 5, 3, 16),
+    (0, 1664525, 1013904223, 2 ** 32),
+    # Módulo mayor que MAX_MODULO_VEC: camino con enteros de Python
+    (42, 6364136223846793005, 1442695040888963407, 2 ** 63),
+)
+MULTIPLICATIVOS = ((1, 16807, 2 ** 31 - 1), (123, 48271, 2 ** 31 - 1), (99, 7, 101))
+SALTOS = (0, 1, 2, 63, 64, 1000, 65537)
+
+
+# ==================== GENERACIÓN ====================
+@pytest.mark.parametrize('semilla, a, c, m', LINEALES)
+def test_lineal_como_referencia(semilla, a, c, m):
+    numeros, traza = NumberGeneration.congruencial_lineal(semilla, a, c, m, N)
+    esperados = _lineal_ref(semilla, a, c, m, N)
+    assert traza.estrellas.tolist() == esperados
+    assert numeros == [x / float(m) for x in esperados]
+
+
+@pytest.mark.parametrize('semilla, a, m', MULTIPLICATIVOS)
+def test_multiplicativo_como_referencia(semilla, a, m):
+    numeros, _ = NumberGeneration.congruencial_multiplicativo(semilla, a, m, N, con_historial=False)
+    assert numeros.tolist() == [x / float(m) for x in _lineal_ref(semilla, a, 0, m, N)]
+
+
+def test_minimo_estandar_de_park_y_miller():
+    # Valor de control publicado: x_10000 = 1043618065 partiendo de 1
+    _, traza = NumberGeneration.congruencial_multiplicativo(1, 16807, 2 ** 31 - 1, 10000)
+    assert int(traza.estrellas[-1]) == 1043618065
+
+
+@pytest.mark.parametrize('semillas', ((12345, 67890), (1, 1), (2147483562, 2147483398)))
+def test_combinado_como_referencia(semillas):
+    numeros, traza = NumberGeneration.congruencial_combinado(*semillas, N)
+    esperados = _combinado_ref(*semillas, N)
+    assert traza.estrellas.tolist() == esperados
+    assert numeros == [z / float(LECUYER[0][1]) for z in esperados]
+
+
+def test_traza_lineal_a_mano():
+    _, traza = NumberGeneration.congruencial_lineal(7, 5, 3, 16, 3)
+    assert list(traza) == [
+        {'iteracion': 1, 'xi': 7, 'afin': 38, 'xi_siguiente': 6, 'ri': 0.375},
+        {'iteracion': 2, 'xi': 6, 'afin': 33, 'xi_siguiente': 1, 'ri': 0.0625},
+        {'iteracion': 3, 'xi': 1, 'afin': 8, 'xi_siguiente': 8, 'ri': 0.5},
+    ]
+
+
+@pytest.mark.parametrize('metodo, semillas, parametros', [
+    ('congruencial_lineal', (12345,), (1103515245, 12345, 2 ** 31)),
+    ('congruencial_lineal', (42,), (6364136223846793005, 1442695040888963407, 2 ** 63)),
+    ('congruencial_multiplicativo', (1,), (16807, 2 ** 31 - 1)),
+    ('congruencial_combinado', (12345, 67890), LECUYER),
+])
+def test_columnas_como_filas(metodo, semillas, parametros):
+    flujo = CongruentialStream(metodo, semillas, parametros, n=500)
+    traza = flujo.traza(semillas, flujo.estados(500))
+    filas = list(traza)
+    for nombre in traza.columnas:
+        assert [int(v) if nombre != 'ri' else v for v in traza.columna(nombre).tolist()] == [f[nombre] for f in filas]
+
+
+# ==================== SALTOS Y TRAMOS ====================
+@pytest.mark.parametrize('k', SALTOS)
+@pytest.mark.parametrize('semilla, a, c, m', LINEALES)
+def test_saltar_como_k_pasos(semilla, a, c, m, k):
+    esperado = _lineal_ref(semilla, a, c, m, k)[-1] if k else semilla
+    assert CongruentialGeneration.saltar('congruencial_lineal', (semilla,), (a, c, m), k) == (esperado,)
+
+
+def test_saltar_muy_lejos():
+    a, m = 16807, 2 ** 31 - 1
+    for k in (10 ** 12, 10 ** 18 + 7):
+        assert CongruentialGeneration.saltar('congruencial_multiplicativo', (1,), (a, m), k) == (pow(a, k, m),)
+
+
+@pytest.mark.parametrize('inicio', (0, 1, 4095, 4096, 70000))
+def test_tramo_como_corte(inicio):
+    esperados = _combinado_ref(12345, 67890, inicio + 300)[inicio:]
+    tramo = CongruentialStream.tramo('congruencial_combinado', (12345, 67890), None, inicio, 300)
+    assert tramo.estados(1000).tolist() == esperados
+    assert tramo.generados == inicio + 300 and tramo.terminado
+
+
+def test_fila_saltando():
+    _, traza = NumberGeneration.congruencial_lineal(12345, 1103515245, 12345, 2 ** 31, 2000)
+    for k in (1, 2, 999, 2000):
+        assert CongruentialGeneration.fila('congruencial_lineal', (12345,), (1103515245, 12345, 2 ** 31), k) \
+            == traza[k - 1]
+
+
+def test_flujo_reanudado_y_por_valores():
+    esperados = _combinado_ref(12345, 67890, 10000)
+    flujo = CongruentialStream('congruencial_combinado', (12345, 67890), n=10000, tam_bloque=3000)
+    primero = next(flujo)
+    reanudado = CongruentialStream.reanudar(flujo.estado, tam_bloque=3000)
+    numeros = np.concatenate([primero] + list(reanudado))
+    assert numeros.tolist() == [z / float(LECUYER[0][1]) for z in esperados]
+    uno_a_uno = CongruentialStream('congruencial_combinado', (12345, 67890), n=10000)
+    assert list(uno_a_uno) == numeros.tolist()
+
+
+# ==================== PERIODOS ====================
+@pytest.mark.parametrize('metodo, parametros, periodo', [
+    ('congruencial_lineal', (1103515245, 12345, 2 ** 31), 2 ** 31),
+    ('congruencial_lineal', (5, 3, 16), 16),
+    ('congruencial_multiplicativo', (16807, 2 ** 31 - 1), 2 ** 31 - 2),
+    ('congruencial_multiplicativo', (7, 101), 100),
+    ('congruencial_combinado', LECUYER, (LECUYER[0][1] - 1) * (LECUYER[1][1] - 1) // 2),
+])
+def test_periodos(metodo, parametros, periodo):
+    assert CongruentialGeneration.ciclo(metodo, parametros).periodo == periodo
+
+
+@pytest.mark.parametrize('a, c, m', [(5, 3, 16), (21, 5, 64), (4, 3, 16), (3, 0, 31), (5, 0, 31), (6, 2, 35)])
+def test_periodo_como_fuerza_bruta(a, c, m):
+    ciclo = CongruentialGeneration.ciclo('congruencial_lineal', (a, c, m))
+    semillas = range(m) if c else range(1, m)
+    periodos = set()
+    for semilla in semillas:
+        valores = _lineal_ref(semilla, a, c, m, 2 * m)
+        periodos.add(next(p for p in range(1, m + 1) if valores[m] == valores[m - p]))
+    if ciclo is None:
+        # Sin periodo asegurado alguna semilla no recorre los m valores
+        assert periodos != {m}
+    else:
+        assert periodos == {ciclo.periodo}
+
+
+# ==================== VALIDACIÓN ====================
+@pytest.mark.parametrize('generar', [
+    lambda: NumberGeneration.congruencial_lineal(16, 5, 3, 16, 10),
+    lambda: NumberGeneration.congruencial_lineal(1, 0, 3, 16, 10),
+    lambda: NumberGeneration.congruencial_lineal(1, 5, 16, 16, 10),
+    lambda: NumberGeneration.congruencial_lineal(1, 5, 3, 1, 10),
+    lambda: NumberGeneration.congruencial_lineal(1, 5, 3, 2 ** 63 + 1, 10),
+    lambda: NumberGeneration.congruencial_multiplicativo(0, 16807, 2 ** 31 - 1, 10),
+    lambda: NumberGeneration.congruencial_combinado(0, 1, 10),
+    lambda: CongruentialStream('congruencial_lineal', (1, 2), (5, 3, 16)),
+    lambda: CongruentialStream('cuadrados_medios', (1,), (5, 3, 16)),
+])
+def test_parametros_invalidos(generar):
+    with pytest.raises(ValueError):
+        generar()
@@ -0,0 +1,85 @@
+"""Percentiles de CriticalValues frente a valores de tabla e identidades exactas"""
+import math
+
+import pytest
+
+from calculadora import CriticalValues, StatisticalTests
+
+# ==================== VALORES DE TABLA ====================
+NORMAL = [
+    (0.5, 0.0),
+    (0.9, 1.2815515655446004),
+    (0.95, 1.6448536269514722),
+    (0.975, 1.959963984540054),
+    (0.99, 2.3263478740408408),
+    (0.995, 2.5758293035489004),
+    (0.01, -2.3263478740408408),
+    (1e-10, -6.361340902404056),
+]
+
+CHI2 = [
+    (0.95, 1, 3.841458820694124),
+    (0.95, 4, 9.487729036781154),
+    (0.95, 9, 16.918977604620448),
+    (0.05, 10, 3.940299136119769),
+    (0.025, 49, 31.554916),
+    (0.975, 49, 70.222414),
+    (0.99, 100, 135.806723),
+    (0.005, 100, 67.327563),
+    (0.95, 1000, 1074.679449),
+    (0.05, 99999, 99264.541556),
+]
+
+
+# ==================== NORMAL ====================
+@pytest.mark.parametrize('p, esperado', NORMAL)
+def test_norm_ppf_tabla(p, esperado):
+    assert CriticalValues.norm_ppf(p) == pytest.approx(esperado, rel=1e-12, abs=1e-12)
+
+
+def test_norm_ppf_simetrica():
+    for p in (1e-8, 0.001, 0.02, 0.0243, 0.3, 0.49):
+        assert CriticalValues.norm_ppf(p) == pytest.approx(-CriticalValues.norm_ppf(1 - p), rel=1e-9)
+
+
+# ==================== CHI-CUADRADO ====================
+@pytest.mark.parametrize('p, df, esperado', CHI2)
+def test_chi2_ppf_tabla(p, df, esperado):
+    assert CriticalValues.chi2_ppf(p, df) == pytest.approx(esperado, rel=1e-7)
+
+
+def test_chi2_ppf_dos_grados_forma_cerrada():
+    # Con 2 grados de libertad la CDF es 1 - e^(-x/2)
+    for p in (0.001, 0.05, 0.3, 0.5, 0.95, 0.999):
+        assert CriticalValues.chi2_ppf(p, 2) == pytest.approx(-2 * math.log(1 - p), rel=1e-12)
+
+
+def test_chi2_ppf_un_grado_es_normal_al_cuadrado():
+    for p in (0.05, 0.5, 0.9, 0.95, 0.99):
+        assert CriticalValues.chi2_ppf(p, 1) == pytest.approx(CriticalValues.norm_ppf((1 + p) / 2) ** 2, rel=1e-10)
+
+
+def test_tabla_y_calculo_coinciden():
+    # Dentro de la tabla y fuera de ella (probabilidad o grados no tabulados) da lo mismo
+    for p in CriticalValues.PROBABILIDADES_TABLA:
+        for df in (1, 2, 17, CriticalValues.MAX_GL_TABLA):
+            assert CriticalValues.chi2_ppf(p, df) == pytest.approx(CriticalValues._chi2_calculado(p, df), rel=1e-13)
+    assert CriticalValues.chi2_ppf(0.95, CriticalValues.MAX_GL_TABLA + 1) > CriticalValues.chi2_ppf(0.95, 100)
+
+
+def test_statistical_tests_delega():
+    assert StatisticalTests.norm_ppf(0.975) == CriticalValues.norm_ppf(0.975)
+    assert StatisticalTests.chi2_ppf(0.95, 9) == CriticalValues.chi2_ppf(0.95, 9)
+
+
+# ==================== VALIDACIÓN ====================
+@pytest.mark.parametrize('calcular', [
+    lambda: CriticalValues.norm_ppf(0),
+    lambda: CriticalValues.norm_ppf(1),
+    lambda: CriticalValues.chi2_ppf(0, 5),
+    lambda: CriticalValues.chi2_ppf(1.5, 5),
+    lambda: CriticalValues.chi2_ppf(0.95, 0),
+])
+def test_argumentos_invalidos(calcular):
+    with pytest.raises(ValueError):
+        calcular()
@@ -0,0 +1,163 @@
+"""Paridad de la extracción aritmética con el recorte de cadenas original"""
+import random
+
+import pytest
+
+from calculadora import GenerationCache, NumberGeneration
+from calculadora.digitos import DigitExtraction
+
+# ==================== IMPLEMENTACIÓN ORIGINAL (CONGELADA) ====================
+# Copia del recorte de cadenas anterior a DigitExtraction; no modificar
+
+
+def _medio_par_str(v):
+    str_v = str(v)
+    if len(str_v) % 2 != 0:
+        str_v = '0' + str_v
+    medio = len(str_v) // 2
+    inicio = max(medio - 2, 0)
+    fin = min(medio + 2, len(str_v))
+    return int(str_v[inicio:fin])
+
+
+def _medio_centrado_str(v):
+    str_v = str(v)
+    if len(str_v) < 4:
+        str_v = str_v.zfill(4)
+    inicio = max((len(str_v) - 4) // 2, 0)
+    fin = min(inicio + 4, len(str_v))
+    medio_str = str_v[inicio:fin]
+    return int(medio_str) if medio_str else 0
+
+
+def _cuadrados_medios_str(semilla, n):
+    historial = []
+    x = semilla
+    for i in range(n):
+        cuadrado = x * x
+        nuevo_num = _medio_par_str(cuadrado)
+        historial.append({'iteracion': i + 1, 'yi': x, 'yi_cuadrado': cuadrado,
+                          'yi_estrella': nuevo_num, 'ri': nuevo_num / 10000.0})
+        x = nuevo_num
+        if x == 0:
+            break
+    return historial
+
+
+def _productos_medios_str(semilla1, semilla2, n):
+    historial = []
+    x0, x1 = semilla1, semilla2
+    for i in range(n):
+        producto = x0 * x1
+        nuevo_num = _medio_centrado_str(producto)
+        historial.append({'iteracion': i + 1, 'yi0': x0, 'yi1': x1, 'producto': producto,
+                          'yi_estrella': nuevo_num, 'ri': nuevo_num / 10000.0})
+        x0, x1 = x1, nuevo_num
+        if x1 == 0:
+            break
+    return historial
+
+
+def _multiplicador_constante_str(semilla, constante, n):
+    historial = []
+    x = semilla
+    for i in range(n):
+        producto = constante * x
+        nuevo_num = _medio_par_str(producto)
+        historial.append({'iteracion': i + 1, 'yi': x, 'constante': constante, 'producto': producto,
+                          'yi_estrella': nuevo_num, 'ri': nuevo_num / 10000.0})
+        x = nuevo_num
+        if x == 0:
+            break
+    return historial
+
+
+# ==================== CASOS ====================
+N = 40
+SEMILLAS = range(10000)
+_azar = random.Random(12345)
+GRANDES = [_azar.randrange(10 ** (d - 1), 10 ** d) for d in range(5, 40) for _ in range(8)] + [10 ** 38, 10 ** 39 - 1]
+CONSTANTES = (0, 7, 1234, 4091, 5678, 99991)
+
+
+@pytest.fixture(autouse=True)
+def sin_cache():
+    GenerationCache.limpiar()
+    yield
+    GenerationCache.limpiar()
+
+
+def _comparar(obtenido, esperado):
+    numeros, traza = obtenido
+    assert numeros == [fila['ri'] for fila in esperado]
+    assert list(traza) == esperado
+
+
+# ==================== EXTRACCIÓN ====================
+def test_medio_par_todos_los_productos_de_4_digitos():
+    for x in SEMILLAS:
+        for v in (x * x, 4091 * x, x):
+            assert DigitExtraction.medio_par(v) == _medio_par_str(v)
+
+
+def test_medio_centrado_todos_los_productos_de_4_digitos():
+    for x in SEMILLAS:
+        for v in (x * x, x * (9999 - x), x):
+            assert DigitExtraction.medio_centrado(v) == _medio_centrado_str(v)
+
+
+def test_extraccion_enteros_grandes():
+    for v in GRANDES:
+        for w in (v, v * v, v * 4091):
+            assert DigitExtraction.medio_par(w) == _medio_par_str(w)
+            assert DigitExtraction.medio_centrado(w) == _medio_centrado_str(w)
+
+
+# ==================== GENERADORES ====================
+def test_cuadrados_medios_todas_las_semillas():
+    for semilla in SEMILLAS:
+        _comparar(NumberGeneration.cuadrados_medios(semilla, N), _cuadrados_medios_str(semilla, N))
+
+
+def test_productos_medios_todas_las_semillas():
+    for semilla in SEMILLAS:
+        semilla2 = (semilla * 7919 + 13) % 10000
+        _comparar(NumberGeneration.productos_medios(semilla, semilla2, N), _productos_medios_str(semilla, semilla2, N))
+
+
+def test_multiplicador_constante_todas_las_semillas():
+    for constante in CONSTANTES:
+        for semilla in SEMILLAS:
+            _comparar(NumberGeneration.multiplicador_constante(semilla, constante, N),
+                      _multiplicador_constante_str(semilla, constante, N))
+
+
+def test_semillas_grandes():
+    for semilla in GRANDES:
+        _comparar(NumberGeneration.cuadrados_medios(semilla, N), _cuadrados_medios_str(semilla, N))
+        _comparar(NumberGeneration.productos_medios(semilla, semilla // 7 + 1, N),
+                  _productos_medios_str(semilla, semilla // 7 + 1, N))
+        _comparar(NumberGeneration.multiplicador_constante(semilla, 4091, N),
+                  _multiplicador_constante_str(semilla, 4091, N))
+        _comparar(NumberGeneration.multiplicador_constante(1234, semilla, N),
+                  _multiplicador_constante_str(1234, semilla, N))
+
+
+def test_sin_historial_coincide():
+    for semilla in range(0, 10000, 97):
+        numeros, traza = NumberGeneration.cuadrados_medios(semilla, N, con_historial=False)
+        assert traza is None
+        assert numeros.tolist() == [fila['ri'] for fila in _cuadrados_medios_str(semilla, N)]
+
+
+# ==================== VALIDACIÓN ====================
+@pytest.mark.parametrize('generar', [
+    lambda: NumberGeneration.cuadrados_medios(-1, 10),
+    lambda: NumberGeneration.productos_medios(-5, 1234, 10),
+    lambda: NumberGeneration.productos_medios(1234, -5, 10),
+    lambda: NumberGeneration.multiplicador_constante(-1, 4091, 10),
+    lambda: NumberGeneration.multiplicador_constante(1234, -4091, 10),
+])
+def test_negativos_rechazados(generar):
+    with pytest.raises(ValueError):
+        generar()
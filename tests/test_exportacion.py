@@ -0,0 +1,137 @@
+"""Ida y vuelta de los exportadores por bloques y lectura de archivos de números"""
+import csv
+
+import numpy as np
+import pytest
+
+from calculadora import (CongruentialStream, GenerationCache, GenerationStream, NumberGeneration, StatisticalAccumulator,
+                         StreamExport)
+
+# ==================== CASOS ====================
+N = 10007
+TAM_BLOQUE = 1000
+
+
+@pytest.fixture(autouse=True)
+def sin_cache():
+    GenerationCache.limpiar()
+    yield
+    GenerationCache.limpiar()
+
+
+def _flujo(digitos=4):
+    constante = 5678 if digitos == 4 else 98765431
+    semilla = 1234 if digitos == 4 else 12345678
+    return GenerationStream('multiplicador_constante', (semilla,), constante, n=N, digitos=digitos)
+
+
+def _esperado(digitos=4):
+    flujo = _flujo(digitos)
+    return NumberGeneration.multiplicador_constante(flujo.semillas[0], flujo.constante, N, digitos=digitos)
+
+
+# ==================== EXPORTACIÓN ====================
+def test_csv_ida_y_vuelta(tmp_path):
+    numeros, traza = _esperado()
+    ruta = str(tmp_path / 'numeros.csv')
+    columnas = ('iteracion', 'yi', 'yi_estrella', 'ri')
+    assert StreamExport.exportar(_flujo(), ruta, columnas=columnas, tam_bloque=TAM_BLOQUE) == len(numeros)
+    with open(ruta, encoding='utf-8', newline='') as entrada:
+        filas = list(csv.reader(entrada))
+    assert tuple(filas[0]) == columnas
+    assert [int(fila[0]) for fila in filas[1:]] == list(range(1, len(numeros) + 1))
+    assert [int(fila[1]) for fila in filas[1:]] == traza.columna('yi').tolist()
+    assert [int(fila[2]) for fila in filas[1:]] == traza.estrellas.tolist()
+    assert [float(fila[3]) for fila in filas[1:]] == list(numeros)
+
+
+@pytest.mark.parametrize('digitos', (4, 8))
+def test_npy_ida_y_vuelta(tmp_path, digitos):
+    numeros, _ = _esperado(digitos)
+    ruta = str(tmp_path / 'numeros.npy')
+    assert StreamExport.exportar(_flujo(digitos), ruta, tam_bloque=TAM_BLOQUE) == len(numeros)
+    cargados = np.load(ruta, mmap_mode='r')
+    assert cargados.dtype == np.float64
+    assert cargados.tolist() == list(numeros)
+
+
+@pytest.mark.parametrize('digitos, dtype', ((4, '<u2'), (8, '<u4')))
+def test_binario_ida_y_vuelta(tmp_path, digitos, dtype):
+    numeros, traza = _esperado(digitos)
+    ruta = str(tmp_path / 'numeros.bin')
+    assert StreamExport.exportar(_flujo(digitos), ruta, tam_bloque=TAM_BLOQUE) == len(numeros)
+    metadatos, estrellas = StreamExport.leer_binario(ruta)
+    assert metadatos['metodo'] == 'multiplicador_constante'
+    assert metadatos['digitos'] == digitos and metadatos['escala'] == 10 ** digitos
+    assert metadatos['n'] == len(numeros) and metadatos['dtype'] == dtype
+    assert estrellas.dtype == np.dtype(dtype)
+    assert estrellas.tolist() == traza.estrellas.tolist()
+
+
+def test_binario_congruencial(tmp_path):
+    ruta = str(tmp_path / 'lecuyer.bin')
+    flujo = CongruentialStream('congruencial_combinado', (12345, 67890), n=N)
+    assert StreamExport.exportar(flujo, ruta, tam_bloque=TAM_BLOQUE) == N
+    metadatos, estrellas = StreamExport.leer_binario(ruta)
+    esperados, _ = NumberGeneration.congruencial_combinado(12345, 67890, N, con_historial=False)
+    assert metadatos['metodo'] == 'congruencial_combinado' and metadatos['n'] == N
+    assert (estrellas / float(metadatos['escala'])).tolist() == esperados.tolist()
+
+
+def test_exportacion_cortada_queda_valida(tmp_path):
+    ruta = str(tmp_path / 'cortado.bin')
+    bloques = iter((True, True, False))
+    assert StreamExport.exportar(_flujo(), ruta, tam_bloque=TAM_BLOQUE, continuar=lambda: next(bloques)) == 2000
+    metadatos, estrellas = StreamExport.leer_binario(ruta)
+    assert metadatos['n'] == 2000
+    assert estrellas.tolist() == _esperado()[1].estrellas[:2000].tolist()
+
+
+def test_formato_desconocido(tmp_path):
+    with pytest.raises(ValueError):
+        StreamExport.exportar(_flujo(), str(tmp_path / 'numeros.parquet'))
+
+
+# ==================== LECTURA DE ARCHIVOS EXTERNOS ====================
+def test_float64_crudo(tmp_path):
+    valores = np.random.default_rng(7).random(N)
+    ruta = str(tmp_path / 'externo.dat')
+    valores.astype('<f8').tofile(ruta)
+    arreglo, escala = StreamExport.abrir_numeros(ruta)
+    assert escala == 1 and isinstance(arreglo, np.memmap)
+    assert arreglo.tolist() == valores.tolist()
+    assert np.concatenate(list(StreamExport.bloques_archivo(ruta, TAM_BLOQUE))).tolist() == valores.tolist()
+
+
+def test_float64_crudo_tamano_invalido(tmp_path):
+    ruta = tmp_path / 'roto.dat'
+    ruta.write_bytes(b'\x00' * 12)
+    with pytest.raises(ValueError):
+        StreamExport.abrir_numeros(str(ruta))
+
+
+def test_npy_de_otro_dtype_y_forma(tmp_path):
+    valores = np.random.default_rng(7).random((100, 7)).astype(np.float32)
+    ruta = str(tmp_path / 'externo.npy')
+    np.save(ruta, valores)
+    bloques = list(StreamExport.bloques_archivo(ruta, 64))
+    assert all(bloque.dtype == np.float64 for bloque in bloques)
+    assert np.concatenate(bloques).tolist() == valores.reshape(-1).astype(np.float64).tolist()
+
+
+def test_binario_por_bloques_divide_por_la_escala(tmp_path):
+    numeros, _ = _esperado(8)
+    ruta = str(tmp_path / 'numeros.bin')
+    StreamExport.exportar(_flujo(8), ruta)
+    assert np.concatenate(list(StreamExport.bloques_archivo(ruta, TAM_BLOQUE))).tolist() == list(numeros)
+
+
+@pytest.mark.parametrize('nombre', ('numeros.npy', 'numeros.bin'))
+def test_acumulador_desde_archivo(tmp_path, nombre):
+    numeros, _ = _esperado()
+    ruta = str(tmp_path / nombre)
+    StreamExport.exportar(_flujo(), ruta)
+    acumulador = StatisticalAccumulator.desde_archivo(ruta, tam_bloque=TAM_BLOQUE)
+    assert acumulador.n == len(numeros)
+    assert acumulador.media == pytest.approx(np.mean(numeros), rel=1e-12)
+    assert acumulador.varianza == pytest.approx(np.var(numeros), rel=1e-12)
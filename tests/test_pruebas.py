@@ -0,0 +1,168 @@
+"""Batería extendida (corridas, autocorrelación, póker, huecos, series y Kolmogorov-Smirnov) sobre entradas fijas"""
+import math
+
+import numpy as np
+import pytest
+
+from calculadora import StatisticalTests
+
+# ==================== CASOS ====================
+UNIFORMES = np.random.default_rng(2024).random(100000)
+# Rejilla perfecta: uniforme en distribución pero nada aleatoria
+REJILLA = (np.arange(10000) + 0.5) / 10000
+
+
+def _poker_desde_manos(cantidades):
+    """ri de 4 dígitos con `cantidades[i]` manos de cada clase de MANOS_POKER"""
+    ejemplos = (1234, 1123, 1122, 1112, 1111)
+    return np.repeat(np.array(ejemplos) / 10000, cantidades)
+
+
+# ==================== PÓKER ====================
+def test_probabilidades_poker_4_digitos():
+    _, probabilidades = StatisticalTests._clases_poker(4)
+    assert probabilidades.tolist() == pytest.approx(list(StatisticalTests.PROB_POKER), abs=1e-15)
+
+
+@pytest.mark.parametrize('digitos', range(2, StatisticalTests.MAX_DIGITOS_POKER + 1))
+def test_probabilidades_poker_suman_uno(digitos):
+    _, probabilidades = StatisticalTests._clases_poker(digitos)
+    assert probabilidades.sum() == pytest.approx(1, abs=1e-12)
+
+
+def test_manos_de_4_digitos():
+    assert StatisticalTests._manos(np.array([1234, 1123, 1122, 1112, 1111, 7]), 4).tolist() == [0, 1, 2, 3, 4, 3]
+
+
+def test_poker_frecuencias_exactas():
+    numeros = _poker_desde_manos([504, 432, 27, 36, 1])
+    frec_obs, frec_esp, chi2, critico, gl, pasa = StatisticalTests.poker_test(numeros)
+    # La clase póker (esperada 1) se junta con la siguiente más rara, dos pares (27)
+    assert frec_obs.tolist() == [504, 432, 36, 28]
+    assert frec_esp.tolist() == pytest.approx([504, 432, 36, 28])
+    assert chi2 == pytest.approx(0, abs=1e-9)
+    assert gl == 3 and critico == pytest.approx(7.814727903251178)
+    assert pasa
+
+
+def test_poker_rechaza_manos_sesgadas():
+    frec_obs, _, chi2, critico, _, pasa = StatisticalTests.poker_test(_poker_desde_manos([400, 500, 40, 50, 10]))
+    assert frec_obs.tolist() == [400, 500, 50, 50]
+    assert chi2 == pytest.approx(104**2 / 504 + 68**2 / 432 + 14**2 / 36 + 22**2 / 28)
+    assert chi2 > critico and not pasa
+
+
+def test_poker_trunca_numeros_externos():
+    # 0.11229 es 1123 redondeando (un par) y 1122 truncando (dos pares, junto con póker)
+    numeros = np.full(1000, 0.11229)
+    assert StatisticalTests.poker_test(numeros)[0].tolist() == [0, 1000, 0, 0]
+    assert StatisticalTests.poker_test(numeros, exactos=False)[0].tolist() == [0, 0, 0, 1000]
+    # Con ri exactos truncar da las mismas manos aunque el float quede apenas por debajo (0.1234 = 0.12339999...)
+    exactos = _poker_desde_manos([504, 432, 27, 36, 1])
+    assert StatisticalTests.poker_test(exactos, exactos=False)[0].tolist() == \
+        StatisticalTests.poker_test(exactos)[0].tolist()
+
+
+def test_digitos_poker():
+    assert StatisticalTests.digitos_poker(10000) == 4
+    assert StatisticalTests.digitos_poker(10 ** 8) == 8
+    assert StatisticalTests.digitos_poker(2147483563) == 9
+
+
+@pytest.mark.parametrize('digitos', (1, StatisticalTests.MAX_DIGITOS_POKER + 1))
+def test_poker_ancho_invalido(digitos):
+    with pytest.raises(ValueError):
+        StatisticalTests.poker_test(UNIFORMES[:100], digitos=digitos)
+
+
+# ==================== HUECOS Y SERIES ====================
+def test_huecos_a_mano():
+    # En [0, 0.5) caen las posiciones 0, 2 y 5: huecos de 1 y 2
+    frec_obs, frec_esp, _, _, gl, _ = StatisticalTests.huecos_test([0.1, 0.7, 0.2, 0.8, 0.9, 0.3])
+    assert frec_obs.tolist() == [0, 1, 1, 0, 0, 0]
+    assert frec_esp.tolist() == pytest.approx([1, 0.5, 0.25, 0.125, 0.0625, 0.0625])
+    assert gl == 5
+
+
+def test_huecos_intervalo_invalido():
+    with pytest.raises(ValueError):
+        StatisticalTests.huecos_test(UNIFORMES, alfa=0.2, beta=0.2)
+    with pytest.raises(ValueError):
+        StatisticalTests.huecos_test([0.9, 0.8])
+
+
+def test_series_a_mano():
+    frec_obs, frec_esp, _, _, gl, _ = StatisticalTests.series_test([0.1, 0.1, 0.1, 0.9, 0.9, 0.1, 0.99], intervalos=2)
+    assert frec_obs.tolist() == [[1, 1], [1, 0]]
+    assert frec_esp == pytest.approx(0.75) and gl == 3
+
+
+# ==================== CORRIDAS Y AUTOCORRELACIÓN ====================
+def test_corridas_arriba_abajo_a_mano():
+    corridas, media, varianza, _, _, _ = StatisticalTests.corridas_arriba_abajo_test([0.1, 0.2, 0.3, 0.2, 0.1, 0.5])
+    assert corridas == 3
+    assert media == pytest.approx(11 / 3) and varianza == pytest.approx(67 / 90)
+
+
+def test_corridas_media_a_mano():
+    corridas, n0, n1, media, varianza, _, _, _ = StatisticalTests.corridas_media_test([0.1, 0.6, 0.7, 0.2, 0.5])
+    assert (corridas, n0, n1) == (4, 2, 3)
+    assert media == pytest.approx(2 * 2 * 3 / 5 + 0.5)
+    assert varianza == pytest.approx(2 * 6 * (12 - 5) / (25 * 4))
+
+
+def test_autocorrelacion_como_formula_directa():
+    serie = UNIFORMES[3::4]
+    m = len(serie) - 2
+    rho, sigma, z, _, _ = StatisticalTests.autocorrelacion_test(UNIFORMES, retardo=4, inicio=3)
+    assert rho == pytest.approx(np.dot(serie[:-1], serie[1:]) / (m + 1) - 0.25, rel=1e-9)
+    assert sigma == pytest.approx(math.sqrt(13 * m + 7) / (12 * (m + 1)))
+    assert z == pytest.approx(rho / sigma)
+
+
+# ==================== KOLMOGOROV-SMIRNOV ====================
+def test_kolmogorov_smirnov_a_mano():
+    d, d_critico, pasa = StatisticalTests.kolmogorov_smirnov_test([0.5])
+    assert d == pytest.approx(0.5)
+    assert d_critico == pytest.approx(math.sqrt(-0.5 * math.log(0.025)) / 1.23)
+    assert pasa
+
+
+def test_kolmogorov_smirnov_rejilla():
+    d, _, pasa = StatisticalTests.kolmogorov_smirnov_test(REJILLA[::-1])
+    assert d == pytest.approx(0.5 / len(REJILLA)) and pasa
+
+
+# ==================== BATERÍA SOBRE ENTRADAS FIJAS ====================
+@pytest.mark.parametrize('prueba', [
+    StatisticalTests.corridas_arriba_abajo_test,
+    StatisticalTests.corridas_media_test,
+    StatisticalTests.autocorrelacion_test,
+    StatisticalTests.poker_test,
+    StatisticalTests.huecos_test,
+    StatisticalTests.series_test,
+    StatisticalTests.kolmogorov_smirnov_test,
+])
+def test_uniformes_pasan(prueba):
+    assert bool(prueba(UNIFORMES)[-1])
+
+
+@pytest.mark.parametrize('prueba', [
+    StatisticalTests.corridas_arriba_abajo_test,
+    StatisticalTests.corridas_media_test,
+    StatisticalTests.autocorrelacion_test,
+    StatisticalTests.huecos_test,
+])
+def test_rejilla_ordenada_falla(prueba):
+    assert not bool(prueba(REJILLA)[-1])
+
+
+def test_bloques_no_cambian_resultados(monkeypatch):
+    pruebas = (StatisticalTests.corridas_arriba_abajo_test, StatisticalTests.corridas_media_test,
+               StatisticalTests.poker_test, StatisticalTests.huecos_test, StatisticalTests.series_test,
+               StatisticalTests.kolmogorov_smirnov_test)
+    completos = [prueba(UNIFORMES) for prueba in pruebas]
+    monkeypatch.setattr(StatisticalTests, 'BLOQUE', 997)
+    for completo, prueba in zip(completos, pruebas):
+        for esperado, obtenido in zip(completo, prueba(UNIFORMES)):
+            assert np.allclose(obtenido, esperado)